@@ -0,0 +1,90 @@
+"""
+JSON Codec Benchmark
+
+Compares the codecs in structurify.codec on the two payloads that dominate
+client-side JSON time: a large base64 upload body (encode) and a large
+export result (decode). The "requests" row is the previous path, which
+went through requests' stdlib json= encoding and response.json().
+
+Usage:
+    python -m benchmarks.bench_codec [--upload-mb 20] [--records 50000]
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import argparse
+import base64
+import functools
+import json
+import os
+import time
+from typing import Any, Callable, List
+
+from structurify.codec import CODECS, JsonCodec
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Fastest of several runs, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def available_codecs() -> List[JsonCodec]:
+    codecs = []
+    for factory in CODECS.values():
+        try:
+            codecs.append(factory())
+        except ImportError:
+            continue
+    return codecs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--upload-mb", type=float, default=20.0)
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    upload = {
+        "projectId": "proj_bench",
+        "name": "scan.pdf",
+        "mimeType": "application/pdf",
+        "content": base64.b64encode(os.urandom(int(args.upload_mb * 1024 * 1024))).decode(),
+    }
+    export = json.dumps({
+        "data": [
+            {
+                "documentId": f"doc_{i}",
+                "documentName": f"invoice-{i}.pdf",
+                "Invoice Number": f"INV-{i:06d}",
+                "Total": i * 1.25,
+                "Date": "2026-01-31",
+                "Line Items": [{"sku": "A-1", "qty": 2, "price": 9.99}] * 3,
+            }
+            for i in range(args.records)
+        ]
+    }).encode("utf-8")
+
+    print(f"upload body: {len(json.dumps(upload)) / 1e6:.1f} MB, "
+          f"export body: {len(export) / 1e6:.1f} MB, best of {args.repeat}\n")
+    print(f"{'codec':<10} {'encode upload':>15} {'decode export':>15}")
+
+    # What requests does for json= and response.json()
+    encode = best_of(lambda: json.dumps(upload, allow_nan=False).encode("utf-8"), args.repeat)
+    decode = best_of(lambda: json.loads(export.decode("utf-8")), args.repeat)
+    print(f"{'requests':<10} {encode:>12.1f} ms {decode:>12.1f} ms")
+
+    for codec in available_codecs():
+        encode = best_of(functools.partial(codec.dumps, upload), args.repeat)
+        decode = best_of(functools.partial(codec.loads, export), args.repeat)
+        print(f"{codec.name:<10} {encode:>12.1f} ms {decode:>12.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+HTTP/2 Benchmark
+
+Compares the default HTTP/1.1 session with the HTTP/2 transport when many
+threads poll job status at once. The HTTP/1.1 client runs against the
+stand-in server, the HTTP/2 client against its h2c twin
+(benchmarks.standin_h2), both with the same latency and each in its own
+process so the server does not compete with the client for the GIL.
+Reports throughput, p50/p99 latency and the number of connections the
+server accepted.
+
+Over loopback there is no TLS handshake or network round trip to save, so
+the connection count is the number to watch; wall time mostly reflects
+client CPU per request, which is higher for the pure-Python HTTP/2 stack.
+
+Usage:
+    python -m benchmarks.bench_http2 [--calls 4000] [--threads 200] [--latency-ms 20]
+        [--max-connections 200]
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Any, Dict
+
+from benchmarks.loadtest import LatencyHistogram
+from benchmarks.standin import StandInServer
+from benchmarks.standin_h2 import StandInH2Server
+from structurify import Structurify
+from structurify.http2 import Http2Adapter
+
+
+def serve(http2: bool, latency: float, conn: Connection) -> None:
+    """Run a stand-in server until told to stop, then report its connection count."""
+    server_type = StandInH2Server if http2 else StandInServer
+    server = server_type(latency=latency).start()
+    conn.send(server.base_url)
+    conn.recv()
+    conn.send(server.connections)
+    server.stop()
+
+
+def run(
+    base_url: str,
+    http2: bool,
+    calls: int,
+    threads: int,
+    max_connections: int,
+) -> Dict[str, Any]:
+    client = Structurify(
+        api_key="sk_bench",
+        base_url=base_url,
+        max_connections=max_connections,
+        http2=http2,
+    )
+    if http2:
+        # The stand-in speaks HTTP/2 without TLS
+        client._session.mount(
+            "http://", Http2Adapter(max_connections=max_connections, cleartext=True)
+        )
+    histogram = LatencyHistogram()
+    errors = 0
+
+    def poll(_: int) -> None:
+        nonlocal errors
+        started = time.monotonic()
+        try:
+            client.extraction.get("job_bench")
+        except Exception:
+            errors += 1
+        histogram.record(time.monotonic() - started)
+
+    started, cpu = time.monotonic(), time.process_time()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(poll, range(calls)))
+    elapsed, cpu = time.monotonic() - started, time.process_time() - cpu
+    client._session.close()
+    return {
+        "elapsed": elapsed,
+        "ops": calls / elapsed,
+        "p50": histogram.percentile(50),
+        "p99": histogram.percentile(99),
+        "cpu": cpu / calls,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=4000, help="status polls per client")
+    parser.add_argument("--threads", type=int, default=200, help="concurrent callers")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="median server latency")
+    parser.add_argument("--max-connections", type=int, default=200,
+                        help="connection pool size for both clients")
+    args = parser.parse_args()
+
+    print(f"{args.calls} status polls from {args.threads} threads, "
+          f"{args.latency_ms:.0f}ms server latency\n")
+    header = (
+        f"{'transport':<10} {'wall s':>7} {'ops/s':>8} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'cpu ms/op':>9} {'errors':>6} {'connections':>11}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, http2 in (("HTTP/1.1", False), ("HTTP/2", True)):
+        conn, child_conn = multiprocessing.Pipe()
+        server = multiprocessing.Process(
+            target=serve, args=(http2, args.latency_ms / 1000, child_conn), daemon=True
+        )
+        server.start()
+        try:
+            result = run(conn.recv(), http2, args.calls, args.threads, args.max_connections)
+            conn.send("stop")
+            connections = conn.recv()
+        finally:
+            server.join(5)
+        print(
+            f"{name:<10} {result['elapsed']:>7.2f} {result['ops']:>8.1f} "
+            f"{result['p50'] * 1000:>8.1f} {result['p99'] * 1000:>8.1f} "
+            f"{result['cpu'] * 1000:>9.2f} {result['errors']:>6} {connections:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
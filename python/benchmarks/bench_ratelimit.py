@@ -0,0 +1,70 @@
+"""
+Rate Limiter Benchmark
+
+Measures the cost of one try_acquire for the in-process RateLimiter and
+the host-wide HostRateLimiter, then has several processes share one
+HostRateLimiter as fast as they can. It reports the combined rate they
+achieved against the configured one, and each process's share.
+
+Usage:
+    python -m benchmarks.bench_ratelimit [--processes 8] [--rate 200] [--duration 5]
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from structurify.ratelimit import HostRateLimiter, RateLimiter
+
+
+def acquire_cost(limiter: RateLimiter, calls: int = 100_000) -> float:
+    """Seconds per try_acquire with tokens always available."""
+    started = time.perf_counter()
+    for _ in range(calls):
+        limiter.try_acquire()
+    return (time.perf_counter() - started) / calls
+
+
+def hammer(limiter: HostRateLimiter, duration: float) -> int:
+    """Acquire as fast as the shared limiter allows; returns the tokens taken."""
+    taken = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        if limiter.acquire(timeout=deadline - time.monotonic()):
+            taken += 1
+    return taken
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=200.0, help="shared requests per second")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per process")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        unlimited = 1e9
+        local = acquire_cost(RateLimiter(unlimited, burst=10**9))
+        host = acquire_cost(HostRateLimiter(unlimited, burst=10**9, directory=directory))
+        print(f"try_acquire: RateLimiter {local * 1e6:.2f} us, "
+              f"HostRateLimiter {host * 1e6:.2f} us\n")
+
+        # burst=1 so that the first second is not skewed by a full bucket
+        limiter = HostRateLimiter(args.rate, burst=1, key="bench", directory=directory)
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            counts: List[int] = list(
+                pool.map(hammer, [limiter] * args.processes, [args.duration] * args.processes)
+            )
+        achieved = sum(counts) / args.duration
+        print(f"{args.processes} processes sharing {args.rate:.0f}/s: "
+              f"{achieved:.1f}/s combined ({achieved / args.rate:.1%} of the limit)")
+        print("per process: " + ", ".join(f"{c / args.duration:.1f}" for c in counts))
+
+
+if __name__ == "__main__":
+    main()
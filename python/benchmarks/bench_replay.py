@@ -0,0 +1,93 @@
+"""
+Replay Benchmark
+
+Measures client-side throughput and peak memory of documents.upload,
+exports.download and exports.download_to by replaying a cassette, so the
+numbers do not depend on the network or the API. Without --cassette, one
+is recorded first against the local stand-in server.
+
+Usage:
+    python -m benchmarks.bench_replay [--cassette hot_paths.json] [--iterations 200]
+        [--upload-mb 5] [--export-kb 4096] [--latency-scale 0]
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+from benchmarks.standin import StandInServer
+from structurify import Structurify
+from structurify.cassette import Cassette
+
+
+def operations(
+    client: Structurify, payload: bytes, scratch: str
+) -> Dict[str, Callable[[], object]]:
+    return {
+        "documents.upload": lambda: client.documents.upload(
+            "proj_bench", file_bytes=payload, name="scan.pdf"
+        ),
+        "exports.download": lambda: client.exports.download("exp_bench"),
+        "exports.download_to": lambda: client.exports.download_to("exp_bench", scratch),
+    }
+
+
+def record(path: str, payload: bytes, export_kb: int) -> None:
+    server = StandInServer(latency=0.01, latency_sigma=0, export_kb=export_kb).start()
+    try:
+        client = Structurify(api_key="sk_bench", base_url=server.base_url)
+        with tempfile.TemporaryDirectory() as scratch:
+            with Cassette(path).record(client):
+                for func in operations(client, payload, os.path.join(scratch, "out")).values():
+                    func()
+    finally:
+        server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cassette", help="replay this cassette instead of recording one")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--upload-mb", type=float, default=5.0)
+    parser.add_argument("--export-kb", type=int, default=4096)
+    parser.add_argument("--latency-scale", type=float, default=0.0,
+                        help="multiplier for recorded latencies (0 measures the client alone)")
+    args = parser.parse_args()
+
+    payload = os.urandom(int(args.upload_mb * 1024 * 1024))
+    with tempfile.TemporaryDirectory() as scratch:
+        path = args.cassette or os.path.join(scratch, "hot_paths.json")
+        if not args.cassette:
+            record(path, payload, args.export_kb)
+        cassette = Cassette(path)
+
+        client = Structurify(api_key="sk_bench")
+        print(f"{len(cassette.interactions)} recorded exchanges, {args.iterations} iterations, "
+              f"latency x{args.latency_scale}\n")
+        print(f"{'operation':<22} {'ops/s':>9} {'ms/op':>9} {'peak MB':>9}")
+
+        with cassette.replay(client, latency_scale=args.latency_scale, loop=True):
+            for name, func in operations(client, payload, os.path.join(scratch, "out")).items():
+                func()  # warm up
+                started = time.perf_counter()
+                for _ in range(args.iterations):
+                    func()
+                elapsed = time.perf_counter() - started
+
+                tracemalloc.start()
+                func()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+                print(f"{name:<22} {args.iterations / elapsed:>9.1f} "
+                      f"{elapsed / args.iterations * 1000:>9.2f} {peak / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Load Test
+
+Drives a mix of SDK operations through the real Structurify client at a
+fixed arrival rate against a local stand-in server (benchmarks.standin)
+that injects latency, 429s and 5xx errors. Reports p50/p99/p999 latency,
+throughput, errors, retries and 429s per endpoint; with --report-every it
+also prints server-side counters while a long soak test runs.
+
+Latency is measured from each operation's scheduled start, not from when a
+worker picked it up, so a client that falls behind shows up as queueing
+delay instead of being hidden (coordinated omission).
+
+Usage:
+    python -m benchmarks.loadtest [--rps 500] [--duration 30]
+        [--mix upload=1,status=8,export=1] [--workers 64] [--processes 1]
+        [--server-rate-limit 450] [--error-rate 0.01] [--report-every 10]
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import argparse
+import math
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+from benchmarks.standin import StandInServer
+from structurify import Structurify
+
+# Operation name → (endpoint it calls, function making the call)
+OPERATIONS: Dict[str, Tuple[str, Callable[[Structurify, bytes], Any]]] = {
+    "upload": (
+        "POST /documents",
+        lambda client, payload: client.documents.upload(
+            "proj_load", file_bytes=payload, name="load.pdf"
+        ),
+    ),
+    "status": (
+        "GET /extraction-jobs/{id}",
+        lambda client, payload: client.extraction.get("job_load"),
+    ),
+    "export": (
+        "GET /exports/{id}/download",
+        lambda client, payload: client.exports.download("exp_load"),
+    ),
+}
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Values are kept in microsecond buckets whose width grows with the value,
+    so every recorded latency is exact to about 1% whatever its magnitude,
+    memory stays bounded, and histograms from several workers merge by
+    adding counts.
+    """
+
+    # Significant bits kept per value; 7 bits bounds the error below 1/64
+    PRECISION_BITS = 7
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()  # type: ignore[type-arg]
+        self.total = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        us = max(0, int(seconds * 1_000_000))
+        shift = max(0, us.bit_length() - self.PRECISION_BITS)
+        self.counts[(us >> shift) << shift] += 1
+        self.total += 1
+        if us > self.max_us:
+            self.max_us = us
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, p: float) -> float:
+        """Latency at percentile p, in seconds (the bucket's upper bound)."""
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * self.total))
+        seen = 0
+        for low in sorted(self.counts):
+            seen += self.counts[low]
+            if seen >= rank:
+                shift = max(0, low.bit_length() - self.PRECISION_BITS)
+                return min(low | ((1 << shift) - 1), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+
+class Results:
+    """Client-side outcomes per operation."""
+
+    def __init__(self) -> None:
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.ok: Counter = Counter()  # type: ignore[type-arg]
+        self.errors: Counter = Counter()  # type: ignore[type-arg]
+        self.late: Counter = Counter()  # type: ignore[type-arg]
+        self._lock = threading.Lock()
+
+    def record(self, op: str, seconds: float, ok: bool, late: bool) -> None:
+        with self._lock:
+            histogram = self.latency.get(op)
+            if histogram is None:
+                histogram = self.latency[op] = LatencyHistogram()
+            histogram.record(seconds)
+            (self.ok if ok else self.errors)[op] += 1
+            if late:
+                self.late[op] += 1
+
+    def merge(self, other: "Results") -> None:
+        for op, histogram in other.latency.items():
+            self.latency.setdefault(op, LatencyHistogram()).merge(histogram)
+        self.ok.update(other.ok)
+        self.errors.update(other.errors)
+        self.late.update(other.late)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse "upload=1,status=8,export=1" into operation weights."""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(
+                f"unknown operation {name!r}; expected one of {sorted(OPERATIONS)}"
+            )
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def arrivals(rps: float, duration: float, started: float) -> Iterator[float]:
+    """Scheduled start times, evenly spaced at rps."""
+    for i in range(int(rps * duration)):
+        yield started + i / rps
+
+
+def run_load(
+    base_url: str,
+    rps: float,
+    duration: float,
+    mix: Dict[str, float],
+    workers: int,
+    upload_kb: int,
+    max_retries: int,
+    seed: int,
+) -> Results:
+    """Run one share of the load with a single client and a pool of worker threads."""
+    client = Structurify(
+        api_key="sk_load",
+        base_url=base_url,
+        max_retries=max_retries,
+        max_connections=workers,
+    )
+    payload = os.urandom(upload_kb * 1024) if upload_kb else b"%PDF"
+    picker = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    results = Results()
+
+    def call(op: str, scheduled: float) -> None:
+        picked_up = time.monotonic()
+        _endpoint, func = OPERATIONS[op]
+        try:
+            func(client, payload)
+            ok = True
+        except Exception:
+            ok = False
+        # A worker that starts more than 10ms late means the pool is saturated
+        results.record(op, time.monotonic() - scheduled, ok, picked_up - scheduled > 0.01)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="load") as executor:
+        for scheduled in arrivals(rps, duration, time.monotonic()):
+            wait = scheduled - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            op = picker.choices(names, weights)[0]
+            executor.submit(call, op, scheduled)
+    return results
+
+
+def report_interval(server: StandInServer, every: float, stop: threading.Event) -> None:
+    """Print server-side throughput, 429s and 5xx for each interval until stopped."""
+    previous: Dict[str, int] = Counter()
+    started = time.monotonic()
+    while not stop.wait(every):
+        totals: Dict[str, int] = Counter()
+        for counts in server.snapshot().values():
+            totals.update(counts)
+        delta = {name: totals[name] - previous[name] for name in ("requests", "429", "5xx")}
+        previous = totals
+        print(
+            f"[{time.monotonic() - started:6.0f}s] {delta['requests'] / every:7.1f} req/s  "
+            f"429: {delta['429']:<6} 5xx: {delta['5xx']:<6}",
+            flush=True,
+        )
+
+
+def print_report(
+    results: Results, server_stats: Dict[str, Dict[str, int]], elapsed: float
+) -> None:
+    header = (
+        f"{'operation':<9} {'endpoint':<27} {'ok':>7} {'errors':>6} {'ops/s':>7} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'p999 ms':>8} {'max ms':>8} "
+        f"{'retries':>7} {'429s':>6} {'5xx':>6} {'late':>6}"
+    )
+    print(header)
+    print("-" * len(header))
+    for op, histogram in sorted(results.latency.items()):
+        endpoint = OPERATIONS[op][0]
+        served = server_stats.get(endpoint, {})
+        calls = results.ok[op] + results.errors[op]
+        # Every request beyond one per operation was a retry
+        retries = max(0, served.get("requests", 0) - calls)
+        print(
+            f"{op:<9} {endpoint:<27} {results.ok[op]:>7} {results.errors[op]:>6} "
+            f"{calls / elapsed:>7.1f} "
+            f"{histogram.percentile(50) * 1000:>8.1f} {histogram.percentile(99) * 1000:>8.1f} "
+            f"{histogram.percentile(99.9) * 1000:>8.1f} {histogram.max_us / 1000:>8.1f} "
+            f"{retries:>7} {served.get('429', 0):>6} {served.get('5xx', 0):>6} "
+            f"{results.late[op]:>6}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rps", type=float, default=500.0, help="target operations per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("upload=1,status=8,export=1"))
+    parser.add_argument("--workers", type=int, default=64, help="threads per process")
+    parser.add_argument("--processes", type=int, default=1, help="client processes")
+    parser.add_argument("--upload-kb", type=int, default=64)
+    parser.add_argument("--export-kb", type=int, default=256)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="median server latency")
+    parser.add_argument("--server-rate-limit", type=float, default=None,
+                        help="requests per second the stand-in accepts before answering 429")
+    parser.add_argument("--error-rate", type=float, default=0.01,
+                        help="fraction of requests answered with a 503")
+    parser.add_argument("--report-every", type=float, default=0.0,
+                        help="print server counters every N seconds (soak tests)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    server = StandInServer(
+        latency=args.latency_ms / 1000,
+        rate_limit=args.server_rate_limit,
+        error_rate=args.error_rate,
+        export_kb=args.export_kb,
+        seed=args.seed,
+    ).start()
+    stop = threading.Event()
+    if args.report_every:
+        threading.Thread(
+            target=report_interval, args=(server, args.report_every, stop), daemon=True
+        ).start()
+
+    print(f"{args.rps:.0f} ops/s for {args.duration:.0f}s, mix {args.mix}, "
+          f"{args.processes} x {args.workers} workers, server at {server.base_url}\n")
+
+    share = (
+        server.base_url, args.rps / args.processes, args.duration, args.mix, args.workers,
+        args.upload_kb, args.max_retries,
+    )
+    started = time.monotonic()
+    try:
+        if args.processes == 1:
+            results = run_load(*share, seed=args.seed)
+        else:
+            results = Results()
+            with ProcessPoolExecutor(max_workers=args.processes) as pool:
+                futures = [
+                    pool.submit(run_load, *share, seed=args.seed + i)
+                    for i in range(args.processes)
+                ]
+                for future in futures:
+                    results.merge(future.result())
+        elapsed = time.monotonic() - started
+    finally:
+        stop.set()
+        server_stats = server.snapshot()
+        server.stop()
+
+    print()
+    print_report(results, server_stats, elapsed)
+
+
+if __name__ == "__main__":
+    main()
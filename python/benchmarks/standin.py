@@ -0,0 +1,251 @@
+"""
+Stand-in API Server
+
+A local HTTP server that answers the endpoints the load and transport
+benchmarks exercise, with configurable latency, rate limiting and
+injected 5xx errors. Responses follow the shapes in
+openapi/structurify-api.yaml closely enough for the SDK to parse them;
+nothing is stored.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+_ID = re.compile(r"/[a-z]+_[A-Za-z0-9]+")
+
+
+def endpoint_for(method: str, path: str) -> str:
+    """Label a request by method and path template ("GET /exports/{id}/download")."""
+    path = path.split("?", 1)[0]
+    if path.startswith("/api"):
+        path = path[len("/api"):]
+    return f"{method} {_ID.sub('/{id}', path)}"
+
+
+class StandInAPI:
+    """
+    What the stand-in servers answer, independent of the HTTP version.
+
+    Each response is delayed by a log-normal latency with the given median.
+    Requests over rate_limit per second (token bucket, one second of burst)
+    get a 429 with Retry-After, and error_rate of the remaining requests get
+    a 503. Counters per endpoint are kept in stats, and connections counts
+    the connections clients opened.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.02,
+        latency_sigma: float = 0.5,
+        rate_limit: Optional[float] = None,
+        error_rate: float = 0.0,
+        export_kb: int = 256,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            latency: Median response latency in seconds
+            latency_sigma: Spread of the log-normal latency (0 for a constant delay)
+            rate_limit: Requests per second accepted before answering 429
+            error_rate: Fraction of accepted requests answered with a 503
+            export_kb: Approximate size of an export download body
+            seed: Seed for latency and error injection
+        """
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.stats: Dict[str, Counter] = {}  # type: ignore[type-arg]
+        self.connections = 0
+
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._tokens = rate_limit or 0.0
+        self._refilled = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+
+        rows = max(1, export_kb * 1024 // 160)
+        self.export_body = json.dumps({
+            "data": [
+                {
+                    "documentId": f"doc_{i}",
+                    "documentName": f"invoice-{i}.pdf",
+                    "Invoice Number": f"INV-{i:06d}",
+                    "Total": i * 1.25,
+                    "Date": "2026-01-31",
+                }
+                for i in range(rows)
+            ]
+        }).encode("utf-8")
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """A copy of the per-endpoint counters."""
+        with self._lock:
+            return {endpoint: dict(counts) for endpoint, counts in self.stats.items()}
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def count_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def decide(self, endpoint: str) -> Tuple[int, float]:
+        """Pick the status and delay for a request, and count it."""
+        with self._lock:
+            counts = self.stats.get(endpoint)
+            if counts is None:
+                counts = self.stats[endpoint] = Counter()
+            counts["requests"] += 1
+
+            if self.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate_limit, self._tokens + (now - self._refilled) * self.rate_limit
+                )
+                self._refilled = now
+                if self._tokens < 1:
+                    counts["429"] += 1
+                    return 429, 0.0
+                self._tokens -= 1
+
+            delay = self.latency
+            if self.latency_sigma:
+                delay *= self._random.lognormvariate(0.0, self.latency_sigma)
+            if self.error_rate and self._random.random() < self.error_rate:
+                counts["5xx"] += 1
+                return 503, delay
+            return 200, delay
+
+    def respond(self, method: str, path: str) -> Tuple[int, float, bytes, Dict[str, str]]:
+        """Status, delay, body and extra headers for a request."""
+        endpoint = endpoint_for(method, path)
+        status, delay = self.decide(endpoint)
+        if status == 429:
+            limit = int(self.rate_limit or 0)
+            return 429, delay, _json({"error": "RateLimited", "message": "Too many requests"}), {
+                "Retry-After": "1",
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + 1),
+            }
+        if status != 200:
+            return status, delay, _json({"error": "Unavailable", "message": "Injected failure"}), {}
+        if endpoint == "GET /exports/{id}/download":
+            return 200, delay, self.export_body, {}
+        return 200, delay, _json(self._body(endpoint)), {}
+
+    def _body(self, endpoint: str) -> Dict[str, Any]:
+        n = self.next_id()
+        if endpoint == "POST /documents":
+            return {"document": {"id": f"doc_{n}", "status": "uploaded"}}
+        if endpoint == "GET /extraction-jobs/{id}":
+            return {"job": {"id": "job_load", "status": "running", "progress": n % 100}}
+        if endpoint == "POST /extraction-jobs":
+            return {"job": {"id": f"job_{n}", "status": "queued"}}
+        if endpoint == "POST /exports":
+            return {"export": {"id": f"exp_{n}", "status": "completed"}}
+        if endpoint.startswith("DELETE "):
+            return {"success": True}
+        return {"id": f"obj_{n}"}
+
+
+def _json(body: Dict[str, Any]) -> bytes:
+    return json.dumps(body).encode("utf-8")
+
+
+class StandInServer(StandInAPI, ThreadingHTTPServer):
+    """
+    Threaded HTTP/1.1 stand-in for the Structurify API.
+
+    See StandInAPI for the latency, rate limiting and error injection.
+
+    Example:
+        server = StandInServer(latency=0.02, rate_limit=400, error_rate=0.01)
+        server.start()
+        client = Structurify(api_key="sk_test", base_url=server.base_url)
+        ...
+        server.stop()
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, port: int = 0, **kwargs: Any):
+        """
+        Args:
+            port: Port to listen on (0 picks a free one)
+            **kwargs: Behaviour settings, see StandInAPI
+        """
+        ThreadingHTTPServer.__init__(self, ("127.0.0.1", port), _Handler)
+        StandInAPI.__init__(self, **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to Structurify(base_url=...)."""
+        return f"http://127.0.0.1:{self.server_address[1]}/api"
+
+    def start(self) -> "StandInServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="structurify-standin", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; split writes stall on delayed ACKs
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    server: StandInServer
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def do_POST(self) -> None:
+        self._handle()
+
+    def do_DELETE(self) -> None:
+        self._handle()
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.count_connection()
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        status, delay, payload, headers = self.server.respond(self.command, self.path)
+        if delay:
+            time.sleep(delay)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
@@ -0,0 +1,185 @@
+"""
+HTTP/2 Stand-in API Server
+
+The stand-in API over cleartext HTTP/2 (h2c with prior knowledge), served
+from one asyncio loop so thousands of concurrent streams cost no threads.
+Responses, latency, rate limiting and error injection are shared with the
+HTTP/1.1 StandInServer. Requires the h2 package (pip install
+structurify[http2]).
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+import h2.settings
+
+from benchmarks.standin import StandInAPI
+
+
+class StandInH2Server(StandInAPI):
+    """
+    h2c stand-in for the Structurify API.
+
+    Example:
+        server = StandInH2Server(latency=0.02).start()
+        client = Structurify(api_key="sk_test", base_url=server.base_url)
+        client._session.mount("http://", Http2Adapter(cleartext=True))
+        ...
+        server.stop()
+    """
+
+    def __init__(self, port: int = 0, max_streams: int = 100, **kwargs: Any):
+        """
+        Args:
+            port: Port to listen on (0 picks a free one)
+            max_streams: Concurrent streams allowed per connection
+            **kwargs: Behaviour settings, see StandInAPI
+        """
+        super().__init__(**kwargs)
+        self.port = port
+        self.max_streams = max_streams
+        self._loop = asyncio.new_event_loop()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._started = threading.Event()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to Structurify(base_url=...)."""
+        return f"http://127.0.0.1:{self.port}/api"
+
+    def start(self) -> "StandInH2Server":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="structurify-standin-h2", daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            self._loop.create_server(
+                lambda: _H2Protocol(self), "127.0.0.1", self.port, backlog=1024
+            )
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        self._loop.run_forever()
+        self._server.close()
+        self._loop.run_until_complete(self._server.wait_closed())
+        self._loop.close()
+
+
+class _H2Protocol(asyncio.Protocol):
+    def __init__(self, server: StandInH2Server):
+        self.server = server
+        self.conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.transport: Optional[asyncio.Transport] = None
+        self.requests: Dict[int, Tuple[str, str]] = {}
+        # Response bodies waiting for flow-control window
+        self.pending: Dict[int, bytes] = {}
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+        self.server.count_connection()
+        self.conn.initiate_connection()
+        self.conn.update_settings({
+            h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: self.server.max_streams
+        })
+        self._flush()
+
+    def data_received(self, data: bytes) -> None:
+        try:
+            events = self.conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self._flush()
+            if self.transport is not None:
+                self.transport.close()
+            return
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                headers = dict(event.headers)
+                self.requests[event.stream_id] = (headers[":method"], headers[":path"])
+            elif isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                self._dispatch(event.stream_id)
+            elif isinstance(event, h2.events.StreamReset):
+                self.requests.pop(event.stream_id, None)
+                self.pending.pop(event.stream_id, None)
+            elif isinstance(event, h2.events.WindowUpdated):
+                self._send_pending()
+        self._flush()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.transport = None
+
+    def _dispatch(self, stream_id: int) -> None:
+        method, path = self.requests.pop(stream_id)
+        status, delay, payload, headers = self.server.respond(method, path)
+        self.server._loop.call_later(delay, self._respond, stream_id, status, payload, headers)
+
+    def _respond(
+        self, stream_id: int, status: int, payload: bytes, headers: Dict[str, str]
+    ) -> None:
+        if self.transport is None:
+            return
+        try:
+            self.conn.send_headers(stream_id, [
+                (":status", str(status)),
+                ("content-type", "application/json"),
+                ("content-length", str(len(payload))),
+                *((name.lower(), value) for name, value in headers.items()),
+            ])
+        except h2.exceptions.ProtocolError:
+            # Reset by the client while the response was delayed
+            return
+        self.pending[stream_id] = payload
+        self._send_pending()
+        self._flush()
+
+    def _send_pending(self) -> None:
+        for stream_id in list(self.pending):
+            payload = self.pending[stream_id]
+            try:
+                while payload:
+                    size = min(
+                        self.conn.local_flow_control_window(stream_id),
+                        self.conn.max_outbound_frame_size,
+                        len(payload),
+                    )
+                    if size <= 0:
+                        break
+                    self.conn.send_data(stream_id, payload[:size])
+                    payload = payload[size:]
+                if payload:
+                    self.pending[stream_id] = payload
+                    continue
+                self.conn.end_stream(stream_id)
+            except h2.exceptions.StreamClosedError:
+                pass
+            del self.pending[stream_id]
+
+    def _flush(self) -> None:
+        data = self.conn.data_to_send()
+        if data and self.transport is not None:
+            self.transport.write(data)
@@ -8,6 +8,7 @@ Licensed under the MIT License.
 """
 
 from structurify.client import Structurify
+from structurify.pool import StructurifyPool
 from structurify.exceptions import (
     StructurifyError,
     AuthenticationError,
@@ -15,6 +16,11 @@ from structurify.exceptions import (
     NotFoundError,
     ValidationError,
     InsufficientCreditsError,
+    PreflightError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    OperationCancelledError,
+    CassetteMissError,
 )
 
 __version__ = "1.0.0"
@@ -23,10 +29,16 @@ __license__ = "MIT"
 
 __all__ = [
     "Structurify",
+    "StructurifyPool",
     "StructurifyError",
     "AuthenticationError",
     "RateLimitError",
     "NotFoundError",
     "ValidationError",
     "InsufficientCreditsError",
+    "PreflightError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
+    "OperationCancelledError",
+    "CassetteMissError",
 ]
@@ -0,0 +1,12 @@
+"""
+Allows running the CLI as ``python -m structurify``.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import sys
+
+from structurify.cli import main
+
+sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Adaptive Concurrency
+
+Finds the number of requests to keep in flight for bulk transfers instead of
+relying on a fixed guess. The limit grows while latency stays near its
+long-run baseline, shrinks in proportion when latency rises (requests are
+queueing somewhere), and is cut multiplicatively on overload errors such as
+429s, 5xx responses and timeouts. This follows the gradient approach of
+Netflix's concurrency-limits with an AIMD response to errors.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+
+from structurify import cancellation
+from structurify.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    RateLimitError,
+    ServerError,
+    StructurifyError,
+)
+
+# Larger items are compared by time per unit, so a batch of mixed file sizes
+# does not look like congestion
+SIZE_UNIT = 256 * 1024
+
+
+def is_overload(error: BaseException) -> bool:
+    """True for errors that mean the server or network is saturated."""
+    if isinstance(error, (RateLimitError, ServerError, CircuitOpenError, DeadlineExceededError)):
+        return True
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    # Exhausted connection retries surface as a StructurifyError raised while
+    # handling the requests exception
+    return isinstance(error, StructurifyError) and isinstance(
+        error.__context__, (requests.ConnectionError, requests.Timeout)
+    )
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit that tunes itself from latency and errors.
+
+    Pass one as the concurrency of a bulk helper. Each finished request
+    updates a fast and a slow moving average of its latency (per 256 KB for
+    larger items, so throughput rather than file size is compared). While
+    the fast average stays within `tolerance` of the slow one, the limit
+    grows by about its square root per adjustment; when it rises above, the
+    limit shrinks in proportion. An overload error multiplies the limit by
+    `backoff`, at most once per round trip. The limit only grows while it
+    is actually being used.
+
+    Example:
+        tuner = AdaptiveConcurrency(initial=4, max_limit=64)
+        results = client.documents.upload_many("proj_xxx", paths, concurrency=tuner)
+        print(tuner.limit, tuner.metrics())
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        backoff: float = 0.7,
+        short_window: int = 10,
+        long_window: int = 500,
+    ):
+        """
+        Args:
+            initial: Starting limit
+            min_limit: Lowest limit, however bad things get
+            max_limit: Highest limit; also the number of worker threads used
+            tolerance: Latency growth over the baseline accepted before shrinking
+            smoothing: Weight of each new limit estimate (0-1)
+            backoff: Factor applied to the limit on an overload error
+            short_window: Samples in the fast latency average
+            long_window: Samples in the slow (baseline) latency average
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.backoff = backoff
+        self._short_alpha = 2.0 / (short_window + 1)
+        self._long_alpha = 2.0 / (long_window + 1)
+
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._short_rtt: Optional[float] = None
+        self._long_rtt: Optional[float] = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+        self.samples = 0
+        self.overloads = 0
+        self.peak_limit = initial
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        """
+        Wait for a slot under the current limit.
+
+        Raises:
+            OperationCancelledError: If the current cancellation token is cancelled while waiting
+        """
+        token = cancellation.current_token()
+        unregister = token.on_cancel(self._wake) if token is not None else None
+        try:
+            with self._cond:
+                while self._in_flight >= int(self._limit):
+                    cancellation.check()
+                    self._cond.wait()
+                cancellation.check()
+                self._in_flight += 1
+        finally:
+            if unregister is not None:
+                unregister()
+
+    def release(
+        self,
+        latency: float,
+        size: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Return a slot and adjust the limit from how the request went.
+
+        Args:
+            latency: Seconds the request took
+            size: Bytes transferred, if known
+            error: The error the request failed with, if any
+        """
+        with self._cond:
+            in_flight = self._in_flight
+            self._in_flight -= 1
+            if error is not None and is_overload(error):
+                self._on_overload()
+            elif error is None:
+                self._on_sample(latency, size, in_flight)
+            self._cond.notify_all()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current limit, slots in use, latency averages and counters."""
+        with self._cond:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "short_rtt": self._short_rtt,
+                "long_rtt": self._long_rtt,
+                "samples": self.samples,
+                "overloads": self.overloads,
+                "peak_limit": self.peak_limit,
+            }
+
+    def _wake(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+
+    def _on_sample(self, latency: float, size: Optional[int], in_flight: int) -> None:
+        if size and size > SIZE_UNIT:
+            latency /= size / SIZE_UNIT
+        self.samples += 1
+        if self._short_rtt is None or self._long_rtt is None:
+            self._short_rtt = self._long_rtt = latency
+            return
+        self._short_rtt += self._short_alpha * (latency - self._short_rtt)
+        self._long_rtt += self._long_alpha * (latency - self._long_rtt)
+        if self._long_rtt > 2 * self._short_rtt:
+            # The baseline is stale after a slow period; let it recover faster
+            self._long_rtt *= 0.95
+
+        if in_flight < self._limit / 2:
+            # Not using the limit we have, so latency says nothing about a higher one
+            return
+        gradient = max(0.5, min(1.0, self.tolerance * self._long_rtt / self._short_rtt))
+        estimate = self._limit * gradient + math.sqrt(self._limit)
+        self._set_limit(self._limit * (1 - self.smoothing) + estimate * self.smoothing)
+
+    def _on_overload(self) -> None:
+        self.overloads += 1
+        now = time.monotonic()
+        # Requests in flight together tend to fail together; count that as one signal
+        if now - self._last_decrease < (self._short_rtt or 0.0):
+            return
+        self._last_decrease = now
+        self._set_limit(self._limit * self.backoff)
+
+    def _set_limit(self, value: float) -> None:
+        self._limit = max(float(self.min_limit), min(float(self.max_limit), value))
+        self.peak_limit = max(self.peak_limit, int(self._limit))
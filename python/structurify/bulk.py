@@ -0,0 +1,259 @@
+"""
+Bulk Operation Helpers
+
+Runs many independent API calls concurrently on a thread pool, collecting
+a per-item result instead of stopping at the first failure.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import contextvars
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar, Union
+
+from structurify import cancellation
+from structurify.autotune import AdaptiveConcurrency
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkResult:
+    """Outcome of one item in a bulk operation."""
+
+    key: str
+    value: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the item completed without an error."""
+        return self.error is None
+
+
+class BulkProgress:
+    """
+    Live counters for a running bulk operation.
+
+    Passed to on_progress callbacks after each item finishes.
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.bytes = 0
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, ok: bool, size: int = 0) -> None:
+        """Record one finished item."""
+        with self._lock:
+            self.completed += 1
+            if not ok:
+                self.failed += 1
+            self.bytes += size
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the operation started."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def items_per_second(self) -> float:
+        """Average item throughput so far."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Average byte throughput so far."""
+        elapsed = self.elapsed
+        return self.bytes / elapsed if elapsed > 0 else 0.0
+
+
+class _Run:
+    """Results, progress and tuner feedback shared by the calls of one bulk operation."""
+
+    def __init__(
+        self,
+        total: int,
+        concurrency: Union[int, AdaptiveConcurrency],
+        key: Callable[[Any], str],
+        size: Optional[Callable[[Any], int]],
+        on_progress: Optional[Callable[[BulkProgress], None]],
+    ):
+        self.progress = BulkProgress(total)
+        self.results: List[Optional[BulkResult]] = [None] * total
+        self.tuner: Optional[AdaptiveConcurrency] = None
+        if isinstance(concurrency, AdaptiveConcurrency):
+            self.tuner = concurrency
+            self.workers = concurrency.max_limit
+        else:
+            self.workers = concurrency
+        self._key = key
+        self._size = size
+        self._on_progress = on_progress
+
+    def call(self, index: int, item: Any, func: Callable[[], Any]) -> None:
+        try:
+            # Items not yet started when the operation is cancelled fail without running
+            cancellation.check()
+            if self.tuner is None:
+                value = func()
+            else:
+                self.tuner.acquire()
+                started = time.monotonic()
+                error: Optional[Exception] = None
+                try:
+                    value = func()
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    # The slot is returned however the call, or sizing the item, fails
+                    latency = time.monotonic() - started
+                    size = None if error else self._item_size(item)
+                    self.tuner.release(latency, size, error=error)
+            result = BulkResult(self._key(item), value=value)
+        except Exception as e:
+            result = BulkResult(self._key(item), error=e)
+        self.finish(index, item, result)
+
+    def finish(self, index: int, item: Any, result: BulkResult) -> None:
+        self.results[index] = result
+        self.progress.record(result.ok, (self._item_size(item) or 0) if result.ok else 0)
+        if self._on_progress:
+            self._on_progress(self.progress)
+
+    def _item_size(self, item: Any) -> Optional[int]:
+        # A size function that fails only costs the item its throughput figure
+        if self._size is None:
+            return None
+        try:
+            return self._size(item)
+        except Exception:
+            return None
+
+    def collect(self) -> List[BulkResult]:
+        return [r for r in self.results if r is not None]
+
+
+def run_bulk(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    concurrency: Union[int, AdaptiveConcurrency] = 8,
+    key: Callable[[T], str] = str,
+    size: Optional[Callable[[T], int]] = None,
+    on_progress: Optional[Callable[[BulkProgress], None]] = None,
+) -> List[BulkResult]:
+    """
+    Apply func to every item concurrently.
+
+    Errors are captured per item; the operation always runs to completion.
+    Each call runs in a copy of the caller's context, so settings such as
+    client.priority(), deadlines and cancellation apply inside the worker
+    threads.
+
+    With an AdaptiveConcurrency as the concurrency, the number of calls in
+    flight follows its limit, and every call's latency, size and error are
+    fed back to it.
+
+    Args:
+        func: Function called once per item
+        items: Items to process
+        concurrency: Maximum number of calls in flight, or an AdaptiveConcurrency
+        key: Returns the identifier reported in each BulkResult
+        size: Optional byte size of an item, used for throughput reporting
+        on_progress: Optional callback invoked after each item finishes
+
+    Returns:
+        One BulkResult per item, in input order.
+    """
+    items = list(items)
+    run = _Run(len(items), concurrency, key, size, on_progress)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(run.workers, len(items)))) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, run.call, i, item,
+                            functools.partial(func, item))
+            for i, item in enumerate(items)
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+    return run.collect()
+
+
+def run_pipeline(
+    prepare: Callable[[T], "Future[Any]"],
+    func: Callable[[T, Any], Any],
+    items: Iterable[T],
+    concurrency: Union[int, AdaptiveConcurrency] = 8,
+    ahead: Optional[int] = None,
+    key: Callable[[T], str] = str,
+    size: Optional[Callable[[T], int]] = None,
+    on_progress: Optional[Callable[[BulkProgress], None]] = None,
+) -> List[BulkResult]:
+    """
+    Like run_bulk, with a preparation stage that runs ahead of func.
+
+    prepare starts work on an item elsewhere, typically a process pool, and
+    returns its future. func(item, prepared) is called as each preparation
+    finishes, in the order they finish, so calls in flight (and the latency
+    an AdaptiveConcurrency measures) are never spent waiting on it. An item
+    whose preparation fails is reported with that error.
+
+    Args:
+        prepare: Starts preparing an item and returns a future of the result
+        func: Function called once per item with the prepared result
+        items: Items to process
+        concurrency: Maximum number of calls in flight, or an AdaptiveConcurrency
+        ahead: Items prepared, or waiting for a worker, beyond those in flight
+            (default: the concurrency). Bounds the prepared results held in memory.
+        key: Returns the identifier reported in each BulkResult
+        size: Optional byte size of an item, used for throughput reporting
+        on_progress: Optional callback invoked after each item finishes
+
+    Returns:
+        One BulkResult per item, in input order.
+    """
+    pending = deque(enumerate(items))
+    run = _Run(len(pending), concurrency, key, size, on_progress)
+    window = run.workers + (ahead if ahead is not None else run.workers)
+    preparing: Dict["Future[Any]", Tuple[int, T]] = {}
+    running: Set["Future[None]"] = set()
+
+    def call(item: T, prepared: "Future[Any]") -> Any:
+        return func(item, prepared.result())
+
+    with ThreadPoolExecutor(max_workers=max(1, min(run.workers, len(pending)))) as executor:
+        while pending or preparing or running:
+            while pending and len(preparing) + len(running) < window:
+                index, item = pending.popleft()
+                try:
+                    cancellation.check()
+                    preparing[prepare(item)] = (index, item)
+                except Exception as e:
+                    run.finish(index, item, BulkResult(key(item), error=e))
+            if not preparing and not running:
+                continue
+            done, _ = wait([*preparing, *running], return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in preparing:
+                    index, item = preparing.pop(future)
+                    running.add(executor.submit(
+                        contextvars.copy_context().run, run.call, index, item,
+                        functools.partial(call, item, future),
+                    ))
+                else:
+                    running.discard(future)
+                    future.result()
+
+    return run.collect()
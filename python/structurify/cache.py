@@ -0,0 +1,225 @@
+"""
+On-disk Document Cache
+
+Stores downloaded document content as raw files, addressed by SHA-256 of the
+content, with a small per-document index pointing at each blob. Identical
+files uploaded under different IDs are stored once. The cache is bounded by
+size with least-recently-used eviction and is safe to share between
+processes: files are written atomically, eviction runs under a lock file,
+and the running size total is kept in the directory, so max_bytes bounds
+the directory as a whole rather than each process's share of it.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import contextlib
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+_SIZE_FILE = ".size"
+
+
+class DocumentCache:
+    """
+    Size-bounded, content-addressed cache of document files.
+
+    Example:
+        cache = DocumentCache("~/.cache/structurify", max_bytes=5 * 1024**3)
+        client = Structurify(api_key="sk_live_xxx", document_cache=cache)
+
+        path = client.documents.download_path("doc_xxx")   # network on first call only
+        data = client.documents.download_mmap("doc_xxx")   # zero-copy view
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Total size of cached content before old entries are evicted
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        self._blobs = os.path.join(self.directory, "blobs")
+        self._index = os.path.join(self.directory, "index")
+        os.makedirs(self._blobs, exist_ok=True)
+        os.makedirs(self._index, exist_ok=True)
+        self._thread_lock = threading.RLock()
+        self._owner_pid = os.getpid()
+
+    def _after_fork(self) -> None:
+        # The file lock is per open file, so only the thread lock needs replacing
+        if self._owner_pid != os.getpid():
+            self._thread_lock = threading.RLock()
+            self._owner_pid = os.getpid()
+
+    def _index_path(self, document_id: str) -> str:
+        # Hash the ID so arbitrary IDs are safe file names
+        name = hashlib.sha256(document_id.encode("utf-8")).hexdigest()
+        return os.path.join(self._index, name)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self._blobs, digest[:2], digest)
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the cache-wide lock across threads and processes."""
+        with self._thread_lock:
+            with open(os.path.join(self.directory, ".lock"), "a+b") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    def _add_size(self, delta: int) -> Optional[int]:
+        """Add to the shared size total; None if there is none yet to add to."""
+        path = os.path.join(self.directory, _SIZE_FILE)
+        with self._locked():
+            try:
+                with open(path, "r", encoding="ascii") as f:
+                    total = int(f.read()) + delta
+            except (OSError, ValueError):
+                return None
+            self._write_atomic(path, str(total).encode("ascii"))
+        return total
+
+    def _set_size(self, total: int) -> None:
+        # Called with the lock held
+        self._write_atomic(os.path.join(self.directory, _SIZE_FILE), str(total).encode("ascii"))
+
+    def digest(self, document_id: str) -> Optional[str]:
+        """Return the content hash cached for a document, if any."""
+        try:
+            with open(self._index_path(document_id), "r", encoding="ascii") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def get_path(self, document_id: str) -> Optional[str]:
+        """
+        Return the path of a cached document's content, or None on a miss.
+
+        A hit marks the entry as recently used.
+        """
+        digest = self.digest(document_id)
+        if digest is None:
+            return None
+        path = self._blob_path(digest)
+        try:
+            os.utime(path)
+        except OSError:
+            # Evicted by another process; drop the dangling index entry
+            self.invalidate(document_id)
+            return None
+        return path
+
+    def get_mmap(self, document_id: str) -> Optional[mmap.mmap]:
+        """Return a read-only memory map of a cached document, or None on a miss."""
+        path = self.get_path(document_id)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, document_id: str, content: bytes) -> str:
+        """
+        Store a document's content and return its cached path.
+
+        Content already present under another ID is not written again.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        total: Optional[int] = 0
+        if os.path.exists(path):
+            with contextlib.suppress(OSError):
+                os.utime(path)
+        else:
+            self._write_atomic(path, content)
+            total = self._add_size(len(content))
+        self._write_atomic(self._index_path(document_id), digest.encode("ascii"))
+
+        if total is None or total > self.max_bytes:
+            self.evict()
+        return path
+
+    def invalidate(self, document_id: str) -> None:
+        """Forget a document. Its content stays until evicted, as other IDs may share it."""
+        with contextlib.suppress(OSError):
+            os.unlink(self._index_path(document_id))
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for root, _dirs, files in os.walk(self._blobs):
+            for name in files:
+                if name.startswith(".tmp-"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """Total bytes of cached content."""
+        return sum(size for _mtime, size, _path in self._scan())
+
+    def evict(self) -> int:
+        """
+        Remove least-recently-used content until the cache fits in max_bytes.
+
+        Returns:
+            Number of bytes removed.
+        """
+        removed = 0
+        with self._locked():
+            entries = self._scan()
+            total = sum(size for _mtime, size, _path in entries)
+            for _mtime, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                with contextlib.suppress(OSError):
+                    os.unlink(path)
+                    total -= size
+                    removed += size
+            self._set_size(total)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached document."""
+        with self._locked():
+            for root, _dirs, files in os.walk(self.directory):
+                for name in files:
+                    if name != ".lock":
+                        with contextlib.suppress(OSError):
+                            os.unlink(os.path.join(root, name))
+            self._set_size(0)
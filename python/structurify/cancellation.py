@@ -0,0 +1,252 @@
+"""
+Cooperative Cancellation
+
+A CancellationToken stops an operation (a bulk upload, a polling loop, a
+batch of extractions) from another thread. Every SDK call made inside
+cancellable(token) checks the token before each attempt, sleeps and polls
+wake up as soon as it is cancelled, and HTTP requests already on the wire
+are aborted by shutting down their sockets.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import contextlib
+import socket
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from structurify.exceptions import OperationCancelledError
+
+_current_token: ContextVar[Optional["CancellationToken"]] = ContextVar(
+    "structurify_cancellation", default=None
+)
+
+
+class CancellationToken:
+    """
+    Signals that an operation should stop.
+
+    With cancel_jobs=True, extraction jobs started inside the token's scope
+    are cancelled on the server too when the token is cancelled. A job whose
+    start request was itself interrupted may still have been created; its
+    ID is unknown and it cannot be cancelled.
+
+    Example:
+        token = CancellationToken(cancel_jobs=True)
+
+        def work():
+            with client.cancellable(token):
+                client.documents.upload_many("proj_xxx", paths)
+                job = client.extraction.run("proj_xxx")
+                client.extraction.wait_for_completion(job["id"])
+
+        threading.Thread(target=work).start()
+        ...
+        token.cancel("user left the page")   # aborts uploads, stops polling, cancels the job
+    """
+
+    def __init__(self, cancel_jobs: bool = False):
+        """
+        Args:
+            cancel_jobs: Cancel extraction jobs started in this token's scope on cancel
+        """
+        self.cancel_jobs = cancel_jobs
+        self.reason: Optional[str] = None
+        self.errors: List[Exception] = []
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], Any]] = []
+        self._connections: "weakref.WeakSet[HTTPConnection]" = weakref.WeakSet()
+        self._jobs: List[Tuple[str, Callable[[str], Any]]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() has been called."""
+        return self._event.is_set()
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """
+        Cancel the operation.
+
+        Safe to call from any thread, and more than once. Callbacks and
+        server-side job cancellations run in the calling thread; their
+        errors are collected in errors rather than raised.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+            connections = list(self._connections)
+            jobs, self._jobs = self._jobs, []
+
+        for conn in connections:
+            _abort(conn, self)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                self.errors.append(e)
+        for job_id, cancel_job in jobs:
+            try:
+                # Outside this token's scope, or the cancel request would be refused
+                with cancellable(None):
+                    cancel_job(job_id)
+            except Exception as e:
+                self.errors.append(e)
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raises:
+            OperationCancelledError: If the token has been cancelled
+        """
+        if self._event.is_set():
+            raise OperationCancelledError(
+                f"Operation cancelled: {self.reason}" if self.reason else "Operation cancelled"
+            )
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or timeout; return True if cancelled."""
+        return self._event.wait(timeout)
+
+    def on_cancel(self, callback: Callable[[], Any]) -> Callable[[], None]:
+        """
+        Run callback when the token is cancelled (immediately if it already is).
+
+        Returns:
+            A function that unregisters the callback.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback: Callable[[], Any]) -> None:
+        with self._lock:
+            with contextlib.suppress(ValueError):
+                self._callbacks.remove(callback)
+
+    def track_job(self, job_id: str, cancel_job: Callable[[str], Any]) -> None:
+        """Remember a started job so cancel() can stop it (only with cancel_jobs)."""
+        if not self.cancel_jobs:
+            return
+        with self._lock:
+            if not self._event.is_set():
+                self._jobs.append((job_id, cancel_job))
+                return
+        with cancellable(None):
+            cancel_job(job_id)
+
+    def _attach(self, conn: HTTPConnection) -> None:
+        with self._lock:
+            if not self._event.is_set():
+                self._connections.add(conn)
+                return
+        _abort(conn, self)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """Return the cancellation token for the current context, if any."""
+    return _current_token.get()
+
+
+@contextlib.contextmanager
+def cancellable(
+    token: Optional[CancellationToken] = None,
+) -> Iterator[Optional[CancellationToken]]:
+    """
+    Make every SDK call in this block stop when token is cancelled.
+
+    The token follows the current thread or task, and bulk helpers carry it
+    into their worker threads. Passing None leaves the block without a token.
+    """
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def check() -> None:
+    """
+    Raises:
+        OperationCancelledError: If the current token has been cancelled
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def sleep(seconds: float) -> None:
+    """
+    Sleep, waking early if the current token is cancelled.
+
+    Raises:
+        OperationCancelledError: If the token is cancelled before or during the sleep
+    """
+    token = _current_token.get()
+    if token is None:
+        time.sleep(seconds)
+        return
+    if token.wait(seconds):
+        token.raise_if_cancelled()
+
+
+def _abort(conn: HTTPConnection, token: CancellationToken) -> None:
+    # Only if the connection is still serving this token's request; a pooled
+    # connection may since have been reused by an unrelated call
+    if getattr(conn, "_structurify_token", None) is not token:
+        return
+    sock = getattr(conn, "sock", None)
+    if sock is not None:
+        with contextlib.suppress(OSError):
+            sock.shutdown(socket.SHUT_RDWR)
+
+
+class _CancellableMixin:
+    """Registers each request's connection with the active cancellation token."""
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        token = _current_token.get()
+        self._structurify_token = token
+        if token is not None:
+            token._attach(self)  # type: ignore[arg-type]
+        return super().request(*args, **kwargs)  # type: ignore[misc]
+
+
+class _CancellableHTTPConnection(_CancellableMixin, HTTPConnection):
+    pass
+
+
+class _CancellableHTTPSConnection(_CancellableMixin, HTTPSConnection):
+    pass
+
+
+class _CancellableHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CancellableHTTPConnection
+
+
+class _CancellableHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CancellableHTTPSConnection
+
+
+class CancellableAdapter(HTTPAdapter):
+    """requests adapter whose in-flight requests can be aborted by a CancellationToken."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CancellableHTTPConnectionPool,
+            "https": _CancellableHTTPSConnectionPool,
+        }
@@ -0,0 +1,305 @@
+"""
+Record and Replay
+
+Captures a client's HTTP exchanges (requests, responses, headers, bodies and
+timing) into a cassette file, and serves them back later without a network.
+Replays can keep the recorded latencies, scale them, or drop them, so
+throughput and memory of hot paths such as documents.upload and
+exports.download can be measured repeatably offline.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import base64
+import contextlib
+import hashlib
+import io
+import json
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+
+from structurify import cancellation
+from structurify.cancellation import CancellableAdapter
+from structurify.exceptions import CassetteMissError
+
+if TYPE_CHECKING:
+    from structurify.client import Structurify
+
+CASSETTE_VERSION = 1
+
+# Never written to a cassette
+_REDACTED_HEADERS = {"authorization", "cookie", "set-cookie"}
+# Recorded bodies are stored decoded, so these no longer describe them
+_DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+
+
+class Cassette:
+    """
+    A recording of HTTP exchanges.
+
+    Example:
+        cassette = Cassette("cassettes/upload.json")
+
+        # Once, against the real API
+        with cassette.record(client):
+            client.documents.upload("proj_xxx", file_path="invoice.pdf")
+
+        # Then anywhere, offline, at the recorded speed or faster
+        with cassette.replay(client, latency_scale=0):
+            client.documents.upload("proj_xxx", file_path="invoice.pdf")
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Cassette file; loaded now if it exists, written when recording ends
+        """
+        self.path = path
+        self.interactions: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        if path:
+            with contextlib.suppress(FileNotFoundError):
+                self.load(path)
+
+    def load(self, path: str) -> None:
+        """Replace the interactions with those in a cassette file."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')!r} in {path}")
+        self.interactions = data["interactions"]
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write the interactions to path (default: the cassette's own path)."""
+        path = path or self.path
+        if not path:
+            raise ValueError("No path to save the cassette to")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": CASSETTE_VERSION, "interactions": self.interactions}, f)
+
+    def append(self, interaction: Dict[str, Any]) -> None:
+        with self._lock:
+            self.interactions.append(interaction)
+
+    @contextlib.contextmanager
+    def record(self, client: "Structurify") -> Iterator["Cassette"]:
+        """
+        Record every exchange the client makes in this block.
+
+        Requests still go to the server. Response bodies are read in full as
+        they arrive, so streamed downloads are not streamed while recording.
+        The cassette is saved when the block ends if it has a path.
+        """
+        with _mounted(client, RecordingAdapter(self, pool_maxsize=_pool_size(client))):
+            yield self
+        if self.path:
+            self.save()
+
+    @contextlib.contextmanager
+    def replay(
+        self, client: "Structurify", latency_scale: float = 1.0, loop: bool = False
+    ) -> Iterator["ReplayAdapter"]:
+        """
+        Serve the client's requests from the cassette in this block.
+
+        Args:
+            client: The client whose transport is replaced
+            latency_scale: Multiplier for recorded latencies (0 for none)
+            loop: Cycle through matching interactions instead of repeating the last one
+        """
+        adapter = ReplayAdapter(self, latency_scale=latency_scale, loop=loop)
+        with _mounted(client, adapter):
+            yield adapter
+
+
+def request_key(method: str, url: str) -> Tuple[str, str]:
+    """Match requests by method, path and query, whatever host they were sent to."""
+    parts = urlsplit(url)
+    return method.upper(), parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+class RecordingAdapter(CancellableAdapter):
+    """Transport that sends requests as usual and records each exchange."""
+
+    def __init__(self, cassette: Cassette, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, stream: bool = False, **kwargs: Any
+    ) -> requests.Response:
+        started = time.monotonic()
+        response = super().send(request, stream=True, **kwargs)
+        first_byte = time.monotonic() - started
+        # Reading here leaves the body in response.content, which iter_content
+        # serves from, so streaming callers still work
+        body = response.content
+        duration = time.monotonic() - started
+
+        self.cassette.append({
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "headers": _headers(request.headers),
+                "body_size": len(_request_body(request)),
+                "body_sha256": hashlib.sha256(_request_body(request)).hexdigest(),
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    name: value for name, value in _headers(response.headers).items()
+                    if name.lower() not in _DROPPED_HEADERS
+                },
+                **_encode_body(body),
+            },
+            "first_byte": round(first_byte, 6),
+            "duration": round(duration, 6),
+        })
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport that answers from a cassette instead of the network.
+
+    Requests are matched by method, path and query. Repeated identical
+    requests get the recorded responses in order, so a polling loop sees
+    the same progression it saw while recording. Each response waits its
+    recorded time to first byte (times latency_scale), and its body is
+    paced over the rest of the recorded duration. Read timeouts and
+    cancellation apply to those waits as they would to a real request.
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0, loop: bool = False):
+        super().__init__()
+        self.latency_scale = latency_scale
+        self.loop = loop
+        self.served = 0
+        self._lock = threading.Lock()
+        self._queues: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        for interaction in cassette.interactions:
+            key = request_key(interaction["request"]["method"], interaction["request"]["url"])
+            self._queues.setdefault(key, deque()).append(interaction)
+
+    def send(  # type: ignore[override]
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        interaction = self._next(request)
+        recorded = interaction["response"]
+
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        first_byte = interaction["first_byte"] * self.latency_scale
+        if read_timeout is not None and first_byte > read_timeout:
+            cancellation.sleep(read_timeout)
+            raise requests.ReadTimeout(
+                f"Replayed response took {first_byte:.3f}s", request=request
+            )
+        cancellation.sleep(first_byte)
+
+        body = _decode_body(recorded)
+        headers = dict(recorded["headers"])
+        headers["Content-Length"] = str(len(body))
+        pace = max(0.0, interaction["duration"] - interaction["first_byte"]) * self.latency_scale
+        raw = HTTPResponse(
+            body=_PacedReader(body, pace),
+            headers=headers,
+            status=recorded["status"],
+            reason=recorded.get("reason"),
+            preload_content=False,
+            decode_content=False,
+        )
+        response = self.build_response(request, raw)
+        if not stream:
+            # Read the body now, paced, as requests does for a live non-streamed response
+            _ = response.content
+        return response
+
+    def _next(self, request: requests.PreparedRequest) -> Dict[str, Any]:
+        method, path = key = request_key(request.method or "GET", request.url or "")
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteMissError(f"No recorded response for {method} {path}")
+            interaction = queue.popleft()
+            if self.loop or not queue:
+                # The last response repeats once the recorded ones run out, like a
+                # server whose state stopped changing
+                queue.append(interaction)
+            self.served += 1
+        return interaction
+
+
+class _PacedReader(io.RawIOBase):
+    """A body that takes `seconds` to read in full, as it did over the network."""
+
+    def __init__(self, data: bytes, seconds: float):
+        self._data = io.BytesIO(data)
+        self._size = max(1, len(data))
+        self._seconds = seconds
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        n = self._data.readinto(buffer)
+        if n and self._seconds:
+            cancellation.sleep(self._seconds * n / self._size)
+        return n
+
+
+@contextlib.contextmanager
+def _mounted(client: "Structurify", adapter: BaseAdapter) -> Iterator[None]:
+    session = client._session
+    previous = {prefix: session.adapters[prefix] for prefix in ("https://", "http://")}
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    try:
+        yield
+    finally:
+        for prefix, original in previous.items():
+            session.mount(prefix, original)
+
+
+def _pool_size(client: "Structurify") -> int:
+    return client._max_connections or 10
+
+
+def _headers(headers: Any) -> Dict[str, str]:
+    return {
+        name: "<redacted>" if name.lower() in _REDACTED_HEADERS else value
+        for name, value in headers.items()
+    }
+
+
+def _request_body(request: requests.PreparedRequest) -> bytes:
+    body = request.body
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    # Streamed bodies (file objects, generators) are not captured
+    return bytes(body) if isinstance(body, (bytes, bytearray)) else b""
+
+
+def _encode_body(body: bytes) -> Dict[str, str]:
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_base64": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(recorded: Dict[str, Any]) -> bytes:
+    if "body_base64" in recorded:
+        return base64.b64decode(recorded["body_base64"])
+    return str(recorded.get("body", "")).encode("utf-8")
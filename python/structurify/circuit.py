@@ -0,0 +1,201 @@
+"""
+Circuit Breakers
+
+Per-endpoint-group circuit breakers that fail fast while part of the API is
+down. Each group (the first path segment, e.g. "extraction-jobs") has its
+own breaker, so an extraction outage does not block templates or projects.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from structurify.exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    A single closed → open → half-open circuit breaker.
+
+    Consecutive failures (5xx responses, connection errors and timeouts,
+    except timeouts the client shortened to fit a deadline) open the
+    circuit. After recovery_timeout, up to half_open_probes requests are let
+    through; if they succeed the circuit closes, otherwise it opens again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_at = now
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.times_opened += 1
+
+    def before_request(self) -> bool:
+        """
+        Admit a request or fail fast.
+
+        Returns:
+            True if the request takes a half-open probe slot. The slot is freed
+            by record_success, record_failure or, if neither applies, release_probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all probes in flight
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN:
+                remaining = self._opened_at + self.recovery_timeout - now
+                if remaining > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(group=self.name, retry_after=remaining)
+                self.state = HALF_OPEN
+                self._probes_in_flight = 0
+                self._probe_successes = 0
+                self._opened_at = now
+
+            if self.state == HALF_OPEN:
+                # A probe that never reported back frees its slot after recovery_timeout
+                if now - self._opened_at > self.recovery_timeout:
+                    self._probes_in_flight = 0
+                    self._opened_at = now
+                if self._probes_in_flight >= self.half_open_probes:
+                    self.rejected += 1
+                    raise CircuitOpenError(group=self.name, retry_after=self.recovery_timeout)
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def release_probe(self) -> None:
+        """Free a probe slot whose request ended without telling anything about the endpoint."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy endpoint."""
+        with self._lock:
+            self.consecutive_failures = 0
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self.state = CLOSED
+
+    def record_failure(self) -> None:
+        """Record a server error, connection error or timeout."""
+        with self._lock:
+            self.consecutive_failures += 1
+            now = time.monotonic()
+            if self.state == HALF_OPEN:
+                self._open(now)
+            elif self.state == CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._open(now)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current state and counters."""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakers:
+    """
+    Registry of circuit breakers keyed by endpoint group.
+
+    Example:
+        client = Structurify(api_key="sk_live_xxx", circuit_breakers=CircuitBreakers())
+
+        try:
+            client.extraction.get(job_id)
+        except CircuitOpenError as e:
+            print(f"{e.group} is down, retry in {e.retry_after:.0f}s")
+
+        print(client.circuit_breakers.metrics())
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open a group's circuit
+            recovery_timeout: Seconds an open circuit waits before probing
+            half_open_probes: Successful probes required to close the circuit
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._owner_pid = os.getpid()
+
+    def _after_fork(self) -> None:
+        # Locks held by other threads at fork time stay held in the child;
+        # breaker states carry over
+        if self._owner_pid == os.getpid():
+            return
+        self._owner_pid = os.getpid()
+        self._lock = threading.Lock()
+        for breaker in self._breakers.values():
+            breaker._lock = threading.Lock()
+
+    @staticmethod
+    def group_for(path: str) -> str:
+        """Return the endpoint group for an API path ("/exports/x/download" → "exports")."""
+        return path.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+
+    def for_path(self, path: str) -> CircuitBreaker:
+        """Return the breaker guarding an API path."""
+        group = self.group_for(path)
+        with self._lock:
+            breaker = self._breakers.get(group)
+            if breaker is None:
+                breaker = self._breakers[group] = CircuitBreaker(
+                    group,
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_probes=self.half_open_probes,
+                )
+            return breaker
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """State and counters for every group seen so far."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {b.name: b.metrics() for b in breakers}
@@ -0,0 +1,353 @@
+"""
+Structurify Command-Line Interface
+
+Bulk operations from the shell, built on the same client, connection pool
+and rate limiter as the Python SDK.
+
+Usage:
+    structurify upload ./scans --project proj_xxx --concurrency 16
+    structurify upload ./scans --project proj_xxx --concurrency auto
+    structurify extract --project proj_xxx --wait
+    structurify export --project proj_xxx --stream-to results.ndjson
+    structurify cleanup --project proj_xxx --older-than 30d
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Union
+
+from structurify.autotune import AdaptiveConcurrency
+from structurify.bulk import BulkProgress, BulkResult
+from structurify.client import Structurify
+from structurify.exceptions import StructurifyError
+from structurify.preflight import Preflight
+from structurify.preprocessing import Preprocessor
+from structurify.resources.documents import collect_files
+from structurify.resources.exports import iter_records
+from structurify.retention import sweep
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_duration(value: str) -> timedelta:
+    """
+    Parse a duration such as "90s", "15m", "12h", "30d" or "2w".
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a valid duration
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*", value)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid duration: {value!r} (expected e.g. 30d, 12h)")
+    return timedelta(seconds=float(match.group(1)) * _DURATION_UNITS[match.group(2)])
+
+
+def parse_concurrency(value: str) -> Union[int, AdaptiveConcurrency]:
+    """
+    Parse a concurrency: a positive number, or "auto" to tune it while running.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is neither
+    """
+    if value.strip().lower() == "auto":
+        return AdaptiveConcurrency()
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(
+            f"invalid concurrency: {value!r} (expected e.g. 8 or auto)"
+        )
+    return parsed
+
+
+def _format_bytes(count: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if count < 1024 or unit == "GB":
+            return f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+
+class ProgressPrinter:
+    """Renders a single, throttled progress line for a bulk operation."""
+
+    def __init__(self, label: str, stream: Optional[TextIO] = None, quiet: bool = False):
+        self._label = label
+        self._stream = stream or sys.stderr
+        self._quiet = quiet
+        self._last = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, progress: BulkProgress) -> None:
+        if self._quiet:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if progress.completed < progress.total and now - self._last < 0.2:
+                return
+            self._last = now
+            line = (
+                f"\r{self._label}: {progress.completed}/{progress.total}"
+                f" ({progress.failed} failed)"
+                f" {progress.items_per_second:.1f}/s"
+            )
+            if progress.bytes:
+                line += f" {_format_bytes(progress.bytes_per_second)}/s"
+            self._stream.write(line)
+            if progress.completed >= progress.total:
+                self._stream.write("\n")
+            self._stream.flush()
+
+
+def _report_failures(results: List[BulkResult]) -> int:
+    failures = [r for r in results if not r.ok]
+    for result in failures:
+        sys.stderr.write(f"failed: {result.key}: {result.error}\n")
+    return 1 if failures else 0
+
+
+def _cmd_upload(client: Structurify, args: argparse.Namespace) -> int:
+    paths = collect_files(args.directory, args.recursive)
+    if not paths:
+        sys.stderr.write(f"no supported files found in {args.directory}\n")
+        return 1
+
+    preflight = None if args.no_preflight else Preflight(max_size=args.max_size)
+    preprocessor = Preprocessor(max_workers=args.preprocess_workers) if args.preprocess else None
+    try:
+        results = client.documents.upload_many(
+            args.project,
+            paths,
+            concurrency=args.concurrency,
+            on_progress=ProgressPrinter("upload", quiet=args.quiet),
+            preprocessor=preprocessor,
+            preflight=preflight,
+        )
+    finally:
+        if preprocessor:
+            preprocessor.close()
+
+    if isinstance(args.concurrency, AdaptiveConcurrency) and not args.quiet:
+        tuner = args.concurrency
+        sys.stderr.write(f"concurrency: settled at {tuner.limit} (peak {tuner.peak_limit})\n")
+    if preprocessor and not args.quiet:
+        saved = sum(r.bytes_saved for r in preprocessor.reports)
+        sys.stderr.write(f"preprocess: saved {_format_bytes(saved)}\n")
+    return _report_failures(results)
+
+
+def _cmd_extract(client: Structurify, args: argparse.Namespace) -> int:
+    job = client.extraction.run(args.project)
+    job_id = job.get("id", "")
+    print(job_id)
+
+    if not args.wait:
+        return 0
+
+    def show(job: Dict[str, Any]) -> None:
+        if not args.quiet:
+            sys.stderr.write(
+                f"\rextract: {job.get('status', '')} {job.get('completedTasks', 0)}"
+                f"/{job.get('totalTasks', 0)} ({job.get('progress', 0)}%)"
+            )
+            sys.stderr.flush()
+
+    try:
+        job = client.extraction.wait_for_completion(
+            job_id, timeout=args.wait_timeout, poll_interval=args.poll_interval, on_poll=show
+        )
+    except TimeoutError:
+        sys.stderr.write(f"\njob {job_id} did not complete within {args.wait_timeout}s\n")
+        return 1
+    status = job.get("status", "")
+
+    if not args.quiet:
+        sys.stderr.write("\n")
+    return 0 if status == "done" else 1
+
+
+def _cmd_export(client: Structurify, args: argparse.Namespace) -> int:
+    fmt = args.format or ("csv" if args.stream_to.endswith(".csv") else "json")
+    export = client.exports.create(args.project, format=fmt)
+
+    count = 0
+    export_id: Optional[str] = None
+    if "data" not in export:
+        export_id = export.get("export", {}).get("id") or export.get("id")
+        if not export_id:
+            raise StructurifyError("export response has neither data nor an export ID")
+
+    if fmt == "csv":
+        if export_id is not None:
+            client.exports.download_to(export_id, args.stream_to)
+        else:
+            data = export["data"]
+            with open(args.stream_to, "w", encoding="utf-8") as f:
+                f.write(data if isinstance(data, str) else json.dumps(data))
+    else:
+        # Large exports are written record by record as they download
+        records = (
+            client.exports.stream_records(export_id) if export_id is not None
+            else iter_records(export["data"])
+        )
+        with open(args.stream_to, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")))
+                f.write("\n")
+                count += 1
+
+    if not args.quiet:
+        written = "csv" if fmt == "csv" else f"{count} records"
+        sys.stderr.write(f"export: wrote {written} to {args.stream_to}\n")
+    return 0
+
+
+def _cmd_cleanup(client: Structurify, args: argparse.Namespace) -> int:
+    printers = {
+        kind: ProgressPrinter(f"delete {kind}", quiet=args.quiet)
+        for kind in ("exports", "documents")
+    }
+    report = sweep(
+        client,
+        args.older_than,
+        project_ids=[args.project],
+        documents=args.documents,
+        dry_run=args.dry_run,
+        concurrency=args.concurrency,
+        on_progress=lambda kind, progress: printers[kind](progress),
+    )
+
+    if args.dry_run:
+        for result in report.exports:
+            print(f"export {result.key}")
+        for result in report.documents:
+            print(f"document {result.key}")
+        return 0
+    return _report_failures(report.errors + report.exports + report.documents)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the structurify command."""
+    parser = argparse.ArgumentParser(
+        prog="structurify",
+        description="Bulk operations against the Structurify API.",
+    )
+    parser.add_argument(
+        "--api-key",
+        default=os.environ.get("STRUCTURIFY_API_KEY"),
+        help="API key (default: $STRUCTURIFY_API_KEY)",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=os.environ.get("STRUCTURIFY_BASE_URL"),
+        help="API base URL (default: $STRUCTURIFY_BASE_URL or production)",
+    )
+    parser.add_argument("--timeout", type=int, default=None, help="Per-request timeout in seconds")
+    parser.add_argument("--max-retries", type=int, default=None, help="Retries per request")
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Client-side limit in requests per second",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Compress request bodies (uploads)",
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="Suppress progress output")
+
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    upload = commands.add_parser("upload", help="Upload every supported file in a directory")
+    upload.add_argument("directory")
+    upload.add_argument("--project", required=True)
+    upload.add_argument(
+        "--concurrency",
+        type=parse_concurrency,
+        default=8,
+        help='Uploads in flight, or "auto" to tune from latency and errors',
+    )
+    upload.add_argument("-r", "--recursive", action="store_true")
+    upload.add_argument(
+        "--preprocess",
+        action="store_true",
+        help="Downsample images and recompress PDFs before upload (needs structurify[preprocess])",
+    )
+    upload.add_argument("--preprocess-workers", type=int, default=None, metavar="N")
+    upload.add_argument("--max-size", type=int, default=None, metavar="BYTES",
+                        help="Reject larger files locally")
+    upload.add_argument("--no-preflight", action="store_true",
+                        help="Skip local validation of file type and integrity")
+    upload.set_defaults(func=_cmd_upload)
+
+    extract = commands.add_parser("extract", help="Run extraction for a project")
+    extract.add_argument("--project", required=True)
+    extract.add_argument("--wait", action="store_true", help="Wait for the job to finish")
+    extract.add_argument("--timeout", dest="wait_timeout", type=float, default=3600.0,
+                         help="Seconds to wait for the job (the global --timeout is per request)")
+    extract.add_argument("--poll-interval", type=float, default=2.0)
+    extract.set_defaults(func=_cmd_extract)
+
+    export = commands.add_parser("export", help="Export project results to a file")
+    export.add_argument("--project", required=True)
+    export.add_argument("--stream-to", required=True, metavar="FILE")
+    export.add_argument("--format", choices=["json", "csv"], default=None)
+    export.set_defaults(func=_cmd_export)
+
+    cleanup = commands.add_parser("cleanup", help="Delete old exports (and optionally documents)")
+    cleanup.add_argument("--project", required=True)
+    cleanup.add_argument("--older-than", type=parse_duration, required=True, metavar="AGE")
+    cleanup.add_argument("--documents", action="store_true", help="Also delete old documents")
+    cleanup.add_argument("--concurrency", type=int, default=8)
+    cleanup.add_argument("--dry-run", action="store_true")
+    cleanup.set_defaults(func=_cmd_cleanup)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for the structurify command."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        parser.error("an API key is required (--api-key or STRUCTURIFY_API_KEY)")
+
+    concurrency = getattr(args, "concurrency", None)
+    if isinstance(concurrency, AdaptiveConcurrency):
+        concurrency = concurrency.max_limit
+    client = Structurify(
+        api_key=args.api_key,
+        base_url=args.base_url,
+        timeout=args.timeout,
+        max_retries=args.max_retries,
+        rate_limit=args.rate_limit,
+        max_connections=concurrency,
+        compression=args.compression,
+    )
+
+    try:
+        return int(args.func(client, args))
+    except StructurifyError as e:
+        sys.stderr.write(f"error: {e}\n")
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,10 @@ Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
 Licensed under the MIT License.
 """
 
+import os
 import time
-from typing import Optional, Dict, Any
+from typing import ContextManager, List, Literal, Optional, Dict, Any, Type, Union, overload
+from urllib.parse import urlencode
 import requests
 
 from structurify.exceptions import (
@@ -19,7 +21,23 @@ from structurify.exceptions import (
     ValidationError,
     InsufficientCreditsError,
     ServerError,
+    DeadlineExceededError,
+    CircuitOpenError,
+    OperationCancelledError,
 )
+from structurify.cache import DocumentCache
+from structurify.cancellation import CancellableAdapter, CancellationToken
+from structurify.config import ClientConfig
+from structurify.circuit import CircuitBreakers
+from structurify.codec import JsonCodec, get_codec
+from structurify import cancellation, deadlines
+from structurify.credits import CREDITS_HEADER
+from structurify.hedging import HedgePolicy
+from structurify.models import Model, decode_list
+from structurify.compression import DEFAULT_THRESHOLD, accept_encoding, compress
+from structurify.ratelimit import HostRateLimiter, RateLimiter, RateLimitStatus
+from structurify.scheduler import RequestScheduler, priority as _priority
+from structurify.singleflight import SingleFlight
 from structurify.resources.templates import TemplatesResource
 from structurify.resources.projects import ProjectsResource
 from structurify.resources.documents import DocumentsResource
@@ -48,6 +66,20 @@ class Structurify:
         base_url: Optional[str] = None,
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
+        rate_limit: Optional[Union[float, RateLimiter]] = None,
+        max_connections: Optional[int] = None,
+        compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_THRESHOLD,
+        coalesce_reads: bool = False,
+        document_cache: Optional[DocumentCache] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        hedging: Optional[HedgePolicy] = None,
+        typed_models: bool = False,
+        json_codec: Union[str, JsonCodec] = "auto",
+        deadline: Optional[float] = None,
+        http2: bool = False,
+        retry_rate_limits: bool = True,
     ):
         """
         Initialize the Structurify client.
@@ -57,21 +89,75 @@ class Structurify:
             base_url: Optional custom API base URL
             timeout: Request timeout in seconds (default 30)
             max_retries: Maximum number of retries for failed requests (default 3)
+            rate_limit: Optional client-side limit in requests per second, or a
+                RateLimiter shared with other clients (a HostRateLimiter is shared
+                with other processes too)
+            max_connections: Connections kept in the pool per host (default 10).
+                Raise this to match the concurrency of bulk operations.
+            compression: Optional request body compression ("gzip" or "zstd").
+                Disabled automatically if the server answers 415.
+            compression_threshold: Smallest JSON body, in bytes, that is compressed
+            coalesce_reads: Share one HTTP call between concurrent identical GETs.
+                Merged callers receive the same parsed result object.
+            document_cache: Optional on-disk cache used by documents.download
+            circuit_breakers: Optional per-endpoint-group circuit breakers that
+                raise CircuitOpenError immediately while a group is failing
+            scheduler: Optional RequestScheduler that admits requests by priority
+                lane ("interactive", "normal", "bulk") within a shared
+                concurrency and rate budget
+            hedging: Optional HedgePolicy that re-sends slow GETs and uses
+                whichever response arrives first
+            typed_models: Return compact Document, Project, Job, Export and
+                Template models (read-only, dict-compatible) instead of dicts
+            json_codec: JSON codec for request and response bodies: "auto"
+                (orjson or msgspec if installed, else the standard library),
+                "orjson", "msgspec", "json", or a JsonCodec instance
+            deadline: Optional limit in seconds on the total time of each call,
+                across attempts, retries and backoff. A tighter deadline set
+                with client.deadline() takes precedence.
+            http2: Send requests over multiplexed HTTP/2 connections (needs
+                structurify[http2]). Uploads keep dedicated HTTP/1.1 connections.
+            retry_rate_limits: Retry requests answered 429 (after Retry-After).
+                Disable to raise RateLimitError at once, e.g. so that a
+                StructurifyPool can move the call to another key.
         """
         if not api_key:
             raise ValueError("API key is required")
+        if compression is not None:
+            # Fail fast on an unknown or unavailable encoding
+            compress(b"", compression)
 
         self._api_key = api_key
         self._base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self._timeout = timeout or self.DEFAULT_TIMEOUT
         self._max_retries = max_retries if max_retries is not None else self.MAX_RETRIES
-
-        self._session = requests.Session()
-        self._session.headers.update({
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "structurify-python/1.0.0",
-        })
+        self._compression = compression
+        self._compression_threshold = compression_threshold
+        self._max_connections = max_connections
+        self._typed_models = typed_models
+        self._codec = get_codec(json_codec)
+        self._deadline = deadline
+        self._http2 = http2
+        self._retry_rate_limits = retry_rate_limits
+
+        self._singleflight = SingleFlight() if coalesce_reads else None
+        self.document_cache = document_cache
+        self.circuit_breakers = circuit_breakers
+        self.scheduler = scheduler
+        self.hedging = hedging
+
+        # Latest X-RateLimit-* values reported by the server, if any
+        self.rate_limit_status: Optional[RateLimitStatus] = None
+        # Latest credit balance reported by the server, if any
+        self.credits_remaining: Optional[int] = None
+
+        if isinstance(rate_limit, RateLimiter) or rate_limit is None:
+            self._rate_limiter = rate_limit
+        else:
+            self._rate_limiter = RateLimiter(rate_limit)
+
+        self._pid = os.getpid()
+        self._session = self._new_session()
 
         # Initialize resource handlers
         self.templates = TemplatesResource(self)
@@ -80,6 +166,122 @@ class Structurify:
         self.extraction = ExtractionResource(self)
         self.exports = ExportsResource(self)
 
+    @classmethod
+    def from_config(cls, config: ClientConfig, **kwargs: Any) -> "Structurify":
+        """
+        Create a client from a ClientConfig.
+
+        Args:
+            config: Picklable client settings
+            **kwargs: Extra constructor arguments, e.g. a document_cache
+        """
+        return cls(**config.to_kwargs(), **kwargs)
+
+    @property
+    def config(self) -> ClientConfig:
+        """
+        Picklable settings that recreate this client in another process.
+
+        Shared objects (caches, circuit breakers, schedulers, hedging) are not
+        included. A RateLimiter is reduced to its rate; a HostRateLimiter is
+        kept, since every process attaches to the same bucket.
+        """
+        rate_limit: Optional[Union[float, HostRateLimiter]] = None
+        if isinstance(self._rate_limiter, HostRateLimiter):
+            rate_limit = self._rate_limiter
+        elif self._rate_limiter:
+            rate_limit = self._rate_limiter.rate
+        return ClientConfig(
+            api_key=self._api_key,
+            base_url=self._base_url,
+            timeout=self._timeout,
+            max_retries=self._max_retries,
+            rate_limit=rate_limit,
+            max_connections=self._max_connections,
+            compression=self._compression,
+            compression_threshold=self._compression_threshold,
+            coalesce_reads=self._singleflight is not None,
+            typed_models=self._typed_models,
+            json_codec=self._codec.name,
+            deadline=self._deadline,
+            http2=self._http2,
+            retry_rate_limits=self._retry_rate_limits,
+        )
+
+    def _as_model(self, model: Type[Model], data: Any) -> Any:
+        """Wrap an API object in its model when typed_models is enabled."""
+        if self._typed_models and isinstance(data, dict):
+            return model.from_dict(data)
+        return data
+
+    def _as_models(self, model: Type[Model], items: List[Any]) -> List[Any]:
+        """Wrap a list of API objects in their model when typed_models is enabled."""
+        if self._typed_models:
+            return decode_list(model, items)
+        return items
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        # Lets a CancellationToken abort requests that are already on the wire
+        if self._max_connections:
+            adapter = CancellableAdapter(
+                pool_connections=self._max_connections, pool_maxsize=self._max_connections
+            )
+        else:
+            adapter = CancellableAdapter()
+        session.mount("http://", adapter)
+        if self._http2:
+            from structurify.http2 import Http2Adapter
+
+            # HTTP/2 is negotiated over TLS, so plain http:// stays on HTTP/1.1
+            session.mount(
+                "https://", Http2Adapter(max_connections=self._max_connections, fallback=adapter)
+            )
+        else:
+            session.mount("https://", adapter)
+        session.headers.update({
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "structurify-python/1.0.0",
+            "Accept-Encoding": accept_encoding(),
+        })
+        return session
+
+    def _check_fork(self) -> None:
+        """Rebuild the transport if this process was forked from the one that created it."""
+        pid = os.getpid()
+        if pid == self._pid:
+            return
+        # Pooled sockets belong to the parent; using them here would interleave
+        # both processes' traffic on one connection. Threads and locks held by
+        # other threads do not survive a fork either.
+        self._session = self._new_session()
+        if self._singleflight is not None:
+            self._singleflight = SingleFlight()
+        # Shared objects may be reached through several clients; each resets
+        # itself once per process
+        for shared in (
+            self._rate_limiter, self.scheduler, self.circuit_breakers, self.document_cache,
+            self.hedging,
+        ):
+            if shared is not None:
+                shared._after_fork()
+        self._pid = pid
+
+    @overload
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        files: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: Literal[False] = False,
+    ) -> Dict[str, Any]: ...
+
+    @overload
     def _request(
         self,
         method: str,
@@ -89,7 +291,21 @@ class Structurify:
         data: Optional[Any] = None,
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        *,
+        stream: Literal[True],
+    ) -> requests.Response: ...
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        files: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> Any:
         """
         Make an HTTP request to the API.
 
@@ -101,16 +317,21 @@ class Structurify:
             data: Form data
             files: File uploads
             headers: Additional headers
+            stream: Return the successful response unread instead of parsing it
 
         Returns:
-            Response JSON as dictionary
+            Response JSON as dictionary, or the requests.Response when stream is set
 
         Raises:
             StructurifyError: On API errors
         """
+        self._check_fork()
         url = f"{self._base_url}{path}"
 
-        request_headers = dict(self._session.headers)
+        # Session headers are all set by this client, as text
+        request_headers: Dict[str, str] = {
+            k: v for k, v in self._session.headers.items() if isinstance(v, str)
+        }
         if headers:
             request_headers.update(headers)
 
@@ -118,44 +339,196 @@ class Structurify:
         if files:
             request_headers.pop("Content-Type", None)
 
+        body = data
+        uncompressed: Optional[bytes] = None
+        if json is not None:
+            # Encode once, straight to bytes, instead of letting requests re-encode
+            uncompressed = self._codec.dumps(json)
+            body = self._compress_body(uncompressed, request_headers)
+            json = None
+
+        breaker = self.circuit_breakers.for_path(path) if self.circuit_breakers else None
         last_error: Optional[Exception] = None
 
+        at = self._call_deadline()
+
         for attempt in range(self._max_retries + 1):
-            try:
-                response = self._session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json,
-                    data=data,
-                    files=files,
-                    headers=request_headers,
-                    timeout=self._timeout,
-                )
+            cancellation.check()
+            left = deadlines.remaining(at)
+            if left is not None and left <= 0:
+                raise DeadlineExceededError(f"Deadline exceeded before {method} {path}")
+
+            lane = None
+            admitted = True
+            if self.scheduler:
+                lane = self.scheduler.acquire(rate_limiter=self._rate_limiter, timeout=left)
+                admitted = lane is not None
+            elif self._rate_limiter:
+                admitted = self._rate_limiter.acquire(timeout=left)
+            if not admitted:
+                raise DeadlineExceededError(f"Deadline exceeded waiting to send {method} {path}")
+
+            # Taken once admitted, so that a half-open probe slot is only held
+            # while the probe is actually being sent
+            probe = False
+            if breaker:
+                try:
+                    probe = breaker.before_request()
+                except CircuitOpenError:
+                    if self.scheduler is not None and lane is not None:
+                        self.scheduler.release(lane)
+                    raise
+
+            # Connect and read timeouts never run past the deadline
+            timeout: float = self._timeout
+            left = deadlines.remaining(at)
+            if left is not None:
+                timeout = max(0.001, min(timeout, left))
 
+            try:
+                try:
+                    response = self._session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=json,
+                        data=body,
+                        files=files,
+                        headers=request_headers,
+                        timeout=timeout,
+                        stream=stream,
+                    )
+
+                    if response.status_code == 415 and "Content-Encoding" in request_headers:
+                        # Server does not accept compressed bodies; stop sending them
+                        self._compression = None
+                        del request_headers["Content-Encoding"]
+                        body = uncompressed
+                        response = self._session.request(
+                            method=method,
+                            url=url,
+                            params=params,
+                            data=body,
+                            headers=request_headers,
+                            timeout=timeout,
+                            stream=stream,
+                        )
+                finally:
+                    if self.scheduler is not None and lane is not None:
+                        self.scheduler.release(lane)
+
+                if breaker:
+                    probe = False
+                    if response.status_code >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+
+                status = RateLimitStatus.from_headers(response.headers)
+                if status:
+                    self.rate_limit_status = status
+                credits = response.headers.get(CREDITS_HEADER)
+                if credits is not None and credits.isdigit():
+                    self.credits_remaining = int(credits)
+                elif response.status_code == 402:
+                    self.credits_remaining = 0
+
+                if stream and response.status_code in (200, 201):
+                    return response
                 return self._handle_response(response)
 
             except RateLimitError as e:
                 last_error = e
-                if attempt < self._max_retries:
-                    retry_after = e.retry_after or (self.RETRY_DELAY * (2 ** attempt))
-                    time.sleep(retry_after)
+                if self._rate_limiter:
+                    self._rate_limiter.record_rate_limited(e.retry_after)
+                if attempt < self._max_retries and self._retry_rate_limits:
+                    if e.retry_after:
+                        # The server will not accept a request sooner, so the wait can't be cut
+                        self._backoff(float(e.retry_after), at, e, required=True)
+                    else:
+                        self._backoff(self.RETRY_DELAY * (2 ** attempt), at, e)
                     continue
                 raise
 
             except (requests.ConnectionError, requests.Timeout) as e:
                 last_error = e
+                if _cancelled():
+                    # The socket was shut down by the token, not by a network fault
+                    raise OperationCancelledError(
+                        f"Operation cancelled during {method} {path}"
+                    ) from e
+                if breaker:
+                    if isinstance(e, requests.Timeout) and timeout < self._timeout:
+                        # A timeout cut short to fit the deadline says nothing about the endpoint
+                        if probe:
+                            breaker.release_probe()
+                    else:
+                        breaker.record_failure()
+                    probe = False
+                left = deadlines.remaining(at)
+                if left is not None and left <= 0:
+                    raise DeadlineExceededError(
+                        f"Deadline exceeded during {method} {path}: {e}"
+                    ) from e
                 if attempt < self._max_retries:
-                    time.sleep(self.RETRY_DELAY * (2 ** attempt))
+                    self._backoff(self.RETRY_DELAY * (2 ** attempt), at, e)
                     continue
                 raise StructurifyError(f"Connection error: {str(e)}")
 
+            except requests.RequestException as e:
+                if _cancelled():
+                    raise OperationCancelledError(
+                        f"Operation cancelled during {method} {path}"
+                    ) from e
+                raise
+
+            finally:
+                if breaker and probe:
+                    # The attempt ended (cancelled, or a cassette miss) without an outcome
+                    breaker.release_probe()
+
         raise last_error or StructurifyError("Request failed")
 
+    def _call_deadline(self) -> Optional[float]:
+        """The deadline for a call: the tighter of the context's and the client default."""
+        at = deadlines.current_deadline()
+        if self._deadline is not None:
+            own = time.monotonic() + self._deadline
+            at = own if at is None else min(at, own)
+        return at
+
+    def _backoff(
+        self, delay: float, at: Optional[float], error: Exception, required: bool = False
+    ) -> None:
+        """
+        Sleep before a retry without running past the deadline.
+
+        A required delay (Retry-After) that does not fit skips the retry. Other
+        delays are shortened so that half of the remaining time is left for
+        the next attempt.
+        """
+        left = deadlines.remaining(at)
+        if left is not None:
+            if required and delay >= left:
+                raise DeadlineExceededError(
+                    f"Deadline exceeded: retry needs a {delay:.1f}s wait, "
+                    f"{max(0.0, left):.1f}s left"
+                ) from error
+            delay = min(delay, left / 2)
+        cancellation.sleep(delay)
+
+    def _compress_body(self, body: bytes, headers: Dict[str, str]) -> bytes:
+        """Compress an encoded JSON body if it is over the threshold."""
+        headers["Content-Type"] = "application/json"
+        if self._compression and len(body) >= self._compression_threshold:
+            headers["Content-Encoding"] = self._compression
+            return compress(body, self._compression)
+        return body
+
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response and raise appropriate exceptions."""
         try:
-            data = response.json()
+            data = self._codec.loads(response.content)
         except ValueError:
             data = {"error": "InvalidResponse", "message": response.text}
 
@@ -197,7 +570,21 @@ class Structurify:
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a GET request."""
-        return self._request("GET", path, params=params)
+        self._check_fork()
+
+        def send() -> Dict[str, Any]:
+            if self.hedging is not None:
+                return self.hedging.run(
+                    path,
+                    lambda: self._request("GET", path, params=params),
+                    at=self._call_deadline(),
+                )
+            return self._request("GET", path, params=params)
+
+        if self._singleflight is not None:
+            key = f"{path}?{urlencode(sorted((params or {}).items()), doseq=True)}"
+            return self._singleflight.do(key, send, at=self._call_deadline())
+        return send()
 
     def post(
         self,
@@ -216,3 +603,65 @@ class Structurify:
     def delete(self, path: str) -> Dict[str, Any]:
         """Make a DELETE request."""
         return self._request("DELETE", path)
+
+    def deadline(self, seconds: float) -> ContextManager[float]:
+        """
+        Bound every call made in this block to finish within seconds in total.
+
+        Covers connecting, reading, waiting for rate-limit slots, retries and
+        backoff. Calls that cannot finish in time raise DeadlineExceededError.
+        The deadline follows the current thread or task (bulk helpers carry
+        it into their worker threads), and nested deadlines only shorten it.
+
+        Example:
+            with client.deadline(2.0):
+                job = client.extraction.get(job_id)
+        """
+        return deadlines.deadline(seconds)
+
+    def cancellable(
+        self, token: Optional[CancellationToken] = None
+    ) -> ContextManager[Optional[CancellationToken]]:
+        """
+        Make every call made in this block stop when token is cancelled.
+
+        Cancelling the token aborts requests in flight, wakes retries, rate
+        limit waits and polling loops, and makes further calls raise
+        OperationCancelledError. The token follows the current thread or task
+        (bulk helpers carry it into their worker threads).
+
+        Example:
+            token = CancellationToken()
+            with client.cancellable(token):
+                client.documents.upload_many("proj_xxx", paths)
+        """
+        return cancellation.cancellable(token)
+
+    def priority(self, lane: str) -> ContextManager[None]:
+        """
+        Send every request made in this block through a scheduler priority lane.
+
+        Has no effect unless the client was created with a scheduler. The
+        priority follows the current thread or task (bulk helpers carry it
+        into their worker threads).
+
+        Example:
+            with client.priority("interactive"):
+                job = client.extraction.get(job_id)
+        """
+        return _priority(lane)
+
+    def stream(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Make a GET request and return the response without reading the body.
+
+        The body is decompressed incrementally as it is iterated. Close the
+        response (or use it as a context manager) when done.
+        """
+        response: requests.Response = self._request("GET", path, params=params, stream=True)
+        return response
+
+
+def _cancelled() -> bool:
+    token = cancellation.current_token()
+    return token is not None and token.cancelled
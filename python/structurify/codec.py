@@ -0,0 +1,115 @@
+"""
+JSON Codecs
+
+Encodes request bodies straight to bytes and decodes responses from bytes,
+using orjson or msgspec when installed and the standard library otherwise.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class JsonCodec:
+    """Standard library codec, always available."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode JSON.
+
+        Raises:
+            ValueError: If data is not valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "orjson is required for the orjson codec. "
+                "Install it with: pip install structurify[speedups]"
+            ) from e
+        self._dumps: Callable[[Any], bytes] = orjson.dumps
+        self._loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError is a ValueError
+        return self._loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """Codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError as e:
+            raise ImportError(
+                "msgspec is required for the msgspec codec. "
+                "Install it with: pip install msgspec"
+            ) from e
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._error as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JsonCodec,
+}
+
+
+def get_codec(name: Optional[Union[str, JsonCodec]] = "auto") -> JsonCodec:
+    """
+    Return a codec by name.
+
+    Args:
+        name: "auto" (fastest installed), "orjson", "msgspec", "json", or a codec instance
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named codec's library is not installed
+    """
+    if isinstance(name, JsonCodec):
+        return name
+    if name is None or name == "auto":
+        for fastest in (OrjsonCodec, MsgspecCodec):
+            try:
+                return fastest()
+            except ImportError:
+                continue
+        return JsonCodec()
+    factory = CODECS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown JSON codec {name!r}; expected one of {sorted(CODECS)}")
+    return factory()
@@ -0,0 +1,70 @@
+"""
+HTTP Body Compression
+
+Request body encoders and the Accept-Encoding value advertised for
+responses. Response bodies are decoded incrementally by urllib3, so
+streamed downloads never hold the full compressed payload in memory.
+
+zstd request bodies require the zstandard package:
+
+    pip install structurify[compression]
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import gzip
+from typing import Callable, Dict
+
+import urllib3.response
+
+DEFAULT_THRESHOLD = 1024
+
+
+def _gzip(body: bytes) -> bytes:
+    # Level 6 trades a little ratio for much faster compression of large uploads
+    return gzip.compress(body, compresslevel=6)
+
+
+def _zstd(body: bytes) -> bytes:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstandard is required for zstd compression: pip install structurify[compression]"
+        ) from e
+    return zstandard.ZstdCompressor(level=3).compress(body)
+
+
+ENCODERS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": _gzip,
+    "zstd": _zstd,
+}
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a request body.
+
+    Args:
+        body: Encoded request body
+        encoding: Content-Encoding to apply ("gzip" or "zstd")
+
+    Raises:
+        ValueError: If the encoding is not supported
+    """
+    try:
+        encoder = ENCODERS[encoding]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported compression {encoding!r}; expected one of {sorted(ENCODERS)}"
+        ) from None
+    return encoder(body)
+
+
+def accept_encoding() -> str:
+    """Return the Accept-Encoding header value for the encodings urllib3 can decode."""
+    encodings = ["gzip", "deflate"]
+    if getattr(urllib3.response, "HAS_ZSTD", False):
+        encodings.insert(0, "zstd")
+    return ", ".join(encodings)
@@ -0,0 +1,50 @@
+"""
+Client Configuration
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Union
+
+from structurify.compression import DEFAULT_THRESHOLD
+from structurify.ratelimit import HostRateLimiter
+
+
+@dataclass(frozen=True)
+class ClientConfig:
+    """
+    Picklable client settings, for building clients in worker processes.
+
+    Example:
+        config = client.config
+        # ... in a worker process:
+        worker_client = Structurify.from_config(config)
+    """
+
+    api_key: str
+    base_url: Optional[str] = None
+    timeout: Optional[int] = None
+    max_retries: Optional[int] = None
+    rate_limit: Optional[Union[float, HostRateLimiter]] = None
+    max_connections: Optional[int] = None
+    compression: Optional[str] = None
+    compression_threshold: int = DEFAULT_THRESHOLD
+    coalesce_reads: bool = False
+    typed_models: bool = False
+    json_codec: str = "auto"
+    deadline: Optional[float] = None
+    http2: bool = False
+    retry_rate_limits: bool = True
+
+    def to_kwargs(self) -> Dict[str, Any]:
+        """Constructor arguments for Structurify."""
+        return asdict(self)
+
+    def __repr__(self) -> str:
+        # Keep the API key out of logs and tracebacks
+        fields = ", ".join(
+            f"{k}={'***' if k == 'api_key' else repr(v)}" for k, v in asdict(self).items()
+        )
+        return f"ClientConfig({fields})"
@@ -0,0 +1,221 @@
+"""
+Credit-aware Extraction Scheduling
+
+Sizes extraction waves to the credits available instead of discovering an
+empty balance one 402 at a time. Work that does not fit stays queued and
+resumes automatically when credits are replenished.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional
+
+from structurify import cancellation
+from structurify.exceptions import InsufficientCreditsError, StructurifyError
+
+if TYPE_CHECKING:
+    from structurify.client import Structurify
+
+# Response header carrying the organization's remaining credits, when reported
+CREDITS_HEADER = "X-Credits-Remaining"
+
+
+@dataclass
+class ScheduledExtraction:
+    """A queued extraction and, once started, its job or error."""
+
+    project_id: str
+    cost: int
+    job: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+    attempts: int = 0
+
+
+class ExtractionScheduler:
+    """
+    Start extraction jobs in waves that fit the credit balance.
+
+    The balance comes from, in order of preference: balance_provider (e.g. a
+    call to your billing system), the last X-Credits-Remaining value seen by
+    the client, or a starting balance you supply. Each started job is
+    deducted locally. When the balance is unknown, jobs are started one at a
+    time until the first 402 reveals that credits are exhausted; after that,
+    a single probe job is tried every refresh_interval.
+
+    Each wave takes queued extractions in order, skipping any that don't fit
+    what is left, so one large project does not hold back smaller ones.
+    With a credit_limit, an extraction that costs more than it can never run
+    and fails at once with InsufficientCreditsError instead of waiting.
+
+    Example:
+        scheduler = ExtractionScheduler(client, balance_provider=get_org_credits)
+        for project_id in project_ids:
+            scheduler.submit(project_id)
+
+        for item in scheduler.run():
+            print(item.project_id, item.job["id"] if item.job else item.error)
+    """
+
+    def __init__(
+        self,
+        client: "Structurify",
+        balance: Optional[int] = None,
+        balance_provider: Optional[Callable[[], Optional[int]]] = None,
+        refresh_interval: float = 60.0,
+        max_wait: Optional[float] = None,
+        on_wait: Optional[Callable[[int, float], None]] = None,
+        credit_limit: Optional[int] = None,
+    ):
+        """
+        Args:
+            client: Client used to estimate costs and start jobs
+            balance: Starting credit balance, if known
+            balance_provider: Optional callable returning the current balance
+            refresh_interval: Seconds to wait before re-checking an exhausted balance
+            max_wait: Give up after waiting this long for credits (default: wait forever)
+            on_wait: Optional callback(pending_count, seconds) invoked before each wait
+            credit_limit: Most credits the balance can reach (e.g. the plan's
+                allowance); extractions that cost more are failed without waiting
+        """
+        self._client = client
+        self._balance = balance
+        self._balance_provider = balance_provider
+        self._refresh_interval = refresh_interval
+        self._max_wait = max_wait
+        self._on_wait = on_wait
+        self._credit_limit = credit_limit
+        self._queue: Deque[ScheduledExtraction] = deque()
+
+    @property
+    def balance(self) -> Optional[int]:
+        """Credits believed to be available, or None if unknown."""
+        return self._balance
+
+    @property
+    def pending(self) -> List[ScheduledExtraction]:
+        """Extractions not yet started."""
+        return list(self._queue)
+
+    def submit(self, project_id: str, cost: Optional[int] = None) -> ScheduledExtraction:
+        """
+        Queue a project for extraction.
+
+        Args:
+            project_id: The project ID
+            cost: Credits the extraction will use (default: the project's document count)
+        """
+        if cost is None:
+            cost = self._estimate_cost(project_id)
+        item = ScheduledExtraction(project_id, cost)
+        self._queue.append(item)
+        return item
+
+    def _estimate_cost(self, project_id: str) -> int:
+        response = self._client.projects.get(project_id)
+        project = response.get("project", response)
+        count = project.get("documentCount")
+        if count is None:
+            count = len(response.get("documents", []))
+        return int(count)
+
+    def _refresh_balance(self, after_wait: bool = False) -> None:
+        if self._balance_provider is not None:
+            self._balance = self._balance_provider()
+        elif after_wait:
+            # Nothing to ask, so probe with one job to learn whether credits are back
+            self._balance = None
+        elif self._client.credits_remaining is not None:
+            self._balance = self._client.credits_remaining
+
+    def _next_wave(self) -> List[ScheduledExtraction]:
+        if self._balance is None:
+            # Unknown balance: probe with a single job
+            return [self._queue.popleft()]
+        wave: List[ScheduledExtraction] = []
+        waiting: Deque[ScheduledExtraction] = deque()
+        available = self._balance
+        for item in self._queue:
+            if item.cost <= available:
+                available -= item.cost
+                wave.append(item)
+            else:
+                waiting.append(item)
+        self._queue = waiting
+        return wave
+
+    def _reject_oversized(self) -> List[ScheduledExtraction]:
+        if self._credit_limit is None:
+            return []
+        limit = self._credit_limit
+        rejected = [item for item in self._queue if item.cost > limit]
+        for item in rejected:
+            item.error = InsufficientCreditsError(
+                f"Extraction of {item.project_id} needs {item.cost} credits, "
+                f"more than the credit limit of {limit}"
+            )
+        self._queue = deque(item for item in self._queue if item.cost <= limit)
+        return rejected
+
+    def _wait(self, waited: float) -> float:
+        if self._max_wait is not None and waited >= self._max_wait:
+            raise InsufficientCreditsError(
+                f"Credits not replenished within {self._max_wait}s; "
+                f"{len(self._queue)} extractions still queued"
+            )
+        delay = self._refresh_interval
+        if self._max_wait is not None:
+            delay = min(delay, self._max_wait - waited)
+        if self._on_wait:
+            self._on_wait(len(self._queue), delay)
+        cancellation.sleep(delay)
+        return waited + delay
+
+    def run(self) -> List[ScheduledExtraction]:
+        """
+        Start every queued extraction, waiting for credits as needed.
+
+        Extractions that fail for reasons other than credits are not retried;
+        they are returned with their error set, as are extractions that cost
+        more than the credit_limit.
+
+        Returns:
+            The started (or failed) extractions, in the order they were processed.
+
+        Raises:
+            InsufficientCreditsError: If max_wait elapses with work still queued
+        """
+        done = self._reject_oversized()
+        waited = 0.0
+        self._refresh_balance()
+
+        while self._queue:
+            cancellation.check()
+            wave = self._next_wave()
+            if not wave:
+                waited = self._wait(waited)
+                self._refresh_balance(after_wait=True)
+                continue
+
+            for index, item in enumerate(wave):
+                item.attempts += 1
+                try:
+                    item.job = self._client.extraction.run(item.project_id)
+                except InsufficientCreditsError:
+                    # Out of credits: requeue the rest of the wave and wait
+                    self._balance = 0
+                    self._queue.extendleft(reversed(wave[index:]))
+                    break
+                except StructurifyError as e:
+                    item.error = e
+                    done.append(item)
+                    continue
+
+                done.append(item)
+                waited = 0.0
+                if self._balance is not None:
+                    self._balance = max(0, self._balance - item.cost)
+
+        return done
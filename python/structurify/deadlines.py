@@ -0,0 +1,94 @@
+"""
+Deadlines
+
+An end-to-end time budget for SDK calls. A deadline set with deadline()
+applies to every request made in the block, in this thread or task and in
+helpers that carry the context into worker threads. It bounds the total
+time spent connecting, reading, waiting for rate-limit slots, retrying and
+backing off.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from structurify import cancellation
+from structurify.exceptions import DeadlineExceededError
+
+# Absolute time.monotonic() value, or None for no deadline
+_current_deadline: ContextVar[Optional[float]] = ContextVar(
+    "structurify_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[float]:
+    """Return the active deadline as a time.monotonic() value, if any."""
+    return _current_deadline.get()
+
+
+def remaining(at: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds left before a deadline (default: the active one), or None if unbounded.
+
+    The result may be negative once the deadline has passed.
+    """
+    if at is None:
+        at = _current_deadline.get()
+    if at is None:
+        return None
+    return at - time.monotonic()
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Bound every SDK call made in this block to finish within seconds.
+
+    Nested deadlines can only shorten the budget, never extend it.
+
+    Example:
+        with deadline(2.0):
+            job = client.extraction.get(job_id)
+            doc = client.documents.get(doc_id)   # shares what is left of the 2s
+    """
+    at = time.monotonic() + seconds
+    outer = _current_deadline.get()
+    if outer is not None:
+        at = min(at, outer)
+    token = _current_deadline.set(at)
+    try:
+        yield at
+    finally:
+        _current_deadline.reset(token)
+
+
+def check(at: Optional[float] = None) -> None:
+    """
+    Raise if a deadline (default: the active one) has passed.
+
+    Raises:
+        DeadlineExceededError: If no time is left
+    """
+    left = remaining(at)
+    if left is not None and left <= 0:
+        raise DeadlineExceededError()
+
+
+def sleep(seconds: float, at: Optional[float] = None) -> None:
+    """
+    Sleep, unless the deadline (default: the active one) would pass first.
+
+    Raises:
+        DeadlineExceededError: Immediately, without sleeping, if fewer than
+            seconds are left
+    """
+    left = remaining(at)
+    if left is not None and left < seconds:
+        raise DeadlineExceededError(
+            f"Deadline exceeded: {seconds:.1f}s wait needed, {max(0.0, left):.1f}s left"
+        )
+    cancellation.sleep(seconds)
@@ -0,0 +1,263 @@
+"""
+Folder Sync
+
+Keeps a project in step with a local folder, rsync-style. A manifest maps
+each file's relative path to its size, modification time, SHA-256 and
+document ID. Files whose size and mtime are unchanged are not even read,
+so a large folder with few changes syncs in seconds; only new or changed
+files are uploaded, and documents for removed files are deleted.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from structurify.bulk import BulkProgress, BulkResult, run_bulk
+from structurify.exceptions import NotFoundError, StructurifyError
+from structurify.resources.documents import collect_files
+from structurify.scheduler import BULK, current_priority, priority
+
+if TYPE_CHECKING:
+    from structurify.resources.documents import DocumentsResource
+
+MANIFEST_NAME = ".structurify-manifest.json"
+MANIFEST_VERSION = 1
+_HASH_CHUNK = 1024 * 1024
+# Uploads recorded between manifest saves, bounding re-uploads after a crash
+_SAVE_EVERY = 16
+
+
+@dataclass
+class FileEntry:
+    """What the manifest knows about one synced file."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    document_id: str
+
+
+@dataclass
+class DirSyncReport:
+    """Outcome of one folder sync. Paths are relative to the folder."""
+
+    uploaded: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    renamed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    hashed: int = 0
+    failed: List[BulkResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if every upload and deletion succeeded."""
+        return not self.failed
+
+
+class SyncManifest:
+    """The path → (size, mtime, hash, document ID) map kept between syncs."""
+
+    def __init__(self, path: str, project_id: str):
+        self.path = path
+        self.project_id = project_id
+        self.files: Dict[str, FileEntry] = {}
+        # Replaced documents not yet deleted; retried on the next sync
+        self.orphans: List[str] = []
+
+    @classmethod
+    def load(cls, path: str, project_id: str) -> "SyncManifest":
+        """
+        Read a manifest, or start an empty one.
+
+        A manifest written for a different project is ignored, so syncing a
+        folder to a new project never deletes documents from the old one.
+        """
+        manifest = cls(path, project_id)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return manifest
+        if data.get("version") == MANIFEST_VERSION and data.get("projectId") == project_id:
+            manifest.files = {
+                rel: FileEntry(**entry) for rel, entry in data.get("files", {}).items()
+            }
+            manifest.orphans = list(data.get("orphans", []))
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        data: Dict[str, Any] = {
+            "version": MANIFEST_VERSION,
+            "projectId": self.project_id,
+            "files": {rel: vars(entry) for rel, entry in sorted(self.files.items())},
+            "orphans": self.orphans,
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _document_id(document: Any) -> str:
+    """The ID of an uploaded document, as a dict or a typed model."""
+    document_id = (
+        document.get("id") if isinstance(document, dict) else getattr(document, "id", None)
+    )
+    if not document_id:
+        raise StructurifyError("upload response has no document ID")
+    return str(document_id)
+
+
+def sync_dir(
+    documents: "DocumentsResource",
+    project_id: str,
+    path: str,
+    manifest: Optional[str] = None,
+    delete: bool = True,
+    recursive: bool = True,
+    concurrency: int = 8,
+    dry_run: bool = False,
+    on_progress: Optional[Callable[[BulkProgress], None]] = None,
+) -> DirSyncReport:
+    """Sync a folder to a project. See DocumentsResource.sync_dir."""
+    root = os.path.abspath(path)
+    state = SyncManifest.load(manifest or os.path.join(root, MANIFEST_NAME), project_id)
+    report = DirSyncReport()
+
+    # Size and mtime decide which files need reading at all
+    current: Dict[str, os.stat_result] = {}
+    suspect: List[str] = []
+    for full in collect_files(root, recursive):
+        rel = os.path.relpath(full, root).replace(os.sep, "/")
+        st = os.stat(full)
+        current[rel] = st
+        known = state.files.get(rel)
+        if known and known.size == st.st_size and known.mtime_ns == st.st_mtime_ns:
+            report.unchanged += 1
+        else:
+            suspect.append(rel)
+
+    hashed = run_bulk(
+        lambda rel: file_sha256(os.path.join(root, rel)),
+        suspect,
+        concurrency=concurrency,
+    )
+    report.hashed = len(suspect)
+    digests = {r.key: r.value for r in hashed if r.ok}
+    report.failed.extend(r for r in hashed if not r.ok)
+
+    # Documents of vanished files can be reused by new files with the same content
+    vanished = {rel: entry for rel, entry in state.files.items() if rel not in current}
+    by_hash = {entry.sha256: rel for rel, entry in vanished.items()}
+
+    to_upload: List[str] = []
+    for rel, digest in digests.items():
+        st = current[rel]
+        known = state.files.get(rel)
+        if known and known.sha256 == digest:
+            # Touched but not modified
+            report.unchanged += 1
+            state.files[rel] = FileEntry(st.st_size, st.st_mtime_ns, digest, known.document_id)
+        elif not known and digest in by_hash:
+            # Moved or renamed: keep the document, which keeps its original name
+            old_rel = by_hash.pop(digest)
+            old = vanished.pop(old_rel)
+            del state.files[old_rel]
+            report.renamed.append(rel)
+            state.files[rel] = FileEntry(st.st_size, st.st_mtime_ns, digest, old.document_id)
+        else:
+            to_upload.append(rel)
+
+    if dry_run:
+        for rel in to_upload:
+            (report.updated if rel in state.files else report.uploaded).append(rel)
+        report.deleted = sorted(vanished) if delete else []
+        return report
+
+    # Each upload is recorded as it finishes and the manifest saved every few,
+    # so a crash mid-sync doesn't upload the same files again. A replaced
+    # document becomes an orphan, deleted once the uploads are done.
+    lock = threading.Lock()
+    unsaved = 0
+
+    def upload(rel: str) -> str:
+        nonlocal unsaved
+        document_id = _document_id(documents.upload(
+            project_id, file_path=os.path.join(root, rel), name=os.path.basename(rel)
+        ))
+        st = current[rel]
+        with lock:
+            previous = state.files.get(rel)
+            if previous:
+                state.orphans.append(previous.document_id)
+            state.files[rel] = FileEntry(st.st_size, st.st_mtime_ns, digests[rel], document_id)
+            unsaved += 1
+            if unsaved >= _SAVE_EVERY:
+                state.save()
+                unsaved = 0
+        return "updated" if previous else "uploaded"
+
+    with priority(current_priority() or BULK):
+        uploads = run_bulk(
+            upload,
+            to_upload,
+            concurrency=concurrency,
+            size=lambda rel: current[rel].st_size,
+            on_progress=on_progress,
+        )
+        for result in uploads:
+            if not result.ok:
+                report.failed.append(result)
+            elif result.value == "updated":
+                report.updated.append(result.key)
+            else:
+                report.uploaded.append(result.key)
+
+        to_delete: Dict[str, str] = {document_id: "" for document_id in state.orphans}
+        for rel, entry in vanished.items():
+            if delete:
+                to_delete[entry.document_id] = rel
+            else:
+                # Forget the file but keep its document
+                state.files.pop(rel, None)
+
+        deletions = run_bulk(documents.delete, list(to_delete), concurrency=concurrency)
+    state.orphans = []
+    for result in deletions:
+        rel = to_delete[result.key]
+        gone = result.ok or isinstance(result.error, NotFoundError)
+        if rel in vanished:
+            if gone:
+                report.deleted.append(rel)
+                state.files.pop(rel, None)
+            else:
+                report.failed.append(result)
+        elif not gone:
+            report.failed.append(result)
+            state.orphans.append(result.key)
+
+    state.save()
+    return report
@@ -76,3 +76,58 @@ class ServerError(StructurifyError):
 
     def __init__(self, message: str = "Server error", **kwargs: Any):
         super().__init__(message, code="SERVER_ERROR", status_code=500, **kwargs)
+
+
+class PreflightError(StructurifyError):
+    """Raised when a file is rejected by local preflight checks, before upload."""
+
+    def __init__(
+        self,
+        message: str = "File rejected by preflight checks",
+        reason: Optional[str] = None,
+        result: Optional[Any] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(message, code="PREFLIGHT_REJECTED", **kwargs)
+        self.reason = reason
+        self.result = result
+
+
+class CircuitOpenError(StructurifyError):
+    """Raised without a request when an endpoint group's circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: Optional[str] = None,
+        group: Optional[str] = None,
+        retry_after: Optional[float] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(
+            message or f"Circuit open for {group or 'endpoint'}; failing fast",
+            code="CIRCUIT_OPEN",
+            **kwargs,
+        )
+        self.group = group
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(StructurifyError):
+    """Raised when a call's deadline passes before it could complete."""
+
+    def __init__(self, message: str = "Deadline exceeded", **kwargs: Any):
+        super().__init__(message, code="DEADLINE_EXCEEDED", **kwargs)
+
+
+class OperationCancelledError(StructurifyError):
+    """Raised when a call is stopped by its cancellation token."""
+
+    def __init__(self, message: str = "Operation cancelled", **kwargs: Any):
+        super().__init__(message, code="CANCELLED", **kwargs)
+
+
+class CassetteMissError(StructurifyError):
+    """Raised when a replayed cassette has no recorded response for a request."""
+
+    def __init__(self, message: str = "No recorded response", **kwargs: Any):
+        super().__init__(message, code="CASSETTE_MISS", **kwargs)
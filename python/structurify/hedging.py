@@ -0,0 +1,284 @@
+"""
+Hedged Reads
+
+Cuts tail latency of idempotent GETs by sending a second, identical request
+when the first is slower than usual, and using whichever answers first. The
+hedge delay tracks a latency percentile per endpoint group, and a budget
+keeps the extra load to a small fraction of total requests.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar, cast
+
+from structurify import cancellation, deadlines
+from structurify.cancellation import CancellationToken
+from structurify.circuit import CircuitBreakers
+from structurify.exceptions import DeadlineExceededError
+
+T = TypeVar("T")
+
+
+class _Attempt:
+    """One of the calls racing in a hedged request."""
+
+    def __init__(self, token: CancellationToken):
+        self.token = token
+        self.future: "Future[Any]" = Future()
+        self.started = threading.Event()
+        self.started_at = 0.0
+
+    def run(self, func: Callable[[], Any]) -> Any:
+        self.started_at = time.monotonic()
+        self.started.set()
+        with cancellation.cancellable(self.token):
+            return func()
+
+
+class HedgePolicy:
+    """
+    Opt-in hedging for GET requests.
+
+    A GET that has not completed after the group's percentile latency (for
+    example p95 of recent extraction-jobs reads) is sent again. The first
+    response wins; the slower request is cancelled and its connection closed.
+    Each request adds `budget` hedge tokens (up to max_tokens) and each hedge
+    spends one, so with the default budget at most about 5% of requests are
+    hedged, however slow the API gets.
+
+    Example:
+        client = Structurify(api_key="sk_live_xxx", hedging=HedgePolicy(percentile=95))
+        job = client.extraction.get("job_xxx")
+        print(client.hedging.metrics())
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        max_delay: float = 10.0,
+        budget: float = 0.05,
+        max_tokens: float = 10.0,
+        window: int = 1000,
+        min_samples: int = 20,
+        max_workers: int = 32,
+    ):
+        """
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            initial_delay: Hedge delay used until min_samples latencies are known
+            min_delay: Lower bound on the hedge delay, in seconds
+            max_delay: Upper bound on the hedge delay, in seconds
+            budget: Hedges allowed per request, on average (0.05 = 5%)
+            max_tokens: Most hedges that can be saved up for a burst of slow requests
+            window: Recent latencies kept per endpoint group
+            min_samples: Latencies needed before the percentile is trusted
+            max_workers: Threads that run hedged GETs; both the original and
+                the hedge use one, so allow about twice your read concurrency
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.window = window
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+        self._owner_pid = os.getpid()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.over_budget = 0
+
+    def delay_for(self, group: str) -> float:
+        """Seconds to wait before hedging a request to this group."""
+        with self._lock:
+            samples = self._latencies.get(group)
+            if not samples or len(samples) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                ordered = sorted(samples)
+                index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+                delay = ordered[index]
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def _record_latency(self, group: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(group)
+            if samples is None:
+                samples = self._latencies[group] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.hedged += 1
+                return True
+            self.over_budget += 1
+            return False
+
+    def _submit(self, func: Callable[[], Any], token: CancellationToken) -> "_Attempt":
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="structurify-hedge"
+                )
+            executor = self._executor
+        attempt = _Attempt(token)
+        # Run in the caller's context so priorities and similar settings apply
+        attempt.future = executor.submit(contextvars.copy_context().run, attempt.run, func)
+        return attempt
+
+    def run(self, path: str, func: Callable[[], T], at: Optional[float] = None) -> T:
+        """
+        Call func, hedging with a second call if the first is slow.
+
+        func must be idempotent: both calls may reach the server. Each call
+        runs under its own CancellationToken, cancelled along with the
+        caller's, and the slower call is cancelled once the other succeeds.
+
+        Args:
+            path: API path, used to pick the endpoint group's latency history
+            func: The request to make
+            at: time.monotonic() by which the call must start (default: the
+                active deadline)
+
+        Returns:
+            The result of whichever call succeeded first.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before a thread takes the call
+            OperationCancelledError: If the current token is cancelled before then
+        """
+        if at is None:
+            at = deadlines.current_deadline()
+        group = CircuitBreakers.group_for(path)
+        delay = self.delay_for(group)
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.budget)
+
+        tokens = [CancellationToken(), CancellationToken()]
+        parent = cancellation.current_token()
+        unlink: Optional[Callable[[], None]] = None
+        if parent is not None:
+            def relay() -> None:
+                for token in tokens:
+                    token.cancel(parent.reason)
+
+            unlink = parent.on_cancel(relay)
+        try:
+            return cast(T, self._race(group, delay, func, tokens, at))
+        finally:
+            if unlink is not None:
+                unlink()
+
+    def _race(
+        self,
+        group: str,
+        delay: float,
+        func: Callable[[], Any],
+        tokens: List[CancellationToken],
+        at: Optional[float],
+    ) -> Any:
+        primary = self._submit(func, tokens[0])
+        # The hedge delay counts from when the call starts, not from time queued for a thread
+        self._wait_started(primary, at)
+        done, _ = wait([primary.future], timeout=delay)
+        if done or not self._take_token():
+            result = primary.future.result()
+            self._record_latency(group, time.monotonic() - primary.started_at)
+            return result
+
+        hedge = self._submit(func, tokens[1])
+        attempts = {primary.future: primary, hedge.future: hedge}
+        pending = set(attempts)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    if error is None or future is primary.future:
+                        error = future.exception()
+                    continue
+                for loser in pending:
+                    # Dropped if not started yet; otherwise its request is aborted
+                    loser.cancel()
+                    attempts[loser].token.cancel("hedged request answered")
+                if future is hedge.future:
+                    with self._lock:
+                        self.hedge_wins += 1
+                self._record_latency(group, time.monotonic() - primary.started_at)
+                return future.result()
+        assert error is not None
+        raise error
+
+    @staticmethod
+    def _wait_started(attempt: _Attempt, at: Optional[float]) -> None:
+        # A saturated pool must not hold the caller past its deadline or token,
+        # so cancelling the caller's token also wakes the wait
+        token = cancellation.current_token()
+        unregister = token.on_cancel(attempt.started.set) if token is not None else None
+        try:
+            attempt.started.wait(deadlines.remaining(at))
+            cancellation.check()
+            if not attempt.started.is_set():
+                raise DeadlineExceededError(
+                    "Deadline exceeded waiting for a thread to send the call"
+                )
+        except BaseException:
+            # Dropped if still queued; aborted if it started meanwhile
+            attempt.future.cancel()
+            attempt.token.cancel("caller stopped waiting")
+            raise
+        finally:
+            if unregister is not None:
+                unregister()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Request and hedge counters, plus the current hedge delay per group."""
+        with self._lock:
+            groups = list(self._latencies)
+            counters: Dict[str, Any] = {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "over_budget": self.over_budget,
+                "tokens": self._tokens,
+            }
+        counters["delays"] = {group: self.delay_for(group) for group in groups}
+        return counters
+
+    def _after_fork(self) -> None:
+        # The executor's threads and any held lock did not survive the fork
+        if self._owner_pid != os.getpid():
+            self._lock = threading.Lock()
+            self._executor = None
+            self._owner_pid = os.getpid()
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,311 @@
+"""
+HTTP/2 Transport
+
+A requests transport adapter that sends API calls over HTTP/2 with httpx,
+so concurrent status polls and small reads share a few multiplexed
+connections instead of each holding its own TCP+TLS connection. Requests
+with large or streamed bodies (uploads) keep dedicated HTTP/1.1
+connections, where they neither queue behind nor starve the small calls
+sharing an HTTP/2 connection's flow-control window.
+
+Requests from every thread are driven by one asyncio loop in a background
+thread. httpx's synchronous HTTP/2 client can send the headers of
+concurrent requests out of stream order, which servers treat as a
+connection error; its async client is not affected.
+
+Requires httpx with HTTP/2 support:
+
+    pip install structurify[http2]
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import io
+import os
+import ssl
+import threading
+from typing import Any, Coroutine, Dict, List, Mapping, Optional, Tuple, TypeVar, Union
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from structurify import cancellation
+from structurify.cancellation import CancellableAdapter
+
+T = TypeVar("T")
+
+# Bodies above this size are sent over HTTP/1.1
+LARGE_BODY = 256 * 1024
+
+# Connection-specific headers are not allowed in HTTP/2; httpx sets its own
+# Host, Content-Length and Accept-Encoding
+_DROPPED_HEADERS = frozenset({
+    "connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade",
+    "host", "content-length", "accept-encoding",
+})
+
+TimeoutArg = Union[None, float, Tuple[Optional[float], Optional[float]]]
+CertArg = Union[None, str, Tuple[str, str]]
+
+
+class _StreamedBody:
+    """File-like view of a streamed httpx response body, for requests' Response.raw."""
+
+    def __init__(self, adapter: "Http2Adapter", response: Any, request: requests.PreparedRequest):
+        self._adapter = adapter
+        self._response = response
+        self._request = request
+        self._chunks = response.aiter_bytes()
+        self._buffer = b""
+        self._done = False
+
+    def read(self, amt: Optional[int] = None, decode_content: bool = True) -> bytes:
+        while not self._done and (amt is None or len(self._buffer) < amt):
+            try:
+                self._buffer += self._adapter._run(self._chunks.__anext__(), self._request)
+            except StopAsyncIteration:
+                self.close()
+        if amt is None:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self) -> None:
+        if not self._done:
+            self._done = True
+            with contextlib.suppress(Exception):
+                self._adapter._run(self._response.aclose(), self._request)
+
+    def release_conn(self) -> None:
+        self.close()
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    requests adapter that multiplexes requests over HTTP/2 connections.
+
+    Small requests go through httpx, which negotiates HTTP/2 with the
+    server over TLS and falls back to HTTP/1.1 if the server does not offer
+    it. Requests with a body over large_body bytes, or a streamed or file
+    body, are handed to an HTTP/1.1 adapter. verify and cert settings from
+    the session or environment are honoured as they are by requests.
+
+    A CancellationToken aborts an HTTP/2 request by resetting its stream;
+    other requests sharing the connection carry on.
+
+    Example:
+        client = Structurify(api_key="sk_live_xxx", http2=True)
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        large_body: int = LARGE_BODY,
+        fallback: Optional[BaseAdapter] = None,
+        cleartext: bool = False,
+    ):
+        """
+        Args:
+            max_connections: HTTP/2 connections kept per host (default 10). Each
+                carries many concurrent requests, so a few are usually enough.
+            large_body: Request bodies above this many bytes use HTTP/1.1
+            fallback: Adapter for large requests (default a CancellableAdapter)
+            cleartext: Speak HTTP/2 without TLS, for local servers that expect it
+                (h2c with prior knowledge). HTTP/1.1 is then not offered.
+
+        Raises:
+            ImportError: If httpx or its HTTP/2 support is not installed
+        """
+        super().__init__()
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "httpx with HTTP/2 support is required for http2: "
+                "pip install structurify[http2]"
+            ) from e
+
+        self._httpx = httpx
+        self._size = max_connections or 10
+        self._cleartext = cleartext
+        self.large_body = large_body
+        self.fallback = fallback or CancellableAdapter(
+            pool_connections=self._size, pool_maxsize=self._size
+        )
+        # One httpx client, and so one connection pool, per TLS configuration
+        self._clients: Dict[Tuple[Any, Any], Any] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def send(  # type: ignore[override]
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: TimeoutArg = None,
+        verify: Union[bool, str] = True,
+        cert: CertArg = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if body is not None and (not isinstance(body, bytes) or len(body) > self.large_body):
+            # requests accepts None for either part of a timeout tuple; its stubs do not
+            return self.fallback.send(
+                request, stream=stream, timeout=timeout,  # type: ignore[arg-type]
+                verify=verify, cert=cert, proxies=proxies,
+            )
+
+        client = self._client_for(verify, cert)
+        outgoing = client.build_request(
+            request.method or "GET",
+            request.url or "",
+            headers=_headers(request.headers),
+            content=body,
+            timeout=_timeout(self._httpx, timeout),
+        )
+        incoming = self._run(_exchange(client, outgoing, stream), request)
+
+        response = requests.Response()
+        response.status_code = incoming.status_code
+        response.headers = CaseInsensitiveDict(incoming.headers.items())
+        # The body is decoded by httpx
+        response.headers.pop("Content-Encoding", None)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = incoming.reason_phrase
+        response.url = request.url or ""
+        response.request = request
+        # Auth handlers resend through response.connection, which only needs send()
+        response.connection = self  # type: ignore[assignment]
+        if stream:
+            response.raw = _StreamedBody(self, incoming, request)
+        else:
+            response.raw = io.BytesIO(incoming.content)
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and thread is not None:
+            for client in clients:
+                with contextlib.suppress(Exception):
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(5)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+        self.fallback.close()
+
+    def _run(self, coro: Coroutine[Any, Any, T], request: requests.PreparedRequest) -> T:
+        """Run a coroutine on the loop, translating httpx errors and cancellation."""
+        try:
+            cancellation.check()
+        except BaseException:
+            coro.close()
+            raise
+        httpx = self._httpx
+        future: "concurrent.futures.Future[T]" = asyncio.run_coroutine_threadsafe(
+            coro, self._get_loop()
+        )
+        token = cancellation.current_token()
+        unregister = token.on_cancel(future.cancel) if token is not None else None
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError as e:
+            cancellation.check()
+            raise requests.ConnectionError(
+                "HTTP/2 request was cancelled", request=request
+            ) from e
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e, request=request) from e
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request) from e
+        finally:
+            if unregister is not None:
+                unregister()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="structurify-http2", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _client_for(self, verify: Union[bool, str], cert: CertArg) -> Any:
+        key = (verify, cert)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                httpx = self._httpx
+                client = self._clients[key] = httpx.AsyncClient(
+                    http1=not self._cleartext,
+                    http2=True,
+                    verify=_ssl_context(verify, cert),
+                    limits=httpx.Limits(
+                        max_connections=self._size, max_keepalive_connections=self._size
+                    ),
+                    # Timeouts are set per request
+                    timeout=None,
+                )
+            return client
+
+
+async def _exchange(client: Any, outgoing: Any, stream: bool) -> Any:
+    incoming = await client.send(outgoing, stream=True)
+    if not stream:
+        try:
+            await incoming.aread()
+        finally:
+            await incoming.aclose()
+    return incoming
+
+
+def _headers(headers: Mapping[str, str]) -> List[Tuple[str, str]]:
+    return [(k, v) for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS]
+
+
+def _timeout(httpx: Any, timeout: TimeoutArg) -> Any:
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _ssl_context(verify: Union[bool, str], cert: CertArg) -> Union[bool, ssl.SSLContext]:
+    """Translate requests' verify and cert arguments for httpx."""
+    if verify is True and cert is None:
+        return True
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str):
+        if os.path.isdir(verify):
+            context = ssl.create_default_context(capath=verify)
+        else:
+            context = ssl.create_default_context(cafile=verify)
+    else:
+        import certifi
+
+        context = ssl.create_default_context(cafile=certifi.where())
+    if cert is not None:
+        if isinstance(cert, tuple):
+            context.load_cert_chain(*cert)
+        else:
+            context.load_cert_chain(cert)
+    return context
@@ -0,0 +1,355 @@
+"""
+Local Results Mirror
+
+Keeps extraction results for a project in a local SQLite database and
+refreshes it incrementally: each sync exports only the documents whose
+extraction finished since they were last mirrored, so refresh cost follows
+the volume of change rather than the size of the project. Results are
+queried locally, with indexes on document ID and on column values.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from structurify.client import Structurify
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    project_id TEXT NOT NULL,
+    document_id TEXT NOT NULL,
+    name TEXT,
+    status TEXT,
+    record TEXT,
+    synced_at REAL,
+    PRIMARY KEY (project_id, document_id)
+);
+CREATE TABLE IF NOT EXISTS cells (
+    project_id TEXT NOT NULL,
+    document_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value,
+    PRIMARY KEY (project_id, document_id, field)
+);
+CREATE INDEX IF NOT EXISTS cells_by_value ON cells (project_id, field, value);
+CREATE TABLE IF NOT EXISTS watermarks (
+    project_id TEXT PRIMARY KEY,
+    job_completed_at TEXT,
+    jobs_active INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL
+);
+"""
+
+# Keys that identify the document a JSON export record belongs to
+_ID_KEYS = ("documentId", "document_id", "id")
+_TERMINAL_JOB_STATES = {"done", "error", "cancelled"}
+
+
+@dataclass
+class MirrorSync:
+    """Outcome of one mirror sync."""
+
+    project_id: str
+    # False when no extraction job had finished or was running since the last
+    # sync, so the document list was not fetched at all
+    checked: bool = False
+    fetched: int = 0
+    removed: int = 0
+    pending: int = 0
+
+
+class ResultsMirror:
+    """
+    Incremental local copy of a project's extraction results.
+
+    Each sync first lists the project's extraction jobs. If none has
+    finished since the watermark and none was running at the last sync,
+    nothing can have changed and the sync stops there. Otherwise it reads
+    the document list and exports the documents that are now done but were
+    not done (or not mirrored) before, plus those that a job finished since
+    the watermark may have re-extracted: the job's documentIds when it lists
+    them, otherwise every document mirrored before the job completed. It
+    upserts their records and drops documents deleted from the project.
+    Deletions are therefore picked up at the next sync that checks
+    documents; use full=True to force a complete refresh.
+
+    Example:
+        mirror = ResultsMirror(client, "results.db")
+        mirror.sync("proj_xxx")              # cheap when nothing changed
+        rows = mirror.query("proj_xxx", where={"Vendor": "ACME"})
+    """
+
+    def __init__(self, client: "Structurify", path: str, batch_size: int = 500):
+        """
+        Args:
+            client: Client used to read jobs, documents and exports
+            path: SQLite database file (created if missing)
+            batch_size: Most documents requested in one export
+        """
+        self._client = client
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+
+    def sync(self, project_id: str, full: bool = False) -> MirrorSync:
+        """
+        Bring the mirror of a project up to date.
+
+        Args:
+            project_id: The project ID
+            full: Re-export every finished document and re-check the document list
+
+        Returns:
+            What the sync fetched and removed.
+        """
+        result = MirrorSync(project_id)
+        job_list = self._list_jobs(project_id)
+        jobs = self._job_state(job_list) if job_list is not None else None
+        watermark = self._watermark(project_id)
+        if not full and jobs is not None and watermark is not None:
+            completed_at, active = jobs
+            seen_completed_at, was_active = watermark
+            if completed_at == seen_completed_at and not was_active and not active:
+                return result
+        covered, stale_before = self._rerun_since(
+            job_list or [], watermark[0] if watermark else None
+        )
+
+        result.checked = True
+        project = self._client.projects.get(project_id)
+        remote = {
+            doc["id"]: doc for doc in project.get("documents", []) if doc.get("id")
+        }
+        local = self._local_states(project_id)
+
+        def changed(doc_id: str) -> bool:
+            state = local.get(doc_id)
+            if state is None or state[:2] != ("done", True):
+                return True
+            # Mirrored, but a job that finished since may have re-extracted it
+            return doc_id in covered or state[2] < stale_before
+
+        ready = [
+            doc_id for doc_id, doc in remote.items()
+            if doc.get("status") == "done" and (full or changed(doc_id))
+        ]
+        removed = [doc_id for doc_id in local if doc_id not in remote]
+        result.pending = sum(
+            1 for doc in remote.values() if doc.get("status") in ("pending", "processing")
+        )
+
+        exporting = set(ready)
+        for start in range(0, len(ready), self.batch_size):
+            batch = ready[start:start + self.batch_size]
+            records = self._client.exports.records(project_id, document_ids=batch)
+            result.fetched += self._upsert(project_id, batch, records, remote)
+
+        now = time.time()
+        with self._lock, self.connection:
+            # Record status for the rest, so a document that leaves "done" and
+            # comes back (re-extraction) is exported again
+            self.connection.executemany(
+                "INSERT INTO documents (project_id, document_id, name, status, synced_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (project_id, document_id) DO UPDATE SET "
+                "name = excluded.name, status = excluded.status",
+                [
+                    (project_id, doc_id, doc.get("name"), doc.get("status"), now)
+                    for doc_id, doc in remote.items() if doc_id not in exporting
+                ],
+            )
+            for doc_id in removed:
+                self._delete(project_id, doc_id)
+            if jobs is not None:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)",
+                    (project_id, jobs[0], int(jobs[1]), now),
+                )
+        result.removed = len(removed)
+        return result
+
+    def get(self, project_id: str, document_id: str) -> Optional[Dict[str, Any]]:
+        """Return the mirrored record of a document, or None."""
+        row = self.connection.execute(
+            "SELECT record FROM documents WHERE project_id = ? AND document_id = ? "
+            "AND record IS NOT NULL",
+            (project_id, document_id),
+        ).fetchone()
+        return json.loads(row["record"]) if row else None
+
+    def query(
+        self,
+        project_id: str,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return mirrored records whose columns equal the given values.
+
+        Args:
+            project_id: The project ID
+            where: Column label → value; every condition must match
+            limit: Most records to return
+
+        Example:
+            mirror.query("proj_xxx", where={"Vendor": "ACME", "Currency": "EUR"})
+        """
+        sql = "SELECT d.record FROM documents d"
+        params: List[Any] = []
+        for i, (field, value) in enumerate((where or {}).items()):
+            sql += (
+                f" JOIN cells c{i} ON c{i}.project_id = d.project_id"
+                f" AND c{i}.document_id = d.document_id AND c{i}.field = ? AND c{i}.value = ?"
+            )
+            params.extend([field, _cell(value)])
+        sql += " WHERE d.project_id = ? AND d.record IS NOT NULL ORDER BY d.document_id"
+        params.append(project_id)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row["record"]) for row in self.connection.execute(sql, params)]
+
+    def count(self, project_id: str) -> int:
+        """Number of documents with mirrored results."""
+        row = self.connection.execute(
+            "SELECT COUNT(*) FROM documents WHERE project_id = ? AND record IS NOT NULL",
+            (project_id,),
+        ).fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def __enter__(self) -> "ResultsMirror":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _list_jobs(self, project_id: str) -> Optional[List[Dict[str, Any]]]:
+        response = self._client.extraction.list(project_id)
+        jobs = response.get("jobs") if isinstance(response, dict) else response
+        return jobs if isinstance(jobs, list) else None
+
+    @staticmethod
+    def _job_state(jobs: List[Dict[str, Any]]) -> Tuple[Optional[str], bool]:
+        """Latest job completion time and whether any job is running."""
+        completed: List[str] = [job["completedAt"] for job in jobs if job.get("completedAt")]
+        active = any(job.get("status") not in _TERMINAL_JOB_STATES for job in jobs)
+        return (max(completed) if completed else None), active
+
+    @staticmethod
+    def _rerun_since(
+        jobs: List[Dict[str, Any]], watermark: Optional[str]
+    ) -> Tuple[Set[str], float]:
+        """
+        Documents that jobs finished after the watermark may have re-extracted.
+
+        Returns the IDs listed by jobs that report their documentIds, and a
+        time before which any mirrored record may be stale, from jobs that
+        don't (0.0 if there are none).
+        """
+        covered: Set[str] = set()
+        stale_before = 0.0
+        for job in jobs:
+            completed_at = job.get("completedAt")
+            if not completed_at or (watermark is not None and completed_at <= watermark):
+                continue
+            document_ids = job.get("documentIds")
+            if isinstance(document_ids, list):
+                covered.update(str(doc_id) for doc_id in document_ids)
+            else:
+                # A job without a document list extracts the whole project
+                stale_before = max(stale_before, _timestamp(completed_at))
+        return covered, stale_before
+
+    def _watermark(self, project_id: str) -> Optional[Tuple[Optional[str], bool]]:
+        row = self.connection.execute(
+            "SELECT job_completed_at, jobs_active FROM watermarks WHERE project_id = ?",
+            (project_id,),
+        ).fetchone()
+        return (row["job_completed_at"], bool(row["jobs_active"])) if row else None
+
+    def _local_states(self, project_id: str) -> Dict[str, Tuple[str, bool, float]]:
+        return {
+            row["document_id"]: (row["status"], bool(row["has_record"]), row["synced_at"] or 0.0)
+            for row in self.connection.execute(
+                "SELECT document_id, status, record IS NOT NULL AS has_record, synced_at "
+                "FROM documents WHERE project_id = ?",
+                (project_id,),
+            )
+        }
+
+    def _upsert(
+        self,
+        project_id: str,
+        batch: List[str],
+        records: List[Dict[str, Any]],
+        remote: Dict[str, Dict[str, Any]],
+    ) -> int:
+        now = time.time()
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            doc_id = next(
+                (record[k] for k in _ID_KEYS if isinstance(record.get(k), str)
+                 and record[k] in remote),
+                None,
+            )
+            if doc_id is None and len(batch) == 1:
+                doc_id = batch[0]
+            if doc_id is not None:
+                by_id[doc_id] = record
+
+        with self._lock, self.connection:
+            for doc_id, record in by_id.items():
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        project_id, doc_id, remote[doc_id].get("name"), "done",
+                        json.dumps(record, separators=(",", ":")), now,
+                    ),
+                )
+                self.connection.execute(
+                    "DELETE FROM cells WHERE project_id = ? AND document_id = ?",
+                    (project_id, doc_id),
+                )
+                self.connection.executemany(
+                    "INSERT INTO cells VALUES (?, ?, ?, ?)",
+                    [(project_id, doc_id, field, _cell(value)) for field, value in record.items()],
+                )
+        return len(by_id)
+
+    def _delete(self, project_id: str, document_id: str) -> None:
+        for table in ("documents", "cells"):
+            self.connection.execute(
+                f"DELETE FROM {table} WHERE project_id = ? AND document_id = ?",
+                (project_id, document_id),
+            )
+
+
+def _timestamp(value: str) -> float:
+    """Parse an API timestamp; an unreadable one is treated as the present."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return time.time()
+
+
+def _cell(value: Any) -> Any:
+    """Store scalars as themselves so comparisons and sorting work; others as JSON."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value, separators=(",", ":"), sort_keys=True)
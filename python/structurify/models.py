@@ -0,0 +1,282 @@
+"""
+Typed Response Models
+
+Compact, slot-based records for API objects. Fields follow the schemas in
+openapi/structurify-api.yaml (components/schemas); attributes use
+snake_case, while item access uses the API's camelCase keys so a model can
+stand in for the dict it replaces. Keys not in the schema are kept.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+from collections.abc import Mapping
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
+
+M = TypeVar("M", bound="Model")
+
+
+class _Nested:
+    """A field holding nested objects, decoded into models on first access."""
+
+    def __init__(self, model: Type["Model"]):
+        self.model = model
+        self.slot = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = f"_{name}"
+
+    def __get__(self, obj: Optional["Model"], owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        # Raises AttributeError (→ Model.__getattr__ → None) if the field is absent
+        raw = object.__getattribute__(obj, self.slot)
+        if isinstance(raw, dict):
+            raw = self.model.from_dict(raw)
+        elif isinstance(raw, list) and any(isinstance(item, dict) for item in raw):
+            raw = [self.model.from_dict(i) if isinstance(i, dict) else i for i in raw]
+        else:
+            return raw
+        object.__setattr__(obj, self.slot, raw)
+        return raw
+
+
+class Model(Mapping):  # type: ignore[type-arg]
+    """
+    Base class for API models.
+
+    Models are read-only mappings: model["mimeType"], model.get("status"),
+    "id" in model, dict(model) and comparisons with dicts all behave as they
+    would for the raw response. Attributes give typed access; a field the
+    response did not include reads as None.
+    """
+
+    __slots__ = ("_extra",)
+
+    # (attribute, API key) pairs, in schema order
+    _fields: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+    # Storage slot for each API key (nested fields are stored under "_<name>")
+    _slots_by_key: ClassVar[Dict[str, str]] = {}
+    _attrs_by_key: ClassVar[Dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._attrs_by_key = {key: attr for attr, key in cls._fields}
+        cls._slots_by_key = {
+            key: f"_{attr}" if isinstance(cls.__dict__.get(attr), _Nested) else attr
+            for attr, key in cls._fields
+        }
+
+    @classmethod
+    def from_dict(cls: Type[M], data: Dict[str, Any]) -> M:
+        """Build a model from an API object."""
+        obj = cls.__new__(cls)
+        extra = None
+        slots = cls._slots_by_key
+        for key, value in data.items():
+            slot = slots.get(key)
+            if slot is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+            else:
+                object.__setattr__(obj, slot, value)
+        object.__setattr__(obj, "_extra", extra)
+        return obj
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for declared fields the response did not include
+        if name in type(self)._attrs_by_key.values():
+            return None
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _has(self, key: str) -> bool:
+        slot = self._slots_by_key.get(key)
+        if slot is None:
+            return self._extra is not None and key in self._extra
+        try:
+            object.__getattribute__(self, slot)
+        except AttributeError:
+            return False
+        return True
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._attrs_by_key.get(key)
+        if attr is not None:
+            if not self._has(key):
+                raise KeyError(key)
+            return getattr(self, attr)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for _attr, key in self._fields:
+            if self._has(key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._has(key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to a plain dict, including nested models."""
+        return {key: _plain(self[key]) for key in self}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{self._attrs_by_key.get(k, k)}={self[k]!r}" for k in self)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self).from_dict, (self.to_dict(),))
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+class ColumnTemplate(Model):
+    """A column definition within a project template."""
+
+    __slots__ = ("id", "label", "prompt", "format", "category")
+    _fields = (
+        ("id", "id"),
+        ("label", "label"),
+        ("prompt", "prompt"),
+        ("format", "format"),
+        ("category", "category"),
+    )
+
+    id: Optional[str]
+    label: Optional[str]
+    prompt: Optional[str]
+    format: Optional[str]
+    category: Optional[str]
+
+
+class Template(Model):
+    """A project template. columns is decoded into ColumnTemplate models on first access."""
+
+    __slots__ = ("id", "name", "description", "category", "_columns")
+    columns = _Nested(ColumnTemplate)
+    _fields = (
+        ("id", "id"),
+        ("name", "name"),
+        ("description", "description"),
+        ("category", "category"),
+        ("columns", "columns"),
+    )
+
+    id: Optional[str]
+    name: Optional[str]
+    description: Optional[str]
+    category: Optional[str]
+
+
+class Project(Model):
+    """A project."""
+
+    __slots__ = ("id", "name", "template_id", "document_count", "created_at", "updated_at")
+    _fields = (
+        ("id", "id"),
+        ("name", "name"),
+        ("template_id", "templateId"),
+        ("document_count", "documentCount"),
+        ("created_at", "createdAt"),
+        ("updated_at", "updatedAt"),
+    )
+
+    id: Optional[str]
+    name: Optional[str]
+    template_id: Optional[str]
+    document_count: Optional[int]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+
+class Document(Model):
+    """An uploaded document."""
+
+    __slots__ = ("id", "name", "mime_type", "size", "status", "created_at")
+    _fields = (
+        ("id", "id"),
+        ("name", "name"),
+        ("mime_type", "mimeType"),
+        ("size", "size"),
+        ("status", "status"),
+        ("created_at", "createdAt"),
+    )
+
+    id: Optional[str]
+    name: Optional[str]
+    mime_type: Optional[str]
+    size: Optional[int]
+    status: Optional[str]
+    created_at: Optional[str]
+
+
+class Job(Model):
+    """An extraction job."""
+
+    __slots__ = (
+        "id", "project_id", "status", "total_tasks", "completed_tasks", "failed_tasks",
+        "progress", "mode", "created_at", "completed_at",
+    )
+    _fields = (
+        ("id", "id"),
+        ("project_id", "projectId"),
+        ("status", "status"),
+        ("total_tasks", "totalTasks"),
+        ("completed_tasks", "completedTasks"),
+        ("failed_tasks", "failedTasks"),
+        ("progress", "progress"),
+        ("mode", "mode"),
+        ("created_at", "createdAt"),
+        ("completed_at", "completedAt"),
+    )
+
+    id: Optional[str]
+    project_id: Optional[str]
+    status: Optional[str]
+    total_tasks: Optional[int]
+    completed_tasks: Optional[int]
+    failed_tasks: Optional[int]
+    progress: Optional[int]
+    mode: Optional[str]
+    created_at: Optional[str]
+    completed_at: Optional[str]
+
+
+class Export(Model):
+    """A project export."""
+
+    __slots__ = ("id", "project_id", "format", "status", "created_at")
+    _fields = (
+        ("id", "id"),
+        ("project_id", "projectId"),
+        ("format", "format"),
+        ("status", "status"),
+        ("created_at", "createdAt"),
+    )
+
+    id: Optional[str]
+    project_id: Optional[str]
+    format: Optional[str]
+    status: Optional[str]
+    created_at: Optional[str]
+
+
+def decode_list(model: Type[M], items: List[Any]) -> List[Any]:
+    """Convert a list of API objects, leaving anything that is not a dict as is."""
+    return [model.from_dict(item) if isinstance(item, dict) else item for item in items]
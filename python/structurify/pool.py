@@ -0,0 +1,289 @@
+"""
+Multi-key Client Pool
+
+Spreads calls across several configured clients (API keys, organizations or
+regional base URLs) and fails over when one of them runs out of credits or
+hits its rate limit.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from structurify.client import Structurify
+from structurify.exceptions import InsufficientCreditsError, RateLimitError, StructurifyError
+
+LEAST_LOADED = "least_loaded"
+QUOTA_AWARE = "quota_aware"
+STICKY = "sticky"
+
+_STRATEGIES = (LEAST_LOADED, QUOTA_AWARE, STICKY)
+_KEY_ARGS = ("project_id", "document_id", "job_id", "export_id", "template_id")
+
+
+class _Member:
+    """A pooled client and its routing state."""
+
+    def __init__(self, client: Structurify, index: int):
+        self.client = client
+        self.index = index
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.unavailable_until = 0.0
+        self.unavailable_reason: Optional[str] = None
+
+    def available(self, now: float) -> bool:
+        return now >= self.unavailable_until
+
+    def remaining_quota(self) -> float:
+        status = self.client.rate_limit_status
+        if status is None or status.remaining is None:
+            return float("inf")
+        return float(status.remaining)
+
+    def remaining_credits(self) -> float:
+        credits = self.client.credits_remaining
+        return float("inf") if credits is None else float(credits)
+
+
+class _ResourceProxy:
+    """Routes calls to a resource (e.g. pool.documents) through the pool."""
+
+    def __init__(self, pool: "StructurifyPool", resource: str):
+        self._pool = pool
+        self._resource = resource
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._pool._call(self._resource, method, args, kwargs)
+
+        call.__name__ = method
+        return call
+
+
+class StructurifyPool:
+    """
+    Route calls across several Structurify clients.
+
+    The pool exposes the same resources as a single client. Each call is sent
+    to one member chosen by the strategy:
+
+    - "least_loaded": the member with the fewest calls in flight
+    - "quota_aware": the member with the most rate-limit quota remaining, as
+      reported by X-RateLimit-Remaining, then the most credits remaining
+    - "sticky": the member that owns the call's project/document/job/export;
+      new keys go to the least-loaded member and stay there
+
+    Objects created through the pool are remembered as belonging to the
+    member that created them, and calls about them always go back to it,
+    since another organization's key cannot see them. Unpinned calls that
+    fail with 402 or 429 are retried on another member, and the failing
+    member is skipped until its cooldown (or Retry-After) expires. A member
+    that reports no credits left is skipped the same way. Members should be
+    built with retry_rate_limits=False (from_keys does this), so that a 429
+    moves the call at once instead of after the member's own retries.
+
+    Example:
+        pool = StructurifyPool.from_keys(
+            ["sk_live_org_a", "sk_live_org_b"], strategy="sticky", max_retries=1
+        )
+        project = pool.projects.create(name="Q1", template_id="tpl_invoice")
+        pool.documents.upload(project["id"], file_path="invoice.pdf")
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[Structurify],
+        strategy: str = LEAST_LOADED,
+        credit_cooldown: float = 300.0,
+        rate_limit_cooldown: float = 60.0,
+        max_pinned: int = 100_000,
+    ):
+        """
+        Args:
+            clients: Configured clients to route between
+            strategy: "least_loaded", "quota_aware" or "sticky"
+            credit_cooldown: Seconds to skip a member after a 402
+            rate_limit_cooldown: Seconds to skip a member after a 429 without Retry-After
+            max_pinned: Maximum number of object-to-member assignments remembered
+        """
+        if not clients:
+            raise ValueError("At least one client is required")
+        if strategy not in _STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}; expected one of {_STRATEGIES}")
+
+        self._members = [_Member(client, i) for i, client in enumerate(clients)]
+        self._strategy = strategy
+        self._credit_cooldown = credit_cooldown
+        self._rate_limit_cooldown = rate_limit_cooldown
+        self._max_pinned = max_pinned
+        self._pinned: "OrderedDict[str, _Member]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.templates = _ResourceProxy(self, "templates")
+        self.projects = _ResourceProxy(self, "projects")
+        self.documents = _ResourceProxy(self, "documents")
+        self.extraction = _ResourceProxy(self, "extraction")
+        self.exports = _ResourceProxy(self, "exports")
+
+    @classmethod
+    def from_keys(
+        cls,
+        api_keys: Sequence[str],
+        base_urls: Optional[Sequence[Optional[str]]] = None,
+        strategy: str = LEAST_LOADED,
+        **client_kwargs: Any,
+    ) -> "StructurifyPool":
+        """
+        Build a pool with one client per API key.
+
+        Clients are built with retry_rate_limits=False unless it is passed,
+        so that a 429 fails over to another key without waiting.
+
+        Args:
+            api_keys: API keys to pool
+            base_urls: Optional base URL per key (same order as api_keys)
+            strategy: Routing strategy
+            **client_kwargs: Passed to every Structurify client
+        """
+        client_kwargs.setdefault("retry_rate_limits", False)
+        urls = list(base_urls) if base_urls is not None else [None] * len(api_keys)
+        if len(urls) != len(api_keys):
+            raise ValueError("base_urls must have one entry per API key")
+        clients = [
+            Structurify(api_key=key, base_url=url, **client_kwargs)
+            for key, url in zip(api_keys, urls)
+        ]
+        return cls(clients, strategy=strategy)
+
+    @property
+    def clients(self) -> List[Structurify]:
+        """The pooled clients, in configuration order."""
+        return [m.client for m in self._members]
+
+    def assign(self, key: str, client: Structurify) -> None:
+        """Pin an existing project, document, job or export ID to a pooled client."""
+        for member in self._members:
+            if member.client is client:
+                with self._lock:
+                    self._pin(key, member)
+                return
+        raise ValueError("client is not a member of this pool")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-member routing and quota state."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "index": m.index,
+                    "base_url": m.client._base_url,
+                    "in_flight": m.in_flight,
+                    "requests": m.requests,
+                    "failures": m.failures,
+                    "available": m.available(now),
+                    "unavailable_reason": None if m.available(now) else m.unavailable_reason,
+                    "rate_limit_remaining": (
+                        m.client.rate_limit_status.remaining
+                        if m.client.rate_limit_status else None
+                    ),
+                    "credits_remaining": m.client.credits_remaining,
+                }
+                for m in self._members
+            ]
+
+    def _pin(self, key: str, member: _Member) -> None:
+        self._pinned[key] = member
+        self._pinned.move_to_end(key)
+        while len(self._pinned) > self._max_pinned:
+            self._pinned.popitem(last=False)
+
+    @staticmethod
+    def _routing_key(args: Sequence[Any], kwargs: Dict[str, Any]) -> Optional[str]:
+        for name in _KEY_ARGS:
+            if isinstance(kwargs.get(name), str):
+                return str(kwargs[name])
+        if args and isinstance(args[0], str):
+            return args[0]
+        return None
+
+    def _choose(self, key: Optional[str], exclude: List[_Member]) -> _Member:
+        now = time.monotonic()
+        candidates = [m for m in self._members if m not in exclude and m.available(now)]
+        if not candidates:
+            # Everything is cooling down: use whichever recovers first
+            remaining = [m for m in self._members if m not in exclude] or self._members
+            candidates = [min(remaining, key=lambda m: m.unavailable_until)]
+
+        if self._strategy == QUOTA_AWARE:
+            return max(
+                candidates,
+                key=lambda m: (m.remaining_quota(), m.remaining_credits(), -m.in_flight),
+            )
+        member = min(candidates, key=lambda m: (m.in_flight, m.requests))
+        if self._strategy == STICKY and key is not None:
+            self._pin(key, member)
+        return member
+
+    def _record_created(self, result: Any, member: _Member) -> None:
+        if not isinstance(result, Mapping):
+            return
+        for obj in [result] + [result.get(k) for k in ("project", "document", "job", "export")]:
+            if isinstance(obj, Mapping) and isinstance(obj.get("id"), str):
+                self._pin(obj["id"], member)
+
+    def _call(
+        self, resource: str, method: str, args: Sequence[Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        key = self._routing_key(args, kwargs)
+        tried: List[_Member] = []
+
+        while True:
+            with self._lock:
+                pinned = self._pinned.get(key) if key is not None else None
+                member = pinned or self._choose(key, tried)
+                member.in_flight += 1
+                member.requests += 1
+
+            try:
+                result = getattr(getattr(member.client, resource), method)(*args, **kwargs)
+            except (InsufficientCreditsError, RateLimitError) as e:
+                with self._lock:
+                    member.failures += 1
+                    if isinstance(e, InsufficientCreditsError):
+                        cooldown, member.unavailable_reason = self._credit_cooldown, "credits"
+                    else:
+                        cooldown = float(e.retry_after or self._rate_limit_cooldown)
+                        member.unavailable_reason = "rate_limit"
+                    member.unavailable_until = time.monotonic() + cooldown
+                    if pinned is None and key is not None and self._pinned.get(key) is member:
+                        # Assigned by this call, so it is free to move
+                        del self._pinned[key]
+                tried.append(member)
+                if pinned is not None or len(tried) >= len(self._members):
+                    raise
+                continue
+            except StructurifyError:
+                with self._lock:
+                    member.failures += 1
+                raise
+            finally:
+                with self._lock:
+                    member.in_flight -= 1
+                    if member.client.credits_remaining == 0 and member.available(time.monotonic()):
+                        # The balance ran out without a 402; don't send more work there
+                        member.unavailable_until = time.monotonic() + self._credit_cooldown
+                        member.unavailable_reason = "credits"
+
+            with self._lock:
+                self._record_created(result, member)
+            return result
@@ -0,0 +1,239 @@
+"""
+Upload Preflight Validation
+
+Cheap local checks that reject files before any bytes are sent: content
+sniffing from magic bytes, size limits, supported types, and truncated or
+encrypted PDFs. Only the first and last few KB of a file are read.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import os
+import zipfile
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from structurify.exceptions import PreflightError
+from structurify.resources.documents import MIME_TYPES, _get_mime_type
+
+SNIFF_BYTES = 8192
+
+# Rejection reasons reported in PreflightResult.reason
+EMPTY = "empty"
+TOO_LARGE = "too_large"
+UNSUPPORTED_TYPE = "unsupported_type"
+MIME_MISMATCH = "mime_mismatch"
+CORRUPT_PDF = "corrupt_pdf"
+ENCRYPTED_PDF = "encrypted_pdf"
+UNREADABLE = "unreadable"
+
+_ZIP_TYPES = {
+    "word/": MIME_TYPES[".docx"],
+    "xl/": MIME_TYPES[".xlsx"],
+    "ppt/": MIME_TYPES[".pptx"],
+}
+
+
+def sniff_mime_type(head: bytes) -> Optional[str]:
+    """
+    Identify a file type from its leading bytes.
+
+    Returns:
+        The detected MIME type, "application/zip" for an unidentified ZIP
+        container, or None if the signature is not recognized.
+    """
+    if head.startswith(b"%PDF-"):
+        return "application/pdf"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head.startswith((b"II*\x00", b"MM\x00*")):
+        return "image/tiff"
+    if head.startswith(b"BM"):
+        return "image/bmp"
+    if head.startswith(b"PK\x03\x04"):
+        # OpenDocument stores its type uncompressed as the first entry
+        if head[30:38] == b"mimetype":
+            odf_type = head[38:38 + 64].split(b"PK", 1)[0].decode("ascii", "ignore")
+            if odf_type in MIME_TYPES.values():
+                return odf_type
+        for prefix, mime_type in _ZIP_TYPES.items():
+            if prefix.encode() in head:
+                return mime_type
+        return "application/zip"
+    return None
+
+
+@dataclass
+class PreflightResult:
+    """Outcome of a preflight check. A rejected file has ok=False and a reason."""
+
+    name: str
+    size: int
+    mime_type: str
+    declared_mime_type: str
+    reason: Optional[str] = None
+    message: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """True if the file may be uploaded."""
+        return self.reason is None
+
+
+class Preflight:
+    """
+    Validate files locally before upload.
+
+    When the sniffed type differs from the one implied by the file name, the
+    sniffed type is used for the upload, unless strict is set, in which case
+    the file is rejected.
+
+    Example:
+        preflight = Preflight(max_size=50 * 1024 * 1024)
+        result = preflight.check_path("scan.pdf")
+        if not result.ok:
+            print(result.reason, result.message)
+
+        client.documents.upload("proj_xxx", file_path="scan.pdf", preflight=preflight)
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        min_size: int = 1,
+        allowed_types: Optional[Iterable[str]] = None,
+        strict: bool = False,
+        check_pdf: bool = True,
+    ):
+        """
+        Args:
+            max_size: Largest accepted file in bytes (default unlimited)
+            min_size: Smallest accepted file in bytes (default 1, rejecting empty files)
+            allowed_types: Accepted MIME types (default every type in MIME_TYPES)
+            strict: Reject files whose content does not match their declared type
+            check_pdf: Detect truncated and encrypted PDFs
+        """
+        self.max_size = max_size
+        self.min_size = min_size
+        self.allowed_types = set(allowed_types or MIME_TYPES.values())
+        self.strict = strict
+        self.check_pdf = check_pdf
+
+    def check_path(
+        self, path: str, name: Optional[str] = None, mime_type: Optional[str] = None
+    ) -> PreflightResult:
+        """
+        Check a file on disk, reading only its head and tail.
+
+        Args:
+            path: Path to the file
+            name: Document name (default: the file's basename)
+            mime_type: Declared MIME type (default: guessed from the name)
+        """
+        name = name or os.path.basename(path)
+        try:
+            size = os.path.getsize(path)
+            with open(path, "rb") as f:
+                head = f.read(SNIFF_BYTES)
+                f.seek(max(0, size - SNIFF_BYTES))
+                tail = f.read(SNIFF_BYTES)
+        except OSError as e:
+            declared = mime_type or _get_mime_type(name)
+            return PreflightResult(name, 0, declared, declared, UNREADABLE, str(e))
+
+        return self._check(name, size, head, tail, mime_type, path)
+
+    def check_bytes(
+        self, content: bytes, name: str, mime_type: Optional[str] = None
+    ) -> PreflightResult:
+        """
+        Check in-memory file content.
+
+        Args:
+            content: Raw file bytes
+            name: Document name
+            mime_type: Declared MIME type (default: guessed from the name)
+        """
+        return self._check(
+            name, len(content), content[:SNIFF_BYTES], content[-SNIFF_BYTES:], mime_type, None
+        )
+
+    def _check(
+        self,
+        name: str,
+        size: int,
+        head: bytes,
+        tail: bytes,
+        mime_type: Optional[str],
+        path: Optional[str],
+    ) -> PreflightResult:
+        declared = mime_type or _get_mime_type(name)
+        result = PreflightResult(name, size, declared, declared)
+
+        def reject(reason: str, message: str) -> PreflightResult:
+            result.reason = reason
+            result.message = message
+            return result
+
+        if size < self.min_size:
+            return reject(EMPTY, f"{name} is {size} bytes")
+        if self.max_size is not None and size > self.max_size:
+            return reject(TOO_LARGE, f"{name} is {size} bytes (limit {self.max_size})")
+
+        sniffed = sniff_mime_type(head)
+        if sniffed == "application/zip" and declared in MIME_TYPES.values():
+            sniffed = self._zip_type(path) or (declared if "officedocument" in declared else None)
+
+        if sniffed and sniffed != declared:
+            if self.strict:
+                return reject(
+                    MIME_MISMATCH, f"{name} is declared {declared} but contains {sniffed}"
+                )
+            result.mime_type = sniffed
+        elif not sniffed and declared in MIME_TYPES.values():
+            # Every supported format has a signature, so this is mislabeled or corrupt
+            return reject(MIME_MISMATCH, f"{name} does not look like {declared}")
+
+        if result.mime_type not in self.allowed_types:
+            return reject(UNSUPPORTED_TYPE, f"{name} has unsupported type {result.mime_type}")
+
+        if self.check_pdf and result.mime_type == "application/pdf":
+            if b"%%EOF" not in tail:
+                return reject(CORRUPT_PDF, f"{name} is truncated (no %%EOF marker)")
+            if b"/Encrypt" in tail or b"/Encrypt" in head:
+                return reject(ENCRYPTED_PDF, f"{name} is encrypted")
+
+        return result
+
+    @staticmethod
+    def _zip_type(path: Optional[str]) -> Optional[str]:
+        """Identify an Office Open XML package from its entry names."""
+        if not path:
+            return None
+        try:
+            with zipfile.ZipFile(path) as archive:
+                names = archive.namelist()
+        except (OSError, zipfile.BadZipFile):
+            return None
+        for prefix, mime_type in _ZIP_TYPES.items():
+            if any(n.startswith(prefix) for n in names):
+                return mime_type
+        return None
+
+    def enforce(self, result: PreflightResult) -> PreflightResult:
+        """
+        Raise for a rejected result.
+
+        Raises:
+            PreflightError: If the result is not ok
+        """
+        if not result.ok:
+            raise PreflightError(result.message, reason=result.reason, result=result)
+        return result
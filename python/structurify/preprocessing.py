@@ -0,0 +1,317 @@
+"""
+Client-side Document Preprocessing
+
+Shrinks files before upload: downsamples oversized scans, re-encodes images
+into smaller formats and recompresses PDFs. Transforms run in a process pool
+so CPU-heavy work does not stall concurrent uploads.
+
+Image transforms require Pillow and PDF transforms require pypdf:
+
+    pip install structurify[preprocess]
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence
+
+from structurify.resources.documents import MIME_TYPES, _get_mime_type
+
+
+@dataclass
+class PreparedFile:
+    """A file ready for upload, along with what preprocessing did to it."""
+
+    name: str
+    content: bytes
+    mime_type: str
+    original_size: int = 0
+    applied: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.original_size:
+            self.original_size = len(self.content)
+
+    @property
+    def size(self) -> int:
+        """Current size in bytes."""
+        return len(self.content)
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes removed by preprocessing."""
+        return self.original_size - self.size
+
+
+@dataclass
+class PreprocessReport:
+    """Per-file summary of preprocessing, kept after the content is uploaded."""
+
+    name: str
+    original_size: int
+    size: int
+    applied: List[str]
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes removed by preprocessing."""
+        return self.original_size - self.size
+
+
+Transform = Callable[[PreparedFile], PreparedFile]
+
+
+def _rename(name: str, ext: str) -> str:
+    return os.path.splitext(name)[0] + ext
+
+
+class DownsampleImage:
+    """
+    Downsample high-DPI scans and re-encode them compactly.
+
+    Bilevel and grayscale scans are written as PNG; colour images as JPEG.
+    Multi-frame images (e.g. multi-page TIFFs) and GIFs are left unchanged.
+    """
+
+    name = "downsample_image"
+
+    def __init__(self, max_dpi: int = 200, max_dimension: int = 5000, jpeg_quality: int = 85):
+        """
+        Args:
+            max_dpi: Resolution scans are reduced to when their DPI is higher
+            max_dimension: Longest allowed side in pixels, regardless of DPI
+            jpeg_quality: Quality used when encoding colour images as JPEG
+        """
+        self.max_dpi = max_dpi
+        self.max_dimension = max_dimension
+        self.jpeg_quality = jpeg_quality
+
+    def __call__(self, file: PreparedFile) -> PreparedFile:
+        if not file.mime_type.startswith("image/") or file.mime_type == "image/gif":
+            return file
+
+        try:
+            from PIL import Image
+        except ImportError as e:
+            raise ImportError(
+                "Pillow is required for DownsampleImage: pip install structurify[preprocess]"
+            ) from e
+        # Pillow 9.1 moved the filters into an enum; older versions only have the constant
+        lanczos = getattr(Image, "Resampling", Image).LANCZOS
+
+        image: Image.Image = Image.open(io.BytesIO(file.content))
+        if getattr(image, "n_frames", 1) > 1:
+            return file
+
+        width, height = image.size
+        dpi = image.info.get("dpi", (0, 0))[0] or 0
+        scale = 1.0
+        if dpi and dpi > self.max_dpi:
+            scale = self.max_dpi / float(dpi)
+        if max(width, height) * scale > self.max_dimension:
+            scale = self.max_dimension / float(max(width, height))
+
+        if scale < 1.0:
+            image = image.resize(
+                (max(1, round(width * scale)), max(1, round(height * scale))),
+                lanczos,
+            )
+            dpi = round(dpi * scale) if dpi else 0
+
+        out = io.BytesIO()
+        save_kwargs = {"dpi": (dpi, dpi)} if dpi else {}
+        if image.mode in ("1", "L", "P"):
+            image.save(out, format="PNG", optimize=True, **save_kwargs)
+            ext = ".png"
+        else:
+            image.convert("RGB").save(
+                out, format="JPEG", quality=self.jpeg_quality, optimize=True, **save_kwargs
+            )
+            ext = ".jpg"
+
+        return PreparedFile(
+            name=_rename(file.name, ext),
+            content=out.getvalue(),
+            mime_type=MIME_TYPES[ext],
+            original_size=file.original_size,
+            applied=file.applied + [self.name],
+        )
+
+
+class CompressPdf:
+    """
+    Recompress PDF content streams and drop duplicate objects and metadata.
+
+    Encrypted PDFs are left unchanged. pypdf cannot linearize, so the output
+    is optimized for size rather than for incremental viewing.
+    """
+
+    name = "compress_pdf"
+
+    def __init__(self, strip_metadata: bool = True):
+        """
+        Args:
+            strip_metadata: Remove the document information dictionary and XMP metadata
+        """
+        self.strip_metadata = strip_metadata
+
+    def __call__(self, file: PreparedFile) -> PreparedFile:
+        if file.mime_type != "application/pdf":
+            return file
+
+        try:
+            from pypdf import PdfReader, PdfWriter
+        except ImportError as e:
+            raise ImportError(
+                "pypdf is required for CompressPdf: pip install structurify[preprocess]"
+            ) from e
+
+        reader = PdfReader(io.BytesIO(file.content))
+        if reader.is_encrypted:
+            return file
+
+        writer = PdfWriter(clone_from=reader)
+        for page in writer.pages:
+            page.compress_content_streams()
+        if self.strip_metadata:
+            writer.metadata = None
+            writer.root_object.pop("/Metadata", None)
+        if hasattr(writer, "compress_identical_objects"):
+            writer.compress_identical_objects()
+
+        out = io.BytesIO()
+        writer.write(out)
+        return PreparedFile(
+            name=file.name,
+            content=out.getvalue(),
+            mime_type=file.mime_type,
+            original_size=file.original_size,
+            applied=file.applied + [self.name],
+        )
+
+
+def default_transforms() -> List[Transform]:
+    """Return the built-in transforms: image downsampling and PDF compression."""
+    return [DownsampleImage(), CompressPdf()]
+
+
+def apply_transforms(file: PreparedFile, transforms: Sequence[Transform]) -> PreparedFile:
+    """
+    Run transforms in order, keeping each output only if it is smaller.
+
+    A transform that fails on a particular file leaves it as it was, so a
+    malformed input is uploaded unchanged. A missing optional dependency is
+    still raised.
+    """
+    for transform in transforms:
+        try:
+            candidate = transform(file)
+        except ImportError:
+            raise
+        except Exception:
+            continue
+        if candidate.size < file.size:
+            file = candidate
+    return file
+
+
+def _prepare_path(path: str, transforms: Sequence[Transform]) -> PreparedFile:
+    """Read and transform a file. Runs inside pool workers."""
+    with open(path, "rb") as f:
+        content = f.read()
+    name = os.path.basename(path)
+    return apply_transforms(PreparedFile(name, content, _get_mime_type(name)), transforms)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Start method for pool workers: forkserver where available, else spawn."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class Preprocessor:
+    """
+    Pluggable preprocessing stage in front of document uploads.
+
+    A transform is any picklable callable that takes a PreparedFile and
+    returns a PreparedFile (module-level functions and class instances both
+    work). Outputs larger than their input are discarded.
+
+    Example:
+        with Preprocessor() as preprocessor:
+            results = client.documents.upload_many(
+                "proj_xxx", paths, concurrency=16, preprocessor=preprocessor
+            )
+        print(sum(r.bytes_saved for r in preprocessor.reports), "bytes saved")
+    """
+
+    def __init__(
+        self,
+        transforms: Optional[Sequence[Transform]] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            transforms: Transforms to apply (default: default_transforms())
+            max_workers: Size of the process pool (default: CPU count)
+            executor: Optional executor to use instead of a private process pool
+        """
+        self.transforms = list(transforms) if transforms is not None else default_transforms()
+        self.reports: List[PreprocessReport] = []
+        self._max_workers = max_workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                # Submissions come from threads that may be mid-request, so the
+                # workers must not be forked from this process
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers, mp_context=_pool_context()
+                )
+            return self._executor
+
+    def _record(self, file: PreparedFile) -> PreparedFile:
+        report = PreprocessReport(file.name, file.original_size, file.size, list(file.applied))
+        with self._lock:
+            self.reports.append(report)
+        return file
+
+    def apply(self, file: PreparedFile) -> PreparedFile:
+        """Transform an in-memory file in the calling thread."""
+        return self._record(apply_transforms(file, self.transforms))
+
+    def submit(self, path: str) -> "Future[PreparedFile]":
+        """Read and transform a file on the pool."""
+        future = self._get_executor().submit(_prepare_path, path, self.transforms)
+
+        def record(done: "Future[PreparedFile]") -> None:
+            if not done.cancelled() and done.exception() is None:
+                self._record(done.result())
+
+        future.add_done_callback(record)
+        return future
+
+    def close(self) -> None:
+        """Shut down the private process pool, if one was started."""
+        if not self._owns_executor:
+            return
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> "Preprocessor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
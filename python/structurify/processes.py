@@ -0,0 +1,110 @@
+"""
+Process Pool Helpers
+
+Runs a function over many inputs on a ProcessPoolExecutor with one client
+per worker process, for workloads where CPU-bound work (preprocessing,
+parsing) would otherwise be limited to one core.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from structurify.bulk import BulkProgress, BulkResult
+from structurify.client import Structurify
+from structurify.config import ClientConfig
+from structurify.ratelimit import HostRateLimiter
+
+T = TypeVar("T")
+
+# The worker process's client, created once by _init_worker
+_worker_client: Optional[Structurify] = None
+
+
+def _init_worker(config: ClientConfig) -> None:
+    global _worker_client
+    _worker_client = Structurify.from_config(config)
+
+
+def worker_client() -> Structurify:
+    """
+    Return the current worker process's client.
+
+    Only available inside functions run by process_map.
+    """
+    if _worker_client is None:
+        raise RuntimeError("worker_client() is only available inside process_map workers")
+    return _worker_client
+
+
+def _call(func: Callable[[Structurify, Any], Any], item: Any) -> Tuple[Any, Optional[Exception]]:
+    try:
+        return func(worker_client(), item), None
+    except Exception as e:
+        return None, e
+
+
+def process_map(
+    func: Callable[[Structurify, T], Any],
+    items: Iterable[T],
+    config: ClientConfig,
+    processes: Optional[int] = None,
+    key: Callable[[T], str] = str,
+    on_progress: Optional[Callable[[BulkProgress], None]] = None,
+) -> List[BulkResult]:
+    """
+    Call func(client, item) for every item on a pool of worker processes.
+
+    Each process builds its own client from config once, so no connections
+    are shared across processes. func, the items and the return values must
+    be picklable (func must be defined at module level). A client-side
+    rate_limit in config is split evenly between the processes so that
+    together they stay within it; a HostRateLimiter is already shared and
+    is left as is.
+
+    Args:
+        func: Function called as func(client, item) in a worker process
+        items: Items to process
+        config: Client settings, e.g. client.config
+        processes: Number of worker processes (default: CPU count)
+        key: Returns the identifier reported in each BulkResult
+        on_progress: Optional callback invoked in this process after each item
+
+    Returns:
+        One BulkResult per item, in input order.
+
+    Example:
+        def prepare_and_upload(client, path):
+            data = expensive_cleanup(path)
+            return client.documents.upload("proj_xxx", file_bytes=data, name=path)
+
+        results = process_map(prepare_and_upload, paths, client.config, processes=8)
+    """
+    items = list(items)
+    processes = processes or os.cpu_count() or 1
+    if config.rate_limit and not isinstance(config.rate_limit, HostRateLimiter):
+        config = ClientConfig(**{**config.to_kwargs(), "rate_limit": config.rate_limit / processes})
+
+    progress = BulkProgress(len(items))
+    results: List[Optional[BulkResult]] = [None] * len(items)
+
+    with ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker, initargs=(config,)
+    ) as executor:
+        futures = {executor.submit(_call, func, item): i for i, item in enumerate(items)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                value, error = future.result()
+            except Exception as e:
+                # The call itself failed to run, e.g. unpicklable arguments or a crashed worker
+                value, error = None, e
+            results[index] = BulkResult(key(items[index]), value=value, error=error)
+            progress.record(error is None)
+            if on_progress:
+                on_progress(progress)
+
+    return [r for r in results if r is not None]
@@ -0,0 +1,334 @@
+"""
+Client-side Rate Limiting
+
+RateLimiter is a token bucket for the clients in one process.
+HostRateLimiter keeps its bucket in a memory-mapped file, so that every
+client on a machine draws from it, and slows all of them down when the
+server answers 429.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import contextlib
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from structurify import cancellation
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every request a client makes.
+
+    Example:
+        limiter = RateLimiter(rate=1.0, burst=5)  # 60 requests per minute
+        client = Structurify(api_key="sk_live_xxx", rate_limit=limiter)
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of requests allowed back-to-back (default max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._owner_pid = os.getpid()
+
+    def _after_fork(self) -> None:
+        # A lock held by another thread at fork time stays held in the child
+        if self._owner_pid != os.getpid():
+            self._lock = threading.Lock()
+            self._owner_pid = os.getpid()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, otherwise the seconds until one will be.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a token is available, then take it.
+
+        Args:
+            timeout: Give up, without waiting, if no token will be free within this many seconds
+
+        Returns:
+            True if a token was taken, False if it would not arrive within timeout.
+
+        Raises:
+            OperationCancelledError: If the current cancellation token is cancelled while waiting
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            cancellation.sleep(wait)
+
+    def record_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """
+        Called by the client when the server answers 429.
+
+        A RateLimiter keeps its configured rate; HostRateLimiter learns from it.
+
+        Args:
+            retry_after: Seconds from the Retry-After header, if any
+        """
+
+
+class HostRateLimiter(RateLimiter):
+    """
+    Token bucket shared by every process on a machine.
+
+    Limiters created with the same key and directory, in any process,
+    draw from one bucket kept in a small memory-mapped file, so together
+    they stay within rate. When the server answers 429, every attached
+    client stops until Retry-After has passed, and the shared rate is cut
+    by backoff. It then recovers by recovery x rate per second.
+
+    Updates are serialised with an fcntl lock. Where fcntl is not available
+    (Windows), only threads within a process are serialised. Times are
+    wall-clock so that all processes agree on them.
+
+    Example:
+        # In each of 32 worker processes
+        limiter = HostRateLimiter(rate=50, key="acme-prod")
+        client = Structurify(api_key="sk_live_xxx", rate_limit=limiter)
+    """
+
+    # magic, tokens, updated, paused until, rate scale, time of the last cut
+    _LAYOUT = struct.Struct("<8sddddd")
+    _MAGIC = b"SRLIM001"
+
+    # 429s for requests sent before a cut took effect don't cut again
+    CUT_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        key: str = "default",
+        directory: Optional[str] = None,
+        backoff: float = 0.7,
+        min_scale: float = 0.05,
+        recovery: float = 0.02,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second for the whole machine
+            burst: Maximum number of requests allowed back-to-back (default max(1, rate))
+            key: Name of the shared bucket, e.g. the account. It is hashed, so an
+                API key can be used without being written to disk.
+            directory: Where the bucket file lives (default the system temp directory)
+            backoff: Factor the rate is multiplied by on a 429
+            min_scale: Lowest fraction of rate that 429s can cut it to
+            recovery: Fraction of rate regained per second after a cut
+        """
+        super().__init__(rate, burst)
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if not 0 < min_scale <= 1:
+            raise ValueError("min_scale must be between 0 and 1")
+        self.key = key
+        self.directory = os.path.abspath(os.path.expanduser(directory or tempfile.gettempdir()))
+        self.backoff = backoff
+        self.min_scale = min_scale
+        self.recovery = recovery
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(self.directory, f"structurify-ratelimit-{name}")
+        self._map: Optional[mmap.mmap] = None
+        self._open()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Attach to the same bucket when unpickled in another process
+        return (
+            HostRateLimiter,
+            (self.rate, self.burst, self.key, self.directory, self.backoff, self.min_scale,
+             self.recovery),
+        )
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "HostRateLimiter":
+        # A handle on shared state; ClientConfig.to_kwargs() copies fields
+        return self
+
+    def __repr__(self) -> str:
+        return f"HostRateLimiter(rate={self.rate}, burst={self.burst}, path={self.path!r})"
+
+    def _open(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size < self._LAYOUT.size:
+                os.ftruncate(fd, self._LAYOUT.size)
+            self._map = mmap.mmap(fd, self._LAYOUT.size)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Detach from the shared bucket."""
+        if self._map is not None:
+            self._map.close()
+            os.close(self._fd)
+            self._map = None
+
+    @contextlib.contextmanager
+    def _locked(self, now: float) -> Iterator[List[float]]:
+        """
+        Hold the bucket across threads and processes.
+
+        Yields the state brought up to now as [tokens, updated, paused_until,
+        scale, last_cut]; changes to it are written back.
+        """
+        if os.getpid() != self._pid:
+            # A forked child shares the parent's descriptor, and with it the
+            # parent's flock, so it needs one of its own
+            self.close()
+            self._open()
+        with self._lock:
+            assert self._map is not None, "limiter is closed"
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                magic, *values = self._LAYOUT.unpack_from(self._map)
+                state = values if magic == self._MAGIC else [self.burst, now, 0.0, 1.0, 0.0]
+                self._advance(state, now)
+                yield state
+                self._LAYOUT.pack_into(self._map, 0, self._MAGIC, *state)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _advance(self, state: List[float], now: float) -> None:
+        tokens, updated, paused_until, scale, _ = state
+        # Nothing accrues while paused; a clock stepped backwards accrues nothing
+        elapsed = max(0.0, now - max(updated, paused_until))
+        scale = min(1.0, scale + elapsed * self.recovery)
+        state[0] = min(self.burst, tokens + elapsed * self.rate * scale)
+        state[1] = now
+        state[3] = scale
+
+    def try_acquire(self) -> float:
+        """
+        Take a token from the shared bucket if one is available.
+
+        Returns:
+            0.0 if a token was taken, otherwise the seconds until one will be.
+        """
+        now = time.time()
+        with self._locked(now) as state:
+            if now < state[2]:
+                return state[2] - now
+            if state[0] >= 1:
+                state[0] -= 1
+                return 0.0
+            return (1 - state[0]) / (self.rate * state[3])
+
+    def record_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """
+        Slow every attached client after a 429.
+
+        Args:
+            retry_after: Seconds from the Retry-After header; sending pauses until then
+        """
+        now = time.time()
+        with self._locked(now) as state:
+            state[0] = 0.0
+            if retry_after:
+                state[2] = max(state[2], now + retry_after)
+            if now - state[4] >= self.CUT_INTERVAL:
+                state[3] = max(self.min_scale, state[3] * self.backoff)
+                state[4] = now
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Current shared state.
+
+        Returns:
+            Dict with the configured rate, the learned current_rate, the
+            tokens available and paused_for (seconds until sending resumes).
+        """
+        now = time.time()
+        with self._locked(now) as state:
+            tokens, _, paused_until, scale, _ = state
+        return {
+            "rate": self.rate,
+            "current_rate": self.rate * scale,
+            "tokens": tokens,
+            "paused_for": max(0.0, paused_until - now),
+        }
+
+
+@dataclass
+class RateLimitStatus:
+    """Server-reported rate limit state from the X-RateLimit-* response headers."""
+
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset: Optional[float] = None
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> Optional["RateLimitStatus"]:
+        """Parse rate limit headers, returning None if the response has none."""
+        def number(name: str) -> Optional[float]:
+            value = headers.get(name)
+            try:
+                return float(value) if value is not None else None
+            except ValueError:
+                return None
+
+        limit = number("X-RateLimit-Limit")
+        remaining = number("X-RateLimit-Remaining")
+        reset = number("X-RateLimit-Reset")
+        if limit is None and remaining is None and reset is None:
+            return None
+        return cls(
+            limit=int(limit) if limit is not None else None,
+            remaining=int(remaining) if remaining is not None else None,
+            reset=reset,
+        )
@@ -6,11 +6,26 @@ Licensed under the MIT License.
 """
 
 import base64
+import functools
+import mmap
 import os
-from typing import TYPE_CHECKING, Dict, Any, Optional, Union, BinaryIO
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union, BinaryIO, Callable, Iterable, List
+
+from structurify.bulk import BulkProgress, BulkResult, run_bulk, run_pipeline
+from structurify.models import Document
+from structurify.scheduler import BULK, current_priority, priority
+from structurify.splitting import is_split_id
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from structurify.autotune import AdaptiveConcurrency
+    from structurify.cache import DocumentCache
     from structurify.client import Structurify
+    from structurify.dirsync import DirSyncReport
+    from structurify.preflight import Preflight
+    from structurify.preprocessing import PreparedFile, Preprocessor
+    from structurify.splitting import PdfSplitter
 
 
 # MIME type mapping
@@ -39,6 +54,27 @@ def _get_mime_type(filename: str) -> str:
     return MIME_TYPES.get(ext, "application/octet-stream")
 
 
+def _reject_split_id(document_id: str) -> None:
+    # Logical IDs of split PDFs are unknown to the API; a request would only 404
+    if is_split_id(document_id):
+        raise ValueError(
+            f"{document_id} is a split document; use the chunk IDs its PdfSplitter lists"
+        )
+
+
+def collect_files(directory: str, recursive: bool = True) -> List[str]:
+    """List the files under directory with a supported extension, in sorted order."""
+    paths: List[str] = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            if os.path.splitext(filename)[1].lower() in MIME_TYPES:
+                paths.append(os.path.join(root, filename))
+        if not recursive:
+            break
+    return paths
+
+
 class DocumentsResource:
     """
     Resource for managing documents.
@@ -57,12 +93,19 @@ class DocumentsResource:
         file_obj: Optional[BinaryIO] = None,
         name: Optional[str] = None,
         mime_type: Optional[str] = None,
+        preprocessor: Optional["Preprocessor"] = None,
+        preflight: Optional["Preflight"] = None,
+        splitter: Optional["PdfSplitter"] = None,
     ) -> Dict[str, Any]:
         """
         Upload a document to a project.
 
         Provide one of: file_path, file_bytes, or file_obj.
 
+        With a splitter, a PDF longer than its threshold is uploaded as
+        page-range chunks in parallel and the returned document stands for
+        all of them (see PdfSplitter).
+
         Args:
             project_id: The project ID to upload to
             file_path: Path to file on disk
@@ -70,12 +113,17 @@ class DocumentsResource:
             file_obj: File-like object (must have read() method)
             name: Optional custom document name
             mime_type: Optional MIME type (auto-detected from filename)
+            preprocessor: Optional Preprocessor used to shrink the file first
+            preflight: Optional Preflight that validates the file before anything is sent
+            splitter: Optional PdfSplitter that breaks long PDFs into chunks
 
         Returns:
-            Uploaded document details.
+            Uploaded document details. For a split PDF, the logical document,
+            with its chunk documents under "chunks".
 
         Raises:
             ValueError: If no file source provided
+            PreflightError: If preflight rejects the file
             ValidationError: If file type not supported
 
         Example:
@@ -98,6 +146,10 @@ class DocumentsResource:
 
         if file_path:
             filename = name or os.path.basename(file_path)
+            if preflight:
+                # Checked before reading so oversized files are never loaded
+                checked = preflight.enforce(preflight.check_path(file_path, filename, mime_type))
+                mime_type = checked.mime_type
             with open(file_path, "rb") as f:
                 content = f.read()
         elif file_bytes:
@@ -113,10 +165,25 @@ class DocumentsResource:
         else:
             raise ValueError("One of file_path, file_bytes, or file_obj is required")
 
+        if preflight and not file_path:
+            checked = preflight.enforce(preflight.check_bytes(content, filename, mime_type))
+            mime_type = checked.mime_type
+
         # Determine MIME type
         if not mime_type:
             mime_type = _get_mime_type(filename)
 
+        if preprocessor:
+            from structurify.preprocessing import PreparedFile
+
+            prepared = preprocessor.apply(PreparedFile(filename, content, mime_type))
+            filename, content, mime_type = prepared.name, prepared.content, prepared.mime_type
+
+        if splitter and mime_type == "application/pdf":
+            chunks = splitter.split(filename, content)
+            if len(chunks) > 1:
+                return splitter.upload(self, project_id, filename, chunks)
+
         # Use JSON upload with base64 encoding
         encoded_content = base64.b64encode(content).decode("utf-8")
 
@@ -129,7 +196,148 @@ class DocumentsResource:
                 "mimeType": mime_type,
             },
         )
-        return response.get("document", response)
+        return self._client._as_model(Document, response.get("document", response))
+
+    def upload_many(
+        self,
+        project_id: str,
+        file_paths: Iterable[str],
+        concurrency: Union[int, "AdaptiveConcurrency"] = 8,
+        on_progress: Optional[Callable[[BulkProgress], None]] = None,
+        preprocessor: Optional["Preprocessor"] = None,
+        preflight: Optional["Preflight"] = None,
+        splitter: Optional["PdfSplitter"] = None,
+    ) -> List[BulkResult]:
+        """
+        Upload many files concurrently.
+
+        Uploads share the client's connection pool and rate limiter. A failed
+        upload does not stop the others. With a scheduler, uploads go through
+        the "bulk" lane unless a priority is already set.
+
+        With a preflight, files that would be rejected by the API fail locally
+        with PreflightError and are never read in full. With a preprocessor,
+        files are read and transformed on its process pool a bounded number
+        ahead of the uploads, and uploaded in the order they are ready.
+
+        Args:
+            project_id: The project ID to upload to
+            file_paths: Paths to files on disk
+            concurrency: Maximum number of uploads in flight (default 8), or an
+                AdaptiveConcurrency that tunes it while the uploads run
+            on_progress: Optional callback invoked after each file finishes
+            preprocessor: Optional Preprocessor used to shrink files first
+            preflight: Optional Preflight that validates each file before upload
+            splitter: Optional PdfSplitter that uploads long PDFs as parallel chunks
+
+        Returns:
+            One BulkResult per file, keyed by path, with the uploaded document
+            as its value.
+
+        Example:
+            results = client.documents.upload_many("proj_xxx", glob.glob("scans/*.pdf"))
+            failed = [r.key for r in results if not r.ok]
+        """
+        if not preprocessor:
+            def upload_one(path: str) -> Dict[str, Any]:
+                return self.upload(
+                    project_id, file_path=path, preflight=preflight, splitter=splitter
+                )
+
+            with priority(current_priority() or BULK):
+                return run_bulk(
+                    upload_one,
+                    file_paths,
+                    concurrency=concurrency,
+                    size=os.path.getsize,
+                    on_progress=on_progress,
+                )
+
+        checked_types: Dict[str, str] = {}
+
+        def prepare(path: str) -> "Future[PreparedFile]":
+            if preflight:
+                checked_types[path] = preflight.enforce(preflight.check_path(path)).mime_type
+            return preprocessor.submit(path)
+
+        def upload_prepared(path: str, prepared: "PreparedFile") -> Dict[str, Any]:
+            mime_type = checked_types.get(path)
+            if mime_type and not prepared.applied:
+                prepared.mime_type = mime_type
+            return self.upload(
+                project_id,
+                file_bytes=prepared.content,
+                name=prepared.name,
+                mime_type=prepared.mime_type,
+                splitter=splitter,
+            )
+
+        # Files are read and transformed ahead on the pool, and uploaded as
+        # they are ready, so no upload slot waits on preprocessing
+        with priority(current_priority() or BULK):
+            return run_pipeline(
+                prepare,
+                upload_prepared,
+                file_paths,
+                concurrency=concurrency,
+                size=os.path.getsize,
+                on_progress=on_progress,
+            )
+
+    def sync_dir(
+        self,
+        project_id: str,
+        path: str,
+        manifest: Optional[str] = None,
+        delete: bool = True,
+        recursive: bool = True,
+        concurrency: int = 8,
+        dry_run: bool = False,
+        on_progress: Optional[Callable[[BulkProgress], None]] = None,
+    ) -> "DirSyncReport":
+        """
+        Make a project's documents match the supported files in a folder.
+
+        A manifest records each file's size, mtime, SHA-256 and document ID.
+        Files whose size and mtime match the manifest are skipped without
+        being read. Other files are hashed, and only new or changed content
+        is uploaded, concurrently. A changed file's old document is deleted
+        after its new version uploads. Documents whose files were removed are
+        deleted too, and a file that was moved or renamed keeps its document.
+        Failed uploads and deletions are retried on the next sync. The
+        manifest is saved as uploads finish, so an interrupted sync resumes
+        without uploading the same files again.
+
+        Args:
+            project_id: The project ID to sync to
+            path: Folder to sync
+            manifest: Manifest file (default: .structurify-manifest.json in the folder)
+            delete: Delete documents whose files were removed
+            recursive: Include subfolders
+            concurrency: Maximum number of hashes, uploads or deletions in flight
+            dry_run: Report what would change without uploading or deleting
+            on_progress: Optional callback invoked after each upload finishes
+
+        Returns:
+            A DirSyncReport of uploaded, updated, renamed, deleted and failed files.
+
+        Example:
+            report = client.documents.sync_dir("proj_xxx", "/srv/dropbox/acme")
+            print(f"{len(report.uploaded)} new, {report.unchanged} unchanged")
+        """
+        from structurify.dirsync import sync_dir
+
+        return sync_dir(
+            self,
+            project_id,
+            path,
+            manifest=manifest,
+            delete=delete,
+            recursive=recursive,
+            concurrency=concurrency,
+            dry_run=dry_run,
+            on_progress=on_progress,
+        )
 
     def upload_multipart(
         self,
@@ -161,7 +369,7 @@ class DocumentsResource:
 
             response = self._client.post("/documents", data=data, files=files)
 
-        return response.get("document", response)
+        return self._client._as_model(Document, response.get("document", response))
 
     def get(self, document_id: str) -> Dict[str, Any]:
         """
@@ -172,9 +380,13 @@ class DocumentsResource:
 
         Returns:
             Document metadata.
+
+        Raises:
+            ValueError: If document_id is the logical ID of a split PDF
         """
+        _reject_split_id(document_id)
         response = self._client.get(f"/documents/{document_id}")
-        return response.get("document", response)
+        return self._client._as_model(Document, response.get("document", response))
 
     def get_content(self, document_id: str) -> Dict[str, Any]:
         """
@@ -185,13 +397,20 @@ class DocumentsResource:
 
         Returns:
             Dictionary with "content" (base64) and "mimeType".
+
+        Raises:
+            ValueError: If document_id is the logical ID of a split PDF
         """
+        _reject_split_id(document_id)
         return self._client.get(f"/documents/{document_id}/content")
 
     def download(self, document_id: str) -> bytes:
         """
         Download document content as bytes.
 
+        If the client has a document_cache, cached content is returned
+        without a network call.
+
         Args:
             document_id: The document ID
 
@@ -203,18 +422,182 @@ class DocumentsResource:
             with open("downloaded.pdf", "wb") as f:
                 f.write(content)
         """
+        cache = self._client.document_cache
+        if cache is not None:
+            path = cache.get_path(document_id)
+            if path is not None:
+                try:
+                    with open(path, "rb") as f:
+                        return f.read()
+                except OSError:
+                    pass
+
         response = self.get_content(document_id)
         content_b64 = response.get("content", "")
-        return base64.b64decode(content_b64)
+        content = base64.b64decode(content_b64)
+        if cache is not None:
+            cache.put(document_id, content)
+        return content
+
+    def download_path(self, document_id: str) -> str:
+        """
+        Download a document into the client's document_cache and return its path.
+
+        Repeat calls return the cached file without a network call.
+
+        Args:
+            document_id: The document ID
+
+        Returns:
+            Path to the raw (decoded) document file.
+
+        Raises:
+            ValueError: If the client has no document_cache
+        """
+        cache = self._require_cache()
+        path = cache.get_path(document_id)
+        if path is None:
+            response = self.get_content(document_id)
+            path = cache.put(document_id, base64.b64decode(response.get("content", "")))
+        return path
+
+    def download_mmap(self, document_id: str) -> mmap.mmap:
+        """
+        Return a read-only memory map of a cached document.
+
+        Downloads into the client's document_cache on a miss.
+
+        Args:
+            document_id: The document ID
+
+        Returns:
+            A read-only mmap of the document content. Close it when done.
+
+        Raises:
+            ValueError: If the client has no document_cache
+        """
+        cache = self._require_cache()
+        for _ in range(2):
+            mapped = cache.get_mmap(document_id)
+            if mapped is not None:
+                return mapped
+            self.download_path(document_id)
+        raise ValueError(f"Document {document_id} could not be memory-mapped")
+
+    def download_many(
+        self,
+        document_ids: Iterable[str],
+        directory: str,
+        concurrency: Union[int, "AdaptiveConcurrency"] = 8,
+        on_progress: Optional[Callable[[BulkProgress], None]] = None,
+    ) -> List[BulkResult]:
+        """
+        Download many documents concurrently into a folder.
 
-    def delete(self, document_id: str) -> Dict[str, Any]:
+        Each document is written to a file named after its ID. Downloads go
+        through the "bulk" lane unless a priority is already set, and a
+        failed download does not stop the others.
+
+        Args:
+            document_ids: The document IDs to download
+            directory: Folder to write into; created if missing
+            concurrency: Maximum number of downloads in flight (default 8), or an
+                AdaptiveConcurrency that tunes it while the downloads run
+            on_progress: Optional callback invoked after each document finishes
+
+        Returns:
+            One BulkResult per document, keyed by ID, with the written path as
+            its value.
+
+        Example:
+            tuner = AdaptiveConcurrency(max_limit=32)
+            results = client.documents.download_many(ids, "originals", concurrency=tuner)
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        def download_one(document_id: str) -> str:
+            content = self.download(document_id)
+            path = os.path.join(directory, document_id)
+            with open(path, "wb") as f:
+                f.write(content)
+            return path
+
+        def downloaded_size(document_id: str) -> int:
+            try:
+                return os.path.getsize(os.path.join(directory, document_id))
+            except OSError:
+                return 0
+
+        with priority(current_priority() or BULK):
+            return run_bulk(
+                download_one,
+                document_ids,
+                concurrency=concurrency,
+                size=downloaded_size,
+                on_progress=on_progress,
+            )
+
+    def _require_cache(self) -> "DocumentCache":
+        cache = self._client.document_cache
+        if cache is None:
+            raise ValueError("Client was created without a document_cache")
+        return cache
+
+    def delete(self, document_id: str, splitter: Optional["PdfSplitter"] = None) -> Dict[str, Any]:
         """
         Delete a document.
 
         Args:
             document_id: The document ID
+            splitter: The PdfSplitter that uploaded it, if it is a split PDF;
+                all of its chunk documents are deleted
 
         Returns:
             Deletion confirmation.
+
+        Raises:
+            ValueError: If document_id is the logical ID of a split PDF and no
+                splitter is given
+        """
+        if splitter is not None and is_split_id(document_id):
+            return splitter.delete(self, document_id)
+        _reject_split_id(document_id)
+        response = self._client.delete(f"/documents/{document_id}")
+        if self._client.document_cache is not None:
+            self._client.document_cache.invalidate(document_id)
+        return response
+
+    def delete_many(
+        self,
+        document_ids: Iterable[str],
+        concurrency: int = 8,
+        on_progress: Optional[Callable[[BulkProgress], None]] = None,
+        splitter: Optional["PdfSplitter"] = None,
+    ) -> List[BulkResult]:
+        """
+        Delete many documents concurrently.
+
+        Deletions share the client's connection pool and rate limiter and go
+        through the "bulk" lane unless a priority is already set. A failed
+        deletion does not stop the others.
+
+        Args:
+            document_ids: The document IDs to delete
+            concurrency: Maximum number of deletions in flight (default 8)
+            on_progress: Optional callback invoked after each deletion finishes
+            splitter: Optional PdfSplitter whose logical IDs are deleted chunk by chunk
+
+        Returns:
+            One BulkResult per ID, with the deletion confirmation as its value.
+
+        Example:
+            results = client.documents.delete_many(["doc_1", "doc_2"])
+            failed = [r.key for r in results if not r.ok]
         """
-        return self._client.delete(f"/documents/{document_id}")
+        with priority(current_priority() or BULK):
+            return run_bulk(
+                functools.partial(self.delete, splitter=splitter),
+                document_ids,
+                concurrency=concurrency,
+                on_progress=on_progress,
+            )
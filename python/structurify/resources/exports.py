@@ -5,10 +5,163 @@ Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
 Licensed under the MIT License.
 """
 
-from typing import TYPE_CHECKING, Dict, Any, Optional, List, Union
+import codecs
+import json
+from typing import (
+    TYPE_CHECKING, Dict, Any, Iterable, Iterator, Optional, List, Union, BinaryIO, Callable,
+)
+
+from structurify import cancellation
+from structurify.bulk import BulkProgress, BulkResult, run_bulk
+from structurify.exceptions import StructurifyError
+from structurify.models import Export
+from structurify.scheduler import BULK, current_priority, priority
 
 if TYPE_CHECKING:
     from structurify.client import Structurify
+    from structurify.splitting import PdfSplitter
+
+
+# Keys under which an export object holds its list of records
+_RECORD_FIELDS = ("rows", "documents", "data", "results")
+
+
+def iter_records(data: Any) -> Iterator[Any]:
+    """Yield the individual records of a JSON export payload."""
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            yield data
+            return
+    if isinstance(data, dict):
+        for field in _RECORD_FIELDS:
+            if isinstance(data.get(field), list):
+                data = data[field]
+                break
+    if isinstance(data, list):
+        yield from data
+    else:
+        yield data
+
+
+class _JsonReader:
+    """Pull parser over a stream of text chunks, for exports too large to load at once."""
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self._buf = ""
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+
+    def _more(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._buf = self._buf[self._pos:] + chunk
+                self._pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """The next non-whitespace character, or "" at the end of the stream."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._more():
+                return ""
+
+    def take(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"malformed JSON export: expected {char!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._more():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buf) and self._more():
+                continue
+            self._pos = end
+            return value
+
+    def rest(self) -> str:
+        while self._more():
+            pass
+        text, self._buf, self._pos = self._buf[self._pos:], "", 0
+        return text
+
+
+def _stream_array(reader: _JsonReader) -> Iterator[Any]:
+    reader.take("[")
+    if reader.peek() == "]":
+        reader.take("]")
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() != ",":
+            reader.take("]")
+            return
+        reader.take(",")
+
+
+def _stream_object(reader: _JsonReader) -> Iterator[Any]:
+    # Streams the first record list found; other fields are kept for iter_records
+    reader.take("{")
+    kept: Dict[str, Any] = {}
+    streamed = False
+    while reader.peek() != "}":
+        key = reader.value()
+        reader.take(":")
+        following = reader.peek()
+        if not streamed and key in _RECORD_FIELDS and following == "[":
+            yield from _stream_array(reader)
+            streamed = True
+        elif not streamed and key == "data" and following == "{":
+            yield from _stream_object(reader)
+            streamed = True
+        elif not streamed and key == "data" and following == '"':
+            # Records encoded as a JSON string can only be decoded whole
+            yield from iter_records(reader.value())
+            streamed = True
+        else:
+            kept[key] = reader.value()
+        if reader.peek() == ",":
+            reader.take(",")
+    reader.take("}")
+    if not streamed:
+        yield from iter_records(kept)
+
+
+def iter_records_stream(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield the records of a JSON export payload while it is still arriving.
+
+    Accepts the same shapes as iter_records, but holds only one record in
+    memory at a time, except for records delivered as one JSON-encoded
+    string.
+
+    Args:
+        chunks: The payload as UTF-8 bytes, in pieces of any size
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    text = (decoder.decode(chunk) for chunk in chunks)
+    reader = _JsonReader(text)
+    first = reader.peek()
+    if first == "[":
+        yield from _stream_array(reader)
+    elif first == "{":
+        yield from _stream_object(reader)
+    elif first:
+        yield from iter_records(reader.rest())
 
 
 class ExportsResource:
@@ -72,7 +225,7 @@ class ExportsResource:
             Export status and details.
         """
         response = self._client.get(f"/exports/{export_id}")
-        return response.get("export", response)
+        return self._client._as_model(Export, response.get("export", response))
 
     def download(self, export_id: str) -> Union[str, Dict[str, Any]]:
         """
@@ -100,6 +253,101 @@ class ExportsResource:
             return response["data"]
         return response
 
+    def stream_records(self, export_id: str, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+        """
+        Download a JSON export and yield its records as they arrive.
+
+        Unlike download(), the export is never held in memory as a whole.
+
+        Args:
+            export_id: The export ID
+            chunk_size: Bytes read per chunk (default 64 KB)
+
+        Returns:
+            An iterator over the export's records.
+
+        Example:
+            for record in client.exports.stream_records(export_id):
+                print(record["documentId"])
+        """
+        with self._client.stream(f"/exports/{export_id}/download") as response:
+            for record in iter_records_stream(response.iter_content(chunk_size=chunk_size)):
+                cancellation.check()
+                yield record
+
+    def records(
+        self,
+        project_id: str,
+        document_ids: Optional[List[str]] = None,
+        splitter: Optional["PdfSplitter"] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Export results as JSON and return the per-document records.
+
+        Handles both inline and separately downloaded exports. With the
+        splitter that uploaded them, split PDFs come back as one merged
+        record each, and their logical IDs can be passed in document_ids.
+
+        Args:
+            project_id: The project ID
+            document_ids: Optional list of document IDs to export (default all)
+            splitter: Optional PdfSplitter whose chunk records are reassembled
+
+        Returns:
+            One record per document, keyed by column label.
+
+        Example:
+            for record in client.exports.records("proj_xxx", document_ids=["doc_1", "doc_2"]):
+                print(record["documentId"], record.get("Invoice Number"))
+        """
+        if splitter and document_ids:
+            document_ids = splitter.expand(document_ids)
+        export = self.create(project_id, format="json", document_ids=document_ids)
+        if "data" in export:
+            data = export["data"]
+        else:
+            export_id = export.get("export", {}).get("id") or export.get("id")
+            if not export_id:
+                raise StructurifyError("export response has neither data nor an export ID")
+            data = self.download(export_id)
+        rows = [record for record in iter_records(data) if isinstance(record, dict)]
+        return splitter.reassemble(rows) if splitter else rows
+
+    def download_to(
+        self,
+        export_id: str,
+        destination: Union[str, BinaryIO],
+        chunk_size: int = 64 * 1024,
+    ) -> int:
+        """
+        Stream export data to a file without buffering it in memory.
+
+        The response is decompressed chunk by chunk as it is written.
+
+        Args:
+            export_id: The export ID
+            destination: File path, or a binary file object to write to
+            chunk_size: Bytes read per chunk (default 64 KB)
+
+        Returns:
+            Number of bytes written.
+
+        Example:
+            client.exports.download_to(export_id, "export.csv")
+        """
+        written = 0
+        with self._client.stream(f"/exports/{export_id}/download") as response:
+            if isinstance(destination, str):
+                with open(destination, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        cancellation.check()
+                        written += f.write(chunk)
+            else:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    cancellation.check()
+                    written += destination.write(chunk)
+        return written
+
     def list(self, project_id: str) -> List[Dict[str, Any]]:
         """
         List exports for a project.
@@ -111,7 +359,7 @@ class ExportsResource:
             List of exports.
         """
         response = self._client.get("/exports", params={"projectId": project_id})
-        return response.get("exports", [])
+        return self._client._as_models(Export, response.get("exports", []))
 
     def delete(self, export_id: str) -> Dict[str, Any]:
         """
@@ -124,3 +372,33 @@ class ExportsResource:
             Deletion confirmation.
         """
         return self._client.delete(f"/exports/{export_id}")
+
+    def delete_many(
+        self,
+        export_ids: Iterable[str],
+        concurrency: int = 8,
+        on_progress: Optional[Callable[[BulkProgress], None]] = None,
+    ) -> List[BulkResult]:
+        """
+        Delete many exports concurrently.
+
+        Deletions share the client's connection pool and rate limiter and go
+        through the "bulk" lane unless a priority is already set. A failed
+        deletion does not stop the others.
+
+        Args:
+            export_ids: The export IDs to delete
+            concurrency: Maximum number of deletions in flight (default 8)
+            on_progress: Optional callback invoked after each deletion finishes
+
+        Returns:
+            One BulkResult per ID, with the deletion confirmation as its value.
+
+        Example:
+            old = [e["id"] for e in client.exports.list("proj_xxx")]
+            results = client.exports.delete_many(old)
+        """
+        with priority(current_priority() or BULK):
+            return run_bulk(
+                self.delete, export_ids, concurrency=concurrency, on_progress=on_progress
+            )
@@ -6,7 +6,10 @@ Licensed under the MIT License.
 """
 
 import time
-from typing import TYPE_CHECKING, Dict, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional
+
+from structurify import cancellation, deadlines
+from structurify.models import Job
 
 if TYPE_CHECKING:
     from structurify.client import Structurify
@@ -48,7 +51,11 @@ class ExtractionResource:
             "/extraction-jobs",
             json={"projectId": project_id},
         )
-        return response.get("job", response)
+        job = self._client._as_model(Job, response.get("job", response))
+        token = cancellation.current_token()
+        if token is not None and job.get("id"):
+            token.track_job(job["id"], self.cancel)
+        return job
 
     def get(self, job_id: str) -> Dict[str, Any]:
         """
@@ -61,7 +68,7 @@ class ExtractionResource:
             Job status including progress percentage.
         """
         response = self._client.get(f"/extraction-jobs/{job_id}")
-        return response.get("job", response)
+        return self._client._as_model(Job, response.get("job", response))
 
     def cancel(self, job_id: str) -> Dict[str, Any]:
         """
@@ -78,8 +85,9 @@ class ExtractionResource:
     def wait_for_completion(
         self,
         job_id: str,
-        timeout: int = 300,
+        timeout: float = 300,
         poll_interval: float = 2.0,
+        on_poll: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """
         Wait for an extraction job to complete.
@@ -90,12 +98,15 @@ class ExtractionResource:
             job_id: The job ID
             timeout: Maximum wait time in seconds (default 300)
             poll_interval: Polling interval in seconds (default 2)
+            on_poll: Optional callback given the job after each status check
 
         Returns:
             Completed job details.
 
         Raises:
             TimeoutError: If job does not complete within timeout
+            DeadlineExceededError: If the caller's deadline passes first
+            OperationCancelledError: If the caller's cancellation token is cancelled
             StructurifyError: If job fails
 
         Example:
@@ -109,6 +120,8 @@ class ExtractionResource:
         while True:
             job = self.get(job_id)
             status = job.get("status", "")
+            if on_poll:
+                on_poll(job)
 
             if status in terminal_states:
                 return job
@@ -120,7 +133,8 @@ class ExtractionResource:
                     f"Current status: {status}, progress: {job.get('progress', 0)}%"
                 )
 
-            time.sleep(poll_interval)
+            # Gives up early if the caller's deadline can't fit another poll
+            deadlines.sleep(poll_interval)
 
     def list(self, project_id: str) -> Dict[str, Any]:
         """
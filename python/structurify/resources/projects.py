@@ -5,7 +5,11 @@ Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
 Licensed under the MIT License.
 """
 
-from typing import TYPE_CHECKING, List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Iterable, Callable
+
+from structurify.bulk import BulkProgress, BulkResult, run_bulk
+from structurify.models import Document, Project
+from structurify.scheduler import BULK, current_priority, priority
 
 if TYPE_CHECKING:
     from structurify.client import Structurify
@@ -34,7 +38,7 @@ class ProjectsResource:
                 print(project["name"], project["id"])
         """
         response = self._client.get("/projects")
-        return response.get("projects", [])
+        return self._client._as_models(Project, response.get("projects", []))
 
     def get(self, project_id: str) -> Dict[str, Any]:
         """
@@ -44,12 +48,22 @@ class ProjectsResource:
             project_id: The project ID
 
         Returns:
-            Project details with columns and documents.
+            Project details with columns and documents. With typed_models,
+            "project" is a Project and "documents" a list of Documents.
 
         Raises:
             NotFoundError: If project not found
         """
-        return self._client.get(f"/projects/{project_id}")
+        response = self._client.get(f"/projects/{project_id}")
+        if not self._client._typed_models:
+            return response
+        # Copy rather than modify: coalesced callers share the response object
+        result = dict(response)
+        if "project" in result:
+            result["project"] = self._client._as_model(Project, result["project"])
+        if "documents" in result:
+            result["documents"] = self._client._as_models(Document, result["documents"])
+        return result
 
     def create(
         self,
@@ -88,7 +102,7 @@ class ProjectsResource:
             payload["description"] = description
 
         response = self._client.post("/projects", json=payload)
-        return response.get("project", response)
+        return self._client._as_model(Project, response.get("project", response))
 
     def update(self, project_id: str, name: str) -> Dict[str, Any]:
         """
@@ -102,7 +116,7 @@ class ProjectsResource:
             Updated project details.
         """
         response = self._client.put(f"/projects/{project_id}", json={"name": name})
-        return response.get("project", response)
+        return self._client._as_model(Project, response.get("project", response))
 
     def delete(self, project_id: str) -> Dict[str, Any]:
         """
@@ -119,3 +133,32 @@ class ProjectsResource:
             data will be permanently deleted.
         """
         return self._client.delete(f"/projects/{project_id}")
+
+    def delete_many(
+        self,
+        project_ids: Iterable[str],
+        concurrency: int = 8,
+        on_progress: Optional[Callable[[BulkProgress], None]] = None,
+    ) -> List[BulkResult]:
+        """
+        Delete many projects, and all their documents, concurrently.
+
+        Deletions share the client's connection pool and rate limiter and go
+        through the "bulk" lane unless a priority is already set. A failed
+        deletion does not stop the others.
+
+        Args:
+            project_ids: The project IDs to delete
+            concurrency: Maximum number of deletions in flight (default 8)
+            on_progress: Optional callback invoked after each deletion finishes
+
+        Returns:
+            One BulkResult per ID, with the deletion confirmation as its value.
+
+        Example:
+            results = client.projects.delete_many(["proj_1", "proj_2"])
+        """
+        with priority(current_priority() or BULK):
+            return run_bulk(
+                self.delete, project_ids, concurrency=concurrency, on_progress=on_progress
+            )
@@ -7,6 +7,8 @@ Licensed under the MIT License.
 
 from typing import TYPE_CHECKING, List, Dict, Any
 
+from structurify.models import ColumnTemplate, Template
+
 if TYPE_CHECKING:
     from structurify.client import Structurify
 
@@ -34,7 +36,7 @@ class TemplatesResource:
                 print(template["name"], template["id"])
         """
         response = self._client.get("/project-templates")
-        return response.get("templates", [])
+        return self._client._as_models(Template, response.get("templates", []))
 
     def list_columns(self) -> List[Dict[str, Any]]:
         """
@@ -49,7 +51,7 @@ class TemplatesResource:
                 print(column["label"], column["format"])
         """
         response = self._client.get("/templates")
-        return response.get("templates", [])
+        return self._client._as_models(ColumnTemplate, response.get("templates", []))
 
     def get(self, template_id: str) -> Dict[str, Any]:
         """
@@ -65,4 +67,4 @@ class TemplatesResource:
             NotFoundError: If template not found
         """
         response = self._client.get(f"/project-templates/{template_id}")
-        return response.get("template", response)
+        return self._client._as_model(Template, response.get("template", response))
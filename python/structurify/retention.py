@@ -0,0 +1,167 @@
+"""
+Retention Sweeps
+
+Deletes exports, documents and whole projects older than a cutoff. The
+candidates come from exports.list, projects.get and projects.list, read
+concurrently per project, and the deletions run concurrently through the
+bulk helpers, so a sweep over thousands of items takes minutes instead of
+hours. Failures are collected rather than stopping the sweep.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import functools
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set
+
+from structurify.bulk import BulkProgress, BulkResult, run_bulk
+from structurify.scheduler import BULK, current_priority, priority
+
+if TYPE_CHECKING:
+    from structurify.client import Structurify
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an API ISO-8601 timestamp, returning None if absent or malformed."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@dataclass
+class SweepReport:
+    """
+    Outcome of a retention sweep, one BulkResult per ID.
+
+    In a dry run the results list what would be deleted. Projects whose
+    exports or documents could not be listed appear in `errors`, keyed by
+    project ID.
+    """
+
+    dry_run: bool = False
+    exports: List[BulkResult] = field(default_factory=list)
+    documents: List[BulkResult] = field(default_factory=list)
+    projects: List[BulkResult] = field(default_factory=list)
+    errors: List[BulkResult] = field(default_factory=list)
+
+    @property
+    def failed(self) -> List[BulkResult]:
+        """Every failed listing and deletion."""
+        results = self.errors + self.exports + self.documents + self.projects
+        return [r for r in results if not r.ok]
+
+    @property
+    def deleted(self) -> int:
+        """Number of items deleted (or, in a dry run, selected)."""
+        return sum(r.ok for r in self.exports + self.documents + self.projects)
+
+    @property
+    def ok(self) -> bool:
+        """True if every listing and deletion succeeded."""
+        return not self.failed
+
+
+def sweep(
+    client: "Structurify",
+    older_than: timedelta,
+    project_ids: Optional[Iterable[str]] = None,
+    exports: bool = True,
+    documents: bool = False,
+    projects: bool = False,
+    where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    dry_run: bool = False,
+    concurrency: int = 8,
+    on_progress: Optional[Callable[[str, BulkProgress], None]] = None,
+) -> SweepReport:
+    """
+    Delete everything older than a cutoff.
+
+    Items without a readable createdAt are never deleted. When a project
+    itself is deleted, its exports and documents go with it and are not
+    deleted separately.
+
+    Args:
+        client: The client to use
+        older_than: Age beyond which items are deleted
+        project_ids: Projects to sweep (default every project from projects.list)
+        exports: Delete old exports
+        documents: Delete old documents
+        projects: Delete old projects, with all their documents
+        where: Optional extra filter; only items it returns True for are deleted
+        dry_run: Select items without deleting anything
+        concurrency: Maximum number of listings or deletions in flight
+        on_progress: Optional callback given "exports", "documents" or
+            "projects" and the progress of that deletion batch
+
+    Returns:
+        A SweepReport with a result per selected item.
+
+    Example:
+        report = sweep(client, timedelta(days=90), documents=True)
+        print(f"deleted {report.deleted}, {len(report.failed)} failed")
+    """
+    cutoff = datetime.now(timezone.utc) - older_than
+
+    def expired(item: Dict[str, Any]) -> bool:
+        created = parse_timestamp(item.get("createdAt"))
+        return created is not None and created < cutoff and (where is None or where(item))
+
+    report = SweepReport(dry_run=dry_run)
+    with priority(current_priority() or BULK):
+        # Project metadata is only needed to choose projects to delete or sweep
+        doomed: Set[str] = set()
+        if projects or project_ids is None:
+            listed = client.projects.list()
+            wanted = None if project_ids is None else set(project_ids)
+            candidates = [p for p in listed if wanted is None or p["id"] in wanted]
+            doomed = {p["id"] for p in candidates if projects and expired(p)}
+            sweep_ids = [p["id"] for p in candidates if p["id"] not in doomed]
+        else:
+            sweep_ids = list(project_ids)
+
+        def find(project_id: str) -> Dict[str, List[str]]:
+            found: Dict[str, List[str]] = {"exports": [], "documents": []}
+            if exports:
+                found["exports"] = [e["id"] for e in client.exports.list(project_id) if expired(e)]
+            if documents:
+                project = client.projects.get(project_id)
+                found["documents"] = [
+                    d["id"] for d in project.get("documents", []) if expired(d)
+                ]
+            return found
+
+        selected: Dict[str, List[str]] = {
+            "exports": [], "documents": [], "projects": sorted(doomed),
+        }
+        if exports or documents:
+            for result in run_bulk(find, sweep_ids, concurrency=concurrency):
+                if not result.ok:
+                    report.errors.append(result)
+                    continue
+                selected["exports"].extend(result.value["exports"])
+                selected["documents"].extend(result.value["documents"])
+
+        delete_many: Dict[str, Callable[..., List[BulkResult]]] = {
+            "exports": client.exports.delete_many,
+            "documents": client.documents.delete_many,
+            "projects": client.projects.delete_many,
+        }
+        for kind, ids in selected.items():
+            if dry_run:
+                results = [BulkResult(item_id) for item_id in ids]
+            else:
+                results = delete_many[kind](
+                    ids,
+                    concurrency=concurrency,
+                    on_progress=functools.partial(on_progress, kind) if on_progress else None,
+                )
+            setattr(report, kind, results)
+    return report
@@ -0,0 +1,240 @@
+"""
+Priority Request Scheduling
+
+Shares a client's concurrency and rate-limit budget between priority lanes
+with weighted fair queuing. Interactive calls are admitted ahead of queued
+bulk work, while bulk work still uses all capacity left idle.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import contextlib
+import heapq
+import itertools
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from structurify.cancellation import CancellationToken, current_token
+from structurify.ratelimit import RateLimiter
+
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BULK = "bulk"
+
+DEFAULT_WEIGHTS: Dict[str, float] = {INTERACTIVE: 16.0, NORMAL: 4.0, BULK: 1.0}
+
+_current_priority: ContextVar[Optional[str]] = ContextVar("structurify_priority", default=None)
+
+
+def current_priority() -> Optional[str]:
+    """Return the priority lane set for the current context, if any."""
+    return _current_priority.get()
+
+
+@contextlib.contextmanager
+def priority(lane: str) -> Iterator[None]:
+    """
+    Send every request made in this block through the given lane.
+
+    Example:
+        with priority("interactive"):
+            client.documents.get(document_id)
+    """
+    token = _current_priority.set(lane)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class RequestScheduler:
+    """
+    Weighted fair queue in front of a concurrency (and optional rate) budget.
+
+    Each request waits for one of max_concurrency slots. When slots are
+    contended they are granted in order of virtual finish time, so a lane
+    with weight 16 gets 16 slots for every one given to a lane with weight 1,
+    and an idle lane cannot bank credit for later. Rate-limit tokens are
+    taken by the request at the head of the queue, so they follow the same
+    order.
+
+    Example:
+        client = Structurify(
+            api_key="sk_live_xxx",
+            rate_limit=10,
+            scheduler=RequestScheduler(max_concurrency=8),
+        )
+
+        with client.priority("interactive"):
+            doc = client.documents.get("doc_xxx")   # jumps ahead of queued bulk uploads
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        weights: Optional[Dict[str, float]] = None,
+        default_lane: str = NORMAL,
+    ):
+        """
+        Args:
+            max_concurrency: Requests allowed in flight at once across all lanes
+            weights: Relative share per lane (default interactive=16, normal=4, bulk=1)
+            default_lane: Lane used when no priority is set
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.weights = dict(weights if weights is not None else DEFAULT_WEIGHTS)
+        if default_lane not in self.weights:
+            raise ValueError(f"default_lane {default_lane!r} has no weight")
+        if any(w <= 0 for w in self.weights.values()):
+            raise ValueError("lane weights must be positive")
+        self.default_lane = default_lane
+
+        self._cond = threading.Condition()
+        self._owner_pid = os.getpid()
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._virtual_time = 0.0
+        self._last_finish: Dict[str, float] = {}
+        self._in_flight = 0
+        self._active: Dict[str, int] = {lane: 0 for lane in self.weights}
+        self._queued: Dict[str, int] = {lane: 0 for lane in self.weights}
+        self._granted: Dict[str, int] = {lane: 0 for lane in self.weights}
+
+    def _lane(self, lane: Optional[str]) -> str:
+        lane = lane or current_priority() or self.default_lane
+        if lane not in self.weights:
+            raise ValueError(
+                f"Unknown priority lane {lane!r}; expected one of {list(self.weights)}"
+            )
+        return lane
+
+    def acquire(
+        self,
+        lane: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Block until the request may be sent.
+
+        Args:
+            lane: Priority lane (default: the context's priority, then default_lane)
+            rate_limiter: Optional limiter to take a token from once admitted
+            timeout: Give up after waiting this many seconds
+
+        Returns:
+            The lane the slot was granted in; pass it to release(). None if
+            timeout expired first.
+
+        Raises:
+            OperationCancelledError: If the current cancellation token is cancelled while waiting
+        """
+        lane = self._lane(lane)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        token = current_token()
+        unregister = token.on_cancel(self._wake) if token is not None else None
+        try:
+            return self._wait_for_slot(lane, rate_limiter, deadline, token)
+        finally:
+            if unregister is not None:
+                unregister()
+
+    def _wake(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+
+    def _wait_for_slot(
+        self,
+        lane: str,
+        rate_limiter: Optional[RateLimiter],
+        deadline: Optional[float],
+        token: Optional[CancellationToken],
+    ) -> Optional[str]:
+        with self._cond:
+            start = max(self._virtual_time, self._last_finish.get(lane, 0.0))
+            finish = start + 1.0 / self.weights[lane]
+            self._last_finish[lane] = finish
+            entry = (finish, next(self._seq), lane)
+            heapq.heappush(self._heap, entry)
+            self._queued[lane] += 1
+
+            while True:
+                if token is not None and token.cancelled:
+                    self._abandon(entry, lane)
+                    token.raise_if_cancelled()
+                wait: Optional[float] = None
+                if self._heap[0] is entry and self._in_flight < self.max_concurrency:
+                    wait = rate_limiter.try_acquire() if rate_limiter else 0.0
+                    if wait <= 0:
+                        break
+                if deadline is not None:
+                    left = deadline - time.monotonic()
+                    if left <= 0 or (wait is not None and wait > left):
+                        self._abandon(entry, lane)
+                        return None
+                    wait = left if wait is None else wait
+                self._cond.wait(wait)
+
+            heapq.heappop(self._heap)
+            self._virtual_time = start
+            self._in_flight += 1
+            self._active[lane] += 1
+            self._queued[lane] -= 1
+            self._granted[lane] += 1
+            # The next request in line may be admissible now
+            self._cond.notify_all()
+        return lane
+
+    def _abandon(self, entry: Tuple[float, int, str], lane: str) -> None:
+        # Leave the queue; called with the condition held
+        self._heap.remove(entry)
+        heapq.heapify(self._heap)
+        self._queued[lane] -= 1
+        self._cond.notify_all()
+
+    def _after_fork(self) -> None:
+        if self._owner_pid == os.getpid():
+            return
+        # The parent's queued and in-flight requests don't exist here, and its
+        # condition may have been held by one of them at fork time
+        self._owner_pid = os.getpid()
+        self._cond = threading.Condition()
+        self._heap = []
+        self._in_flight = 0
+        self._active = {lane: 0 for lane in self.weights}
+        self._queued = {lane: 0 for lane in self.weights}
+
+    def release(self, lane: str) -> None:
+        """Return a slot taken by acquire()."""
+        with self._cond:
+            self._in_flight -= 1
+            self._active[lane] -= 1
+            self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def slot(
+        self, lane: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None
+    ) -> Iterator[str]:
+        """Hold a slot for the duration of a block."""
+        granted = self.acquire(lane, rate_limiter)
+        assert granted is not None
+        try:
+            yield granted
+        finally:
+            self.release(granted)
+
+    def stats(self) -> Dict[str, Any]:
+        """Total slots in use, and in-flight, queued and granted counts per lane."""
+        with self._cond:
+            return {
+                "in_flight": self._in_flight,
+                "active": dict(self._active),
+                "queued": dict(self._queued),
+                "granted": dict(self._granted),
+            }
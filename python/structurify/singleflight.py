@@ -0,0 +1,120 @@
+"""
+Request Coalescing
+
+Collapses concurrent identical calls into one: the first caller performs
+the work and every caller that arrives while it is in flight receives the
+same result (or exception). A caller whose own deadline passes or whose
+token is cancelled stops waiting, and one whose leader ran out of time or
+was cancelled makes the call itself.
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, TypeVar, cast
+
+from structurify import cancellation, deadlines
+from structurify.exceptions import DeadlineExceededError, OperationCancelledError
+
+T = TypeVar("T")
+
+
+class _Call:
+    """An in-flight call and the callers waiting on it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        # One per waiting caller, so that each can also be woken by its own token
+        self.waiters: List[threading.Event] = []
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.shared = 0
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key.
+
+    Only calls that overlap in time are merged; nothing is cached once the
+    leading call returns.
+
+    Example:
+        flight = SingleFlight()
+        project = flight.do("GET /projects/proj_xxx", lambda: fetch("proj_xxx"))
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], T], at: Optional[float] = None) -> T:
+        """
+        Run func, or wait for an identical in-flight call and share its outcome.
+
+        A leader that fails with DeadlineExceededError or
+        OperationCancelledError ran out of its own time or was stopped by its
+        own token, not the waiting callers'. They are not given that error;
+        the first of them to wake runs func itself.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            func: The call to make if none is in flight
+            at: time.monotonic() by which this caller must finish (default:
+                the active deadline)
+
+        Returns:
+            The result of func (the same object for every merged caller).
+
+        Raises:
+            DeadlineExceededError: If the deadline passes while waiting on another caller
+            OperationCancelledError: If the current token is cancelled while waiting
+        """
+        if at is None:
+            at = deadlines.current_deadline()
+        token = cancellation.current_token()
+        while True:
+            woken = threading.Event()
+            with self._lock:
+                call = self._calls.get(key)
+                if call is not None:
+                    call.shared += 1
+                    call.waiters.append(woken)
+                    self.coalesced += 1
+                    leader = False
+                else:
+                    call = self._calls[key] = _Call()
+                    leader = True
+
+            if leader:
+                return self._lead(key, call, func)
+
+            unregister = token.on_cancel(woken.set) if token is not None else None
+            try:
+                woken.wait(deadlines.remaining(at))
+            finally:
+                if unregister is not None:
+                    unregister()
+            cancellation.check()
+            if not call.done.is_set():
+                raise DeadlineExceededError("Deadline exceeded waiting for an identical call")
+            if isinstance(call.error, (DeadlineExceededError, OperationCancelledError)):
+                continue
+            if call.error is not None:
+                raise call.error
+            return cast(T, call.result)
+
+    def _lead(self, key: Hashable, call: _Call, func: Callable[[], T]) -> T:
+        try:
+            result = call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                call.done.set()
+                for woken in call.waiters:
+                    woken.set()
+        return result
@@ -0,0 +1,372 @@
+"""
+PDF Splitting
+
+Breaks long PDFs into page-range chunks that upload and extract in
+parallel, then puts the per-chunk results back together. A 2,000-page PDF
+uploaded whole is one long serial upload followed by one long extraction
+task; split into 100-page chunks it spreads over the same concurrency as
+twenty small documents.
+
+The splitter remembers which chunk documents make up each logical (parent)
+document, optionally in a JSON index file so another process can
+reassemble exports later. Logical IDs exist only in the splitter: the API
+has no document by that ID, so DocumentsResource.delete and delete_many
+take the splitter to delete the chunks, and the other document calls
+refuse a logical ID. Splitting requires pypdf:
+
+    pip install structurify[preprocess]
+
+Copyright (c) 2026 REDSCVRY TECHNOLOGY PRIVATE LIMITED
+Licensed under the MIT License.
+"""
+
+import io
+import json
+import os
+import tempfile
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from structurify import cancellation
+from structurify.bulk import run_bulk
+from structurify.exceptions import NotFoundError
+from structurify.models import Document
+
+if TYPE_CHECKING:
+    from structurify.resources.documents import DocumentsResource
+
+PDF_MIME_TYPE = "application/pdf"
+SPLIT_ID_PREFIX = "split_"
+
+
+def is_split_id(document_id: str) -> bool:
+    """True for the ID of a logical document made of split chunks."""
+    return document_id.startswith(SPLIT_ID_PREFIX)
+
+
+@dataclass
+class PdfChunk:
+    """One page range of a split PDF. Pages are 1-based and inclusive."""
+
+    name: str
+    content: bytes
+    first_page: int
+    last_page: int
+
+
+@dataclass
+class ChunkRef:
+    """An uploaded chunk of a split document."""
+
+    document_id: str
+    first_page: int
+    last_page: int
+
+
+@dataclass
+class SplitDocument:
+    """A logical document uploaded as several chunk documents."""
+
+    id: str
+    name: str
+    project_id: str
+    pages: int
+    chunks: List[ChunkRef] = field(default_factory=list)
+
+    @property
+    def document_ids(self) -> List[str]:
+        """Chunk document IDs in page order."""
+        return [chunk.document_id for chunk in self.chunks]
+
+    @property
+    def chunk_names(self) -> List[str]:
+        """Names the chunk documents were uploaded under, in page order."""
+        width = len(str(self.pages))
+        return [
+            _chunk_name(self.name, chunk.first_page, chunk.last_page, width)
+            for chunk in self.chunks
+        ]
+
+
+def _chunk_name(name: str, first_page: int, last_page: int, width: int) -> str:
+    base, ext = os.path.splitext(name)
+    return f"{base}.p{first_page:0{width}d}-{last_page:0{width}d}{ext or '.pdf'}"
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+class PdfSplitter:
+    """
+    Splits large PDFs into page ranges for parallel upload and extraction.
+
+    Pass one to DocumentsResource.upload or upload_many. PDFs with more than
+    `min_pages` pages are uploaded as chunks of `pages_per_chunk` pages, and
+    the upload returns a logical document whose ID stands for all of them.
+    Pass the same splitter to ExportsResource.records to get one record per
+    logical document.
+
+    Example:
+        splitter = PdfSplitter(pages_per_chunk=100, index_path="splits.json")
+        doc = client.documents.upload("proj_xxx", file_path="ledger.pdf", splitter=splitter)
+        ...
+        records = client.exports.records("proj_xxx", splitter=splitter)
+    """
+
+    def __init__(
+        self,
+        pages_per_chunk: int = 100,
+        min_pages: Optional[int] = None,
+        concurrency: int = 4,
+        index_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            pages_per_chunk: Pages in each chunk
+            min_pages: Split only PDFs with more pages than this (default pages_per_chunk)
+            concurrency: Chunks of one document uploaded at once
+            index_path: Optional JSON file the parent → chunk mapping is kept in
+        """
+        if pages_per_chunk < 1:
+            raise ValueError("pages_per_chunk must be at least 1")
+        self.pages_per_chunk = pages_per_chunk
+        self.min_pages = pages_per_chunk if min_pages is None else min_pages
+        self.concurrency = concurrency
+        self.index_path = index_path
+        self.documents: Dict[str, SplitDocument] = {}
+        self._lock = threading.Lock()
+        if index_path:
+            self._load(index_path)
+
+    def split(self, name: str, content: bytes) -> List[PdfChunk]:
+        """
+        Split a PDF into page-range chunks.
+
+        Returns a single chunk holding the original content if the PDF is
+        short enough, encrypted or unreadable.
+
+        Raises:
+            ImportError: If pypdf is not installed
+        """
+        try:
+            from pypdf import PdfReader, PdfWriter
+            from pypdf.errors import PyPdfError
+        except ImportError as e:
+            raise ImportError(
+                "pypdf is required for PdfSplitter: pip install structurify[preprocess]"
+            ) from e
+
+        try:
+            reader = PdfReader(io.BytesIO(content))
+            if reader.is_encrypted:
+                return [PdfChunk(name, content, 1, 1)]
+            total = len(reader.pages)
+            if total <= self.min_pages:
+                return [PdfChunk(name, content, 1, total)]
+
+            width = len(str(total))
+            chunks = []
+            for start in range(0, total, self.pages_per_chunk):
+                end = min(start + self.pages_per_chunk, total)
+                writer = PdfWriter()
+                for page in reader.pages[start:end]:
+                    writer.add_page(page)
+                out = io.BytesIO()
+                writer.write(out)
+                chunks.append(PdfChunk(
+                    _chunk_name(name, start + 1, end, width), out.getvalue(), start + 1, end
+                ))
+            return chunks
+        except (PyPdfError, ValueError, KeyError):
+            # Damaged files surface several error types; let the API report the
+            # problem with the file as uploaded
+            return [PdfChunk(name, content, 1, 1)]
+
+    def upload(
+        self,
+        documents: "DocumentsResource",
+        project_id: str,
+        name: str,
+        chunks: List[PdfChunk],
+    ) -> Dict[str, Any]:
+        """
+        Upload the chunks of one PDF concurrently and record the mapping.
+
+        If any chunk fails, the chunks already uploaded are deleted and the
+        first error is raised, so a document is never half uploaded.
+
+        Returns:
+            A Document for the logical document. Its "chunks" key lists the
+            chunk document IDs and page ranges.
+        """
+        results = run_bulk(
+            lambda chunk: documents.upload(
+                project_id, file_bytes=chunk.content, name=chunk.name, mime_type=PDF_MIME_TYPE
+            ),
+            chunks,
+            concurrency=self.concurrency,
+            key=lambda chunk: chunk.name,
+        )
+        failed = [r for r in results if not r.ok]
+        if failed:
+            uploaded = [r.value["id"] for r in results if r.ok]
+            # Rolled back even when the upload failed because it was cancelled
+            with cancellation.cancellable(None):
+                run_bulk(documents.delete, uploaded, concurrency=self.concurrency)
+            raise failed[0].error  # type: ignore[misc]
+
+        parent = SplitDocument(
+            id=f"{SPLIT_ID_PREFIX}{uuid.uuid4().hex[:16]}",
+            name=name,
+            project_id=project_id,
+            pages=chunks[-1].last_page,
+            chunks=[
+                ChunkRef(result.value["id"], chunk.first_page, chunk.last_page)
+                for chunk, result in zip(chunks, results)
+            ],
+        )
+        with self._lock:
+            self.documents[parent.id] = parent
+            if self.index_path:
+                self._save(self.index_path)
+
+        return documents._client._as_model(Document, {  # type: ignore[no-any-return]
+            "id": parent.id,
+            "name": name,
+            "mimeType": PDF_MIME_TYPE,
+            "size": sum(len(chunk.content) for chunk in chunks),
+            "status": results[0].value.get("status"),
+            "chunks": [
+                {"id": c.document_id, "firstPage": c.first_page, "lastPage": c.last_page}
+                for c in parent.chunks
+            ],
+        })
+
+    def delete(self, documents: "DocumentsResource", document_id: str) -> Dict[str, Any]:
+        """
+        Delete a logical document's chunks and forget it.
+
+        Chunks already gone count as deleted. If some chunks cannot be
+        deleted, the logical document keeps just those and the first error
+        is raised, so deleting it again retries only what is left.
+
+        Raises:
+            NotFoundError: If the splitter does not know the document
+        """
+        with self._lock:
+            parent = self.documents.get(document_id)
+        if parent is None:
+            raise NotFoundError(f"Split document {document_id} not found")
+
+        results = run_bulk(documents.delete, parent.document_ids, concurrency=self.concurrency)
+        failed = [
+            r for r in results if not r.ok and not isinstance(r.error, NotFoundError)
+        ]
+        remaining = {r.key for r in failed}
+        with self._lock:
+            parent.chunks = [c for c in parent.chunks if c.document_id in remaining]
+            if not parent.chunks:
+                self.documents.pop(document_id, None)
+            if self.index_path:
+                self._save(self.index_path)
+        if failed:
+            raise failed[0].error  # type: ignore[misc]
+        return {"success": True, "deleted": [r.key for r in results]}
+
+    def expand(self, document_ids: Iterable[str]) -> List[str]:
+        """Replace logical document IDs with their chunk document IDs."""
+        expanded: List[str] = []
+        for document_id in document_ids:
+            parent = self.documents.get(document_id)
+            expanded.extend(parent.document_ids if parent else [document_id])
+        return expanded
+
+    def reassemble(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge per-chunk export records into one record per logical document.
+
+        Chunks are combined in page order: list values are concatenated and
+        any other field takes the first non-empty value. The merged record
+        is keyed by the logical document's ID and lists its chunk IDs under
+        "_chunks". Its "name" is the logical document's name unless the
+        records carry an extracted "name" value of their own, rather than the
+        chunk file names. Records of documents that were not split pass
+        through unchanged, and the output keeps the order of the input.
+        """
+        chunk_parents = {
+            chunk.document_id: (parent, position)
+            for parent in self.documents.values()
+            for position, chunk in enumerate(parent.chunks)
+        }
+        output: List[Any] = []
+        grouped: Dict[str, List[Any]] = {}
+        for record in records:
+            found = chunk_parents.get(record.get("documentId", ""))
+            if found is None:
+                output.append(record)
+                continue
+            parent, position = found
+            if parent.id not in grouped:
+                grouped[parent.id] = [None] * len(parent.chunks)
+                output.append(parent.id)
+            grouped[parent.id][position] = record
+
+        merged_records = []
+        for item in output:
+            if not isinstance(item, str):
+                merged_records.append(item)
+                continue
+            parent = self.documents[item]
+            merged: Dict[str, Any] = {}
+            for record, chunk_name in zip(grouped[item], parent.chunk_names):
+                for key, value in (record or {}).items():
+                    if key == "name" and value == chunk_name:
+                        # The chunk's document name, not an extracted value
+                        continue
+                    if isinstance(value, list) and isinstance(merged.get(key), list):
+                        merged[key] = merged[key] + value
+                    elif _is_empty(merged.get(key)):
+                        merged[key] = value
+            merged["documentId"] = parent.id
+            merged["_chunks"] = parent.document_ids
+            if _is_empty(merged.get("name")):
+                merged["name"] = parent.name
+            merged_records.append(merged)
+        return merged_records
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        for parent_id, entry in data.items():
+            self.documents[parent_id] = SplitDocument(
+                id=parent_id,
+                name=entry["name"],
+                project_id=entry["projectId"],
+                pages=entry["pages"],
+                chunks=[ChunkRef(**chunk) for chunk in entry["chunks"]],
+            )
+
+    def _save(self, path: str) -> None:
+        data = {
+            parent.id: {
+                "name": parent.name,
+                "projectId": parent.project_id,
+                "pages": parent.pages,
+                "chunks": [vars(chunk) for chunk in parent.chunks],
+            }
+            for parent in self.documents.values()
+        }
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
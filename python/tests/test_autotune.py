@@ -0,0 +1,142 @@
+"""Tests for adaptive concurrency."""
+
+import base64
+import re
+import threading
+import time
+
+import pytest
+import requests
+import responses
+from structurify import Structurify
+from structurify.autotune import AdaptiveConcurrency, is_overload
+from structurify.bulk import run_bulk
+from structurify.exceptions import NotFoundError, RateLimitError, StructurifyError
+
+CONTENT_URL = re.compile(r"https://app\.structurify\.ai/api/documents/doc_\d+/content")
+
+
+def feed(tuner, latency, count, in_flight=None):
+    """Report count successful requests, each with the limit fully used."""
+    for _ in range(count):
+        tuner.acquire()
+        tuner._in_flight = in_flight if in_flight is not None else tuner.limit
+        tuner.release(latency)
+        tuner._in_flight = 0
+
+
+class TestAdaptiveConcurrency:
+    """Test how the limit responds to latency and errors."""
+
+    def test_grows_while_latency_is_steady(self):
+        """Steady latency with the limit in use lets it climb to the maximum."""
+        tuner = AdaptiveConcurrency(initial=2, max_limit=32)
+        feed(tuner, 0.05, 200)
+        assert tuner.limit == 32
+
+    def test_shrinks_when_latency_rises(self):
+        """Latency well above the baseline pulls the limit down."""
+        tuner = AdaptiveConcurrency(initial=2, max_limit=32)
+        feed(tuner, 0.05, 200)
+        feed(tuner, 0.5, 40)
+        assert tuner.limit < 16
+
+    def test_idle_limit_does_not_grow(self):
+        """Fast responses while the limit is mostly unused are not evidence for more."""
+        tuner = AdaptiveConcurrency(initial=8)
+        feed(tuner, 0.05, 100, in_flight=1)
+        assert tuner.limit == 8
+
+    def test_overload_backs_off_once_per_round_trip(self):
+        """A burst of 429s counts as one decrease."""
+        tuner = AdaptiveConcurrency(initial=20, backoff=0.5)
+        feed(tuner, 1.0, 1, in_flight=1)
+        for _ in range(5):
+            tuner.acquire()
+            tuner.release(0.01, error=RateLimitError("slow down"))
+        assert tuner.limit == 10
+        assert tuner.metrics()["overloads"] == 5
+
+    def test_client_errors_are_ignored(self):
+        """A 404 says nothing about load."""
+        tuner = AdaptiveConcurrency(initial=8)
+        tuner.acquire()
+        tuner.release(0.01, error=NotFoundError("gone"))
+        assert tuner.limit == 8
+        assert tuner.metrics()["samples"] == 0
+
+    def test_overload_classification(self):
+        """Exhausted connection retries count as overload; plain errors do not."""
+        try:
+            try:
+                raise requests.ConnectionError("reset")
+            except requests.ConnectionError as e:
+                raise StructurifyError("Connection error: reset") from e
+        except StructurifyError as e:
+            assert is_overload(e)
+        assert not is_overload(StructurifyError("bad request"))
+        assert not is_overload(ValueError())
+
+    def test_invalid_bounds(self):
+        """The initial limit must lie between the bounds."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(initial=10, max_limit=5)
+
+    def test_run_bulk_respects_limit(self):
+        """No more calls run at once than the limit allows."""
+        tuner = AdaptiveConcurrency(initial=3, max_limit=3)
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def work(item):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return item
+
+        results = run_bulk(work, range(20), concurrency=tuner)
+
+        assert all(r.ok for r in results)
+        assert active[1] == 3
+        assert tuner.metrics()["samples"] == 20
+        assert tuner.metrics()["in_flight"] == 0
+
+    def test_failing_size_returns_slot(self):
+        """A size function that raises neither leaks a slot nor fails the item."""
+        tuner = AdaptiveConcurrency(initial=2, max_limit=2)
+
+        def size(item):
+            raise OSError("file vanished")
+
+        results = run_bulk(lambda item: item, range(5), concurrency=tuner, size=size)
+
+        assert all(r.ok for r in results)
+        assert tuner.metrics()["in_flight"] == 0
+
+
+class TestDownloadMany:
+    """Test concurrent document downloads."""
+
+    @responses.activate
+    def test_downloads_to_folder(self, tmp_path):
+        """Each document is written under its ID; failures are reported per item."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/documents/doc_1/content",
+            json={"content": base64.b64encode(b"%PDF-1").decode(), "mimeType": "application/pdf"},
+        )
+        responses.add(responses.GET, CONTENT_URL, json={"error": "Not found"}, status=404)
+        client = Structurify(api_key="sk_test")
+        tuner = AdaptiveConcurrency(initial=2, max_limit=4)
+
+        results = client.documents.download_many(
+            ["doc_1", "doc_2"], str(tmp_path / "out"), concurrency=tuner
+        )
+
+        assert results[0].ok
+        assert (tmp_path / "out" / "doc_1").read_bytes() == b"%PDF-1"
+        assert isinstance(results[1].error, NotFoundError)
+        assert not (tmp_path / "out" / "doc_2").exists()
@@ -0,0 +1,88 @@
+"""Tests for the concurrent bulk runner."""
+
+import threading
+from concurrent.futures import Future
+
+from structurify.bulk import run_bulk, run_pipeline
+
+
+class TestRunBulk:
+    """Test the concurrent bulk runner."""
+
+    def test_results_in_input_order(self):
+        """Results are returned in input order."""
+        results = run_bulk(lambda x: x * 2, [1, 2, 3, 4], concurrency=4)
+        assert [r.value for r in results] == [2, 4, 6, 8]
+        assert all(r.ok for r in results)
+
+    def test_errors_captured_per_item(self):
+        """A failing item does not stop the others."""
+        def func(x):
+            if x == 2:
+                raise ValueError("boom")
+            return x
+
+        results = run_bulk(func, [1, 2, 3])
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+
+    def test_progress_reported(self):
+        """on_progress sees every completion."""
+        seen = []
+        run_bulk(lambda x: x, ["a", "b"], size=len, on_progress=lambda p: seen.append(p.completed))
+        assert sorted(seen) == [1, 2]
+
+
+class TestRunPipeline:
+    """Test the runner with a preparation stage."""
+
+    def test_calls_run_as_preparations_finish(self):
+        """A slow preparation holds back only its own item, and preparation is bounded."""
+        futures = {}
+        done = []
+
+        def prepare(x):
+            assert len(futures) - len(done) < 3  # one in flight plus two ahead
+            futures[x] = Future()
+            if x != 1:
+                futures[x].set_result(x * 10)
+            return futures[x]
+
+        def func(x, prepared):
+            done.append(x)
+            if len(done) == 3:
+                futures[1].set_result(10)
+            return prepared
+
+        results = run_pipeline(prepare, func, [1, 2, 3, 4, 5], concurrency=1, ahead=2)
+
+        assert [r.value for r in results] == [10, 20, 30, 40, 50]
+        assert done.index(1) == 3
+        assert len(futures) == 5
+
+    def test_preparation_errors_captured(self):
+        """An item whose preparation fails, or raises, is reported without running func."""
+        def prepare(x):
+            if x == 2:
+                raise ValueError("rejected")
+            future = Future()
+            if x == 3:
+                future.set_exception(OSError("unreadable"))
+            else:
+                future.set_result(x)
+            return future
+
+        called = []
+        lock = threading.Lock()
+
+        def func(x, prepared):
+            with lock:
+                called.append(x)
+            return prepared
+
+        results = run_pipeline(prepare, func, [1, 2, 3], concurrency=2)
+
+        assert [r.ok for r in results] == [True, False, False]
+        assert isinstance(results[1].error, ValueError)
+        assert isinstance(results[2].error, OSError)
+        assert called == [1]
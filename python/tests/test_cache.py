@@ -0,0 +1,114 @@
+"""Tests for the on-disk document cache."""
+
+import base64
+import os
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.cache import DocumentCache
+
+CONTENT_URL = "https://app.structurify.ai/api/documents/doc_1/content"
+
+
+def add_content(body=b"%PDF-1.4 cached"):
+    responses.add(
+        responses.GET,
+        CONTENT_URL,
+        json={"content": base64.b64encode(body).decode(), "mimeType": "application/pdf"},
+        status=200
+    )
+
+
+class TestDocumentCache:
+    """Test cache storage and eviction."""
+
+    def test_put_and_get(self, tmp_path):
+        """Stored content is returned as a raw file."""
+        cache = DocumentCache(str(tmp_path))
+        path = cache.put("doc_1", b"hello")
+
+        assert cache.get_path("doc_1") == path
+        with open(path, "rb") as f:
+            assert f.read() == b"hello"
+
+    def test_miss(self, tmp_path):
+        """Unknown documents are a miss."""
+        assert DocumentCache(str(tmp_path)).get_path("doc_missing") is None
+
+    def test_identical_content_stored_once(self, tmp_path):
+        """Two IDs with the same content share one blob."""
+        cache = DocumentCache(str(tmp_path))
+        assert cache.put("doc_1", b"same") == cache.put("doc_2", b"same")
+        assert cache.size() == 4
+
+    def test_lru_eviction(self, tmp_path):
+        """The least recently used content is evicted first."""
+        cache = DocumentCache(str(tmp_path), max_bytes=10)
+        old = cache.put("doc_old", b"a" * 6)
+        os.utime(old, (1, 1))
+        cache.put("doc_new", b"b" * 6)
+
+        assert cache.get_path("doc_old") is None
+        assert cache.get_path("doc_new") is not None
+        assert cache.size() <= 10
+
+    def test_limit_shared_between_instances(self, tmp_path):
+        """Caches sharing a directory, as worker processes do, share one size limit."""
+        first = DocumentCache(str(tmp_path), max_bytes=10)
+        second = DocumentCache(str(tmp_path), max_bytes=10)
+        first.put("doc_1", b"a" * 4)
+        second.put("doc_2", b"b" * 4)
+        first.put("doc_3", b"c" * 4)
+
+        assert first.size() <= 10
+
+    def test_mmap(self, tmp_path):
+        """Cached content can be memory-mapped."""
+        cache = DocumentCache(str(tmp_path))
+        cache.put("doc_1", b"mapped")
+        mapped = cache.get_mmap("doc_1")
+        assert mapped[:] == b"mapped"
+        mapped.close()
+
+
+class TestCachedDownloads:
+    """Test document downloads through the cache."""
+
+    @responses.activate
+    def test_repeat_download_uses_cache(self, tmp_path):
+        """Only the first download hits the network."""
+        add_content()
+        client = Structurify(api_key="sk_test_123", document_cache=DocumentCache(str(tmp_path)))
+
+        assert client.documents.download("doc_1") == b"%PDF-1.4 cached"
+        assert client.documents.download("doc_1") == b"%PDF-1.4 cached"
+        path = client.documents.download_path("doc_1")
+
+        assert len(responses.calls) == 1
+        with open(path, "rb") as f:
+            assert f.read() == b"%PDF-1.4 cached"
+
+    @responses.activate
+    def test_delete_invalidates(self, tmp_path):
+        """Deleting a document drops it from the cache index."""
+        add_content()
+        responses.add(
+            responses.DELETE,
+            "https://app.structurify.ai/api/documents/doc_1",
+            json={"success": True},
+            status=200
+        )
+        cache = DocumentCache(str(tmp_path))
+        client = Structurify(api_key="sk_test_123", document_cache=cache)
+
+        client.documents.download("doc_1")
+        client.documents.delete("doc_1")
+
+        assert cache.get_path("doc_1") is None
+
+    def test_download_path_requires_cache(self):
+        """download_path needs a configured cache."""
+        client = Structurify(api_key="sk_test_123")
+        with pytest.raises(ValueError, match="document_cache"):
+            client.documents.download_path("doc_1")
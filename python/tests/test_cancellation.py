@@ -0,0 +1,189 @@
+"""Tests for cooperative cancellation."""
+
+import http.server
+import threading
+import time
+
+import pytest
+import responses
+from structurify import OperationCancelledError, Structurify
+from structurify import cancellation
+from structurify.bulk import run_bulk
+from structurify.cancellation import CancellationToken
+from structurify.ratelimit import RateLimiter
+from structurify.scheduler import RequestScheduler
+
+BASE = "https://app.structurify.ai/api"
+JOB_URL = f"{BASE}/extraction-jobs/job_xxx"
+
+
+class TestCancellationToken:
+    """Test the token itself."""
+
+    def test_cancel_runs_callbacks_once(self):
+        """Callbacks run on the first cancel only, and late ones run immediately."""
+        token = CancellationToken()
+        calls = []
+        token.on_cancel(lambda: calls.append("early"))
+        unregister = token.on_cancel(lambda: calls.append("removed"))
+        unregister()
+
+        token.cancel("stop")
+        token.cancel("again")
+        token.on_cancel(lambda: calls.append("late"))
+
+        assert calls == ["early", "late"]
+        assert token.reason == "stop"
+        with pytest.raises(OperationCancelledError, match="stop"):
+            token.raise_if_cancelled()
+
+    def test_callback_errors_are_collected(self):
+        """A failing callback does not stop the others."""
+        token = CancellationToken()
+        calls = []
+        token.on_cancel(lambda: 1 / 0)
+        token.on_cancel(lambda: calls.append(True))
+        token.cancel()
+        assert calls == [True]
+        assert isinstance(token.errors[0], ZeroDivisionError)
+
+    def test_sleep_wakes_on_cancel(self):
+        """A sleep inside the token's scope ends as soon as it is cancelled."""
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel).start()
+        started = time.monotonic()
+        with cancellation.cancellable(token):
+            with pytest.raises(OperationCancelledError):
+                cancellation.sleep(5)
+        assert time.monotonic() - started < 1
+
+    def test_rate_limiter_wait_is_cancellable(self):
+        """Waiting for a rate-limit token stops on cancel."""
+        limiter = RateLimiter(rate=0.1, burst=1)
+        limiter.acquire()
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel).start()
+        with cancellation.cancellable(token):
+            with pytest.raises(OperationCancelledError):
+                limiter.acquire()
+
+    def test_scheduler_queue_is_cancellable(self):
+        """A request queued behind a full scheduler leaves the queue on cancel."""
+        scheduler = RequestScheduler(max_concurrency=1)
+        held = scheduler.acquire()
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel).start()
+        with cancellation.cancellable(token):
+            with pytest.raises(OperationCancelledError):
+                scheduler.acquire()
+        assert scheduler.stats()["queued"][held] == 0
+        scheduler.release(held)
+        assert scheduler.acquire(timeout=0.1) is not None
+
+
+class TestClientCancellation:
+    """Test cancellation of client calls and helpers."""
+
+    @responses.activate
+    def test_calls_fail_once_cancelled(self):
+        """No request is sent after the token is cancelled."""
+        client = Structurify(api_key="sk_test")
+        token = CancellationToken()
+        token.cancel()
+        with client.cancellable(token):
+            with pytest.raises(OperationCancelledError):
+                client.projects.list()
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_wait_for_completion_stops_polling(self):
+        """A polling loop ends promptly when the token is cancelled."""
+        responses.add(responses.GET, JOB_URL, json={"id": "job_xxx", "status": "running"})
+        client = Structurify(api_key="sk_test")
+        token = CancellationToken()
+        threading.Timer(0.1, token.cancel).start()
+
+        started = time.monotonic()
+        with client.cancellable(token):
+            with pytest.raises(OperationCancelledError):
+                client.extraction.wait_for_completion("job_xxx", poll_interval=10)
+        assert time.monotonic() - started < 2
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_cancel_jobs_cancels_started_job(self):
+        """With cancel_jobs, cancelling the token cancels the job on the server."""
+        responses.add(
+            responses.POST,
+            f"{BASE}/extraction-jobs",
+            json={"job": {"id": "job_xxx", "status": "queued"}},
+        )
+        responses.add(responses.DELETE, JOB_URL, json={"success": True})
+        client = Structurify(api_key="sk_test")
+        token = CancellationToken(cancel_jobs=True)
+
+        with client.cancellable(token):
+            client.extraction.run("proj_xxx")
+        token.cancel()
+
+        assert responses.calls[-1].request.method == "DELETE"
+        assert responses.calls[-1].request.url == JOB_URL
+        assert token.errors == []
+
+    def test_run_bulk_skips_items_after_cancel(self):
+        """Items that have not started when the token is cancelled are not run."""
+        token = CancellationToken()
+        ran = []
+
+        def work(item):
+            ran.append(item)
+            if item == 1:
+                token.cancel()
+
+        with cancellation.cancellable(token):
+            results = run_bulk(work, range(10), concurrency=1)
+
+        assert ran == [0, 1]
+        assert all(isinstance(r.error, OperationCancelledError) for r in results[2:])
+
+
+class _SlowHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(5)
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b'{"projects": []}')
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class TestInFlightAbort:
+    """Test aborting a request that is already on the wire."""
+
+    def test_in_flight_request_is_aborted(self):
+        """Cancelling shuts down the socket instead of waiting for the response."""
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            client = Structurify(
+                api_key="sk_test",
+                base_url=f"http://127.0.0.1:{server.server_address[1]}",
+                timeout=30,
+            )
+            token = CancellationToken()
+            threading.Timer(0.2, token.cancel).start()
+
+            started = time.monotonic()
+            with client.cancellable(token):
+                with pytest.raises(OperationCancelledError):
+                    client.projects.list()
+            assert time.monotonic() - started < 3
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,133 @@
+"""Tests for record and replay cassettes."""
+
+import json
+import time
+
+import pytest
+import responses
+from structurify import CassetteMissError, Structurify, StructurifyError
+from structurify.cassette import Cassette
+
+BASE = "https://app.structurify.ai/api"
+JOB_URL = f"{BASE}/extraction-jobs/job_xxx"
+DOWNLOAD_URL = f"{BASE}/exports/exp_xxx/download"
+
+
+@pytest.fixture
+def client():
+    return Structurify(api_key="sk_test_secret")
+
+
+def record_job_polls(client, path):
+    cassette = Cassette(path)
+    with responses.RequestsMock() as mock:
+        mock.add(responses.GET, JOB_URL, json={"job": {"id": "job_xxx", "status": "running"}})
+        mock.add(responses.GET, JOB_URL, json={"job": {"id": "job_xxx", "status": "done"}})
+        with cassette.record(client):
+            client.extraction.get("job_xxx")
+            client.extraction.get("job_xxx")
+    return cassette
+
+
+class TestRecord:
+    """Test recording exchanges."""
+
+    def test_record_saves_exchanges(self, client, tmp_path):
+        """Requests, responses and timings are written to the cassette file."""
+        path = str(tmp_path / "jobs.json")
+        record_job_polls(client, path)
+
+        with open(path) as f:
+            data = json.load(f)
+        first = data["interactions"][0]
+        assert first["request"]["method"] == "GET"
+        assert first["request"]["url"] == JOB_URL
+        assert first["response"]["status"] == 200
+        assert json.loads(first["response"]["body"])["job"]["status"] == "running"
+        assert first["duration"] >= first["first_byte"] >= 0
+
+    def test_credentials_are_redacted(self, client, tmp_path):
+        """The API key never reaches the cassette."""
+        path = str(tmp_path / "jobs.json")
+        record_job_polls(client, path)
+        with open(path) as f:
+            contents = f.read()
+        assert "sk_test_secret" not in contents
+        assert "<redacted>" in contents
+
+    def test_transport_restored_after_block(self, client, tmp_path):
+        """The client's own adapters are mounted again when recording ends."""
+        original = client._session.adapters["https://"]
+        record_job_polls(client, str(tmp_path / "jobs.json"))
+        assert client._session.adapters["https://"] is original
+
+
+class TestReplay:
+    """Test serving exchanges from a cassette."""
+
+    def test_replay_in_recorded_order(self, client, tmp_path):
+        """Repeated requests get the recorded responses in order, then the last one."""
+        path = str(tmp_path / "jobs.json")
+        record_job_polls(client, path)
+
+        replayer = Structurify(api_key="sk_other", base_url="http://localhost:1/api")
+        with Cassette(path).replay(replayer, latency_scale=0) as adapter:
+            statuses = [replayer.extraction.get("job_xxx")["status"] for _ in range(3)]
+        assert statuses == ["running", "done", "done"]
+        assert adapter.served == 3
+
+    def test_binary_stream_roundtrip(self, client, tmp_path):
+        """Binary bodies replay byte for byte through streamed downloads."""
+        payload = bytes(range(256)) * 64
+        cassette = Cassette(str(tmp_path / "download.json"))
+        with responses.RequestsMock() as mock:
+            mock.add(responses.GET, DOWNLOAD_URL, body=payload, content_type="text/csv")
+            with cassette.record(client):
+                client.exports.download_to("exp_xxx", str(tmp_path / "recorded.csv"))
+
+        with Cassette(cassette.path).replay(client, latency_scale=0):
+            written = client.exports.download_to("exp_xxx", str(tmp_path / "replayed.csv"))
+        assert written == len(payload)
+        assert (tmp_path / "replayed.csv").read_bytes() == payload
+
+    def test_latency_scaling(self, client):
+        """Recorded latencies are replayed, scaled."""
+        cassette = Cassette()
+        cassette.append({
+            "request": {"method": "GET", "url": JOB_URL},
+            "response": {"status": 200, "headers": {}, "body": '{"job": {"status": "done"}}'},
+            "first_byte": 0.2,
+            "duration": 0.2,
+        })
+
+        with cassette.replay(client, latency_scale=0.5):
+            started = time.monotonic()
+            client.extraction.get("job_xxx")
+            assert 0.09 <= time.monotonic() - started < 0.5
+        with cassette.replay(client, latency_scale=0):
+            started = time.monotonic()
+            client.extraction.get("job_xxx")
+            assert time.monotonic() - started < 0.09
+
+    def test_recorded_errors_replay(self, client):
+        """Recorded error responses raise the same SDK errors."""
+        cassette = Cassette()
+        cassette.append({
+            "request": {"method": "GET", "url": JOB_URL},
+            "response": {
+                "status": 404,
+                "headers": {"Content-Type": "application/json"},
+                "body": '{"error": "NotFound", "message": "Job not found"}',
+            },
+            "first_byte": 0.0,
+            "duration": 0.0,
+        })
+        with cassette.replay(client):
+            with pytest.raises(StructurifyError, match="Job not found"):
+                client.extraction.get("job_xxx")
+
+    def test_unrecorded_request_raises(self, client):
+        """A request the cassette does not contain fails instead of going to the network."""
+        with Cassette().replay(client):
+            with pytest.raises(CassetteMissError, match="GET /api/projects"):
+                client.projects.list()
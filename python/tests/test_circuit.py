@@ -0,0 +1,127 @@
+"""Tests for per-endpoint circuit breakers."""
+
+import time
+
+import pytest
+import requests
+import responses
+from structurify import Structurify, CircuitOpenError
+from structurify.circuit import CircuitBreaker, CircuitBreakers
+from structurify.exceptions import ServerError, StructurifyError
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_after_threshold(self):
+        """Consecutive failures open the circuit."""
+        breaker = CircuitBreaker("exports", failure_threshold=2)
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.group == "exports"
+        assert breaker.metrics()["rejected"] == 1
+
+    def test_success_resets_failures(self):
+        """A success clears the failure count."""
+        breaker = CircuitBreaker("exports", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+    def test_half_open_probe_closes(self):
+        """After the timeout one probe is allowed; success closes the circuit."""
+        breaker = CircuitBreaker("exports", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        breaker.before_request()
+        assert breaker.state == "half_open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_half_open_probe_failure_reopens(self):
+        """A failed probe opens the circuit again."""
+        breaker = CircuitBreaker("exports", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.times_opened == 2
+
+
+class TestClientCircuitBreakers:
+    """Test breaker integration with the client."""
+
+    def test_group_for_path(self):
+        """Groups are the first path segment."""
+        assert CircuitBreakers.group_for("/extraction-jobs/job_1") == "extraction-jobs"
+        assert CircuitBreakers.group_for("/project-templates") == "project-templates"
+
+    @responses.activate
+    def test_open_group_fails_fast_others_unaffected(self):
+        """An open extraction circuit does not block templates."""
+        responses.add(responses.GET, "https://app.structurify.ai/api/extraction-jobs/job_1",
+                      json={"error": "SERVER_ERROR"}, status=503)
+        responses.add(responses.GET, "https://app.structurify.ai/api/project-templates",
+                      json={"templates": []}, status=200)
+
+        client = Structurify(
+            api_key="sk_test_123",
+            circuit_breakers=CircuitBreakers(failure_threshold=2, recovery_timeout=60),
+        )
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                client.extraction.get("job_1")
+
+        with pytest.raises(CircuitOpenError):
+            client.extraction.get("job_1")
+        assert len(responses.calls) == 2
+
+        assert client.templates.list() == []
+        metrics = client.circuit_breakers.metrics()
+        assert metrics["extraction-jobs"]["state"] == "open"
+        assert metrics["project-templates"]["state"] == "closed"
+
+    @responses.activate
+    def test_probe_released_without_outcome(self):
+        """A probe that ends without a response frees its slot for the next request."""
+        responses.add(responses.GET, "https://app.structurify.ai/api/extraction-jobs/job_1",
+                      body=requests.exceptions.ChunkedEncodingError("cut off"))
+        breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=0.01)
+        breaker = breakers.for_path("/extraction-jobs")
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        client = Structurify(api_key="sk_test_123", circuit_breakers=breakers)
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            client.extraction.get("job_1")
+
+        assert breaker.state == "half_open"
+        assert breaker.before_request() is True
+
+    @responses.activate
+    def test_timeout_cut_short_by_deadline_not_counted(self):
+        """Only timeouts at the full request timeout count as endpoint failures."""
+        responses.add(responses.GET, "https://app.structurify.ai/api/extraction-jobs/job_1",
+                      body=requests.exceptions.ReadTimeout("slow"))
+        breakers = CircuitBreakers(failure_threshold=1)
+
+        client = Structurify(api_key="sk_test_123", max_retries=0, circuit_breakers=breakers)
+        with client.deadline(10):
+            with pytest.raises(StructurifyError):
+                client.extraction.get("job_1")
+        assert breakers.metrics()["extraction-jobs"]["consecutive_failures"] == 0
+
+        with pytest.raises(StructurifyError):
+            client.extraction.get("job_1")
+        assert breakers.metrics()["extraction-jobs"]["state"] == "open"
@@ -0,0 +1,137 @@
+"""Tests for the command-line interface."""
+
+import argparse
+import json
+from datetime import timedelta
+
+import pytest
+import responses
+from structurify.autotune import AdaptiveConcurrency
+from structurify.cli import main, parse_concurrency, parse_duration
+
+
+class TestCli:
+    """Test CLI commands."""
+
+    def test_parse_duration(self):
+        """Durations accept unit suffixes."""
+        assert parse_duration("30d") == timedelta(days=30)
+        assert parse_duration("90s") == timedelta(seconds=90)
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_duration("soon")
+
+    def test_parse_concurrency(self):
+        """Concurrency is a positive number or "auto"."""
+        assert parse_concurrency("16") == 16
+        assert isinstance(parse_concurrency("auto"), AdaptiveConcurrency)
+        for value in ("0", "many"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                parse_concurrency(value)
+
+    @responses.activate
+    def test_upload_directory(self, tmp_path):
+        """upload sends every supported file in the directory."""
+        (tmp_path / "a.pdf").write_bytes(b"%PDF-1.4\n%%EOF\n")
+        (tmp_path / "b.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+        (tmp_path / "notes.txt").write_text("skip me")
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/documents",
+            json={"document": {"id": "doc_1"}},
+            status=201
+        )
+
+        status = main(["--api-key", "sk_test_123", "-q", "upload", str(tmp_path),
+                       "--project", "proj_123", "--concurrency", "2"])
+
+        assert status == 0
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_export_stream_to_ndjson(self, tmp_path):
+        """export writes one JSON record per line."""
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/exports",
+            json={"export": {"id": "exp_1"}, "data": [{"id": "doc_1"}, {"id": "doc_2"}]},
+            status=201
+        )
+        out = tmp_path / "out.ndjson"
+
+        status = main(["--api-key", "sk_test_123", "-q", "export",
+                       "--project", "proj_123", "--stream-to", str(out)])
+
+        assert status == 0
+        lines = out.read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["doc_1", "doc_2"]
+
+    @responses.activate
+    def test_export_streams_download(self, tmp_path):
+        """A JSON export that must be downloaded is streamed into the NDJSON file."""
+        responses.add(
+            responses.POST, "https://app.structurify.ai/api/exports",
+            json={"export": {"id": "exp_1"}}, status=201,
+        )
+        responses.add(
+            responses.GET, "https://app.structurify.ai/api/exports/exp_1/download",
+            json={"data": [{"id": "doc_1"}, {"id": "doc_2"}]},
+        )
+        out = tmp_path / "out.ndjson"
+
+        status = main(["--api-key", "sk_test_123", "-q", "export",
+                       "--project", "proj_123", "--stream-to", str(out)])
+
+        assert status == 0
+        assert [json.loads(line)["id"] for line in out.read_text().splitlines()] == [
+            "doc_1", "doc_2",
+        ]
+
+    @responses.activate
+    def test_extract_wait(self, capsys):
+        """extract --wait polls until the job finishes; --timeout is not the request timeout."""
+        responses.add(
+            responses.POST, "https://app.structurify.ai/api/extraction-jobs",
+            json={"job": {"id": "job_1"}}, status=201,
+        )
+        responses.add(
+            responses.GET, "https://app.structurify.ai/api/extraction-jobs/job_1",
+            json={"job": {"id": "job_1", "status": "done", "progress": 100}},
+        )
+
+        status = main(["--api-key", "sk_test_123", "extract", "--project", "proj_123",
+                       "--wait", "--timeout", "60", "--poll-interval", "0"])
+
+        assert status == 0
+        assert "(100%)" in capsys.readouterr().err
+        assert responses.calls[1].request.req_kwargs["timeout"] == 30
+
+    @responses.activate
+    def test_cleanup_deletes_old_exports(self):
+        """cleanup deletes only exports older than the cutoff."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/exports",
+            json={"exports": [
+                {"id": "exp_old", "createdAt": "2020-01-01T00:00:00Z"},
+                {"id": "exp_new", "createdAt": "2999-01-01T00:00:00Z"},
+            ]},
+            status=200
+        )
+        responses.add(
+            responses.DELETE,
+            "https://app.structurify.ai/api/exports/exp_old",
+            json={"success": True},
+            status=200
+        )
+
+        status = main(["--api-key", "sk_test_123", "-q", "cleanup",
+                       "--project", "proj_123", "--older-than", "30d"])
+
+        assert status == 0
+        assert [c.request.method for c in responses.calls] == ["GET", "DELETE"]
+
+    def test_missing_api_key(self, monkeypatch):
+        """An API key is required."""
+        monkeypatch.delenv("STRUCTURIFY_API_KEY", raising=False)
+        with pytest.raises(SystemExit):
+            main(["--api-key", "", "extract", "--project", "proj_123"])
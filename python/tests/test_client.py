@@ -1,12 +1,23 @@
 """Tests for the Structurify client."""
 
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import responses
 from structurify import Structurify
+from structurify.cancellation import CancellationToken, cancellable
+from structurify.deadlines import deadline
+from structurify.singleflight import SingleFlight
 from structurify.exceptions import (
     AuthenticationError,
+    DeadlineExceededError,
     InsufficientCreditsError,
     NotFoundError,
+    OperationCancelledError,
     RateLimitError,
     ValidationError,
     ServerError,
@@ -212,3 +223,204 @@ class TestClientRequests:
 
         assert len(responses.calls) == 1
         assert "Bearer sk_test_secret_key" in responses.calls[0].request.headers["Authorization"]
+
+
+class TestClientCompression:
+    """Test request and response body compression."""
+
+    @responses.activate
+    def test_large_body_gzipped(self):
+        """JSON bodies over the threshold are sent gzip-encoded."""
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/documents",
+            json={"document": {"id": "doc_1"}},
+            status=201
+        )
+
+        client = Structurify(api_key="sk_test_123", compression="gzip", compression_threshold=100)
+        client.post("/documents", json={"content": "A" * 1000})
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.body)) == {"content": "A" * 1000}
+
+    @responses.activate
+    def test_small_body_not_compressed(self):
+        """Bodies under the threshold skip compression."""
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/projects",
+            json={"id": "proj_1"},
+            status=201
+        )
+
+        client = Structurify(api_key="sk_test_123", compression="gzip")
+        client.post("/projects", json={"name": "x"})
+
+        assert "Content-Encoding" not in responses.calls[0].request.headers
+
+    @responses.activate
+    def test_415_disables_compression(self):
+        """A 415 response falls back to an uncompressed body."""
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/documents",
+            json={"error": "UNSUPPORTED_MEDIA_TYPE", "message": "gzip not supported"},
+            status=415
+        )
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/documents",
+            json={"document": {"id": "doc_1"}},
+            status=201
+        )
+
+        client = Structurify(api_key="sk_test_123", compression="gzip", compression_threshold=0)
+        result = client.post("/documents", json={"content": "abc"})
+
+        assert result["document"]["id"] == "doc_1"
+        assert "Content-Encoding" not in responses.calls[1].request.headers
+        assert client._compression is None
+
+    def test_unknown_compression_raises(self):
+        """Unsupported encodings are rejected at construction."""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            Structurify(api_key="sk_test_123", compression="brotli")
+
+    @responses.activate
+    def test_download_to_decompresses_stream(self, tmp_path):
+        """download_to writes the decoded export body."""
+        csv_data = b"id,total\n" + b"doc_1,10\n" * 1000
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/exports/exp_1/download",
+            body=gzip.compress(csv_data),
+            headers={"Content-Encoding": "gzip"},
+            content_type="text/csv",
+            status=200
+        )
+
+        client = Structurify(api_key="sk_test_123")
+        out = tmp_path / "export.csv"
+        written = client.exports.download_to("exp_1", str(out))
+
+        assert written == len(csv_data)
+        assert out.read_bytes() == csv_data
+
+
+class TestRequestCoalescing:
+    """Test in-flight deduplication of identical reads."""
+
+    def test_concurrent_reads_share_one_call(self):
+        """Concurrent identical GETs make a single HTTP request."""
+        client = Structurify(api_key="sk_test_123", coalesce_reads=True)
+        release = threading.Event()
+        calls = []
+
+        def slow_request(method, path, params=None):
+            calls.append(path)
+            release.wait(2)
+            return {"project": {"id": "proj_1"}}
+
+        client._request = slow_request
+        with ThreadPoolExecutor(8) as executor:
+            futures = [executor.submit(client.projects.get, "proj_1") for _ in range(8)]
+            deadline = time.monotonic() + 2
+            while client._singleflight.coalesced < 7 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_different_params_not_merged(self):
+        """Reads with different params are separate calls."""
+        client = Structurify(api_key="sk_test_123", coalesce_reads=True)
+        calls = []
+
+        def record(method, path, params=None):
+            calls.append(params)
+            return {}
+
+        client._request = record
+        client.get("/exports", params={"projectId": "a"})
+        client.get("/exports", params={"projectId": "b"})
+
+        assert len(calls) == 2
+
+    def test_errors_propagate(self):
+        """The leader's exception is raised to the caller."""
+        def fail():
+            raise NotFoundError()
+
+        with pytest.raises(NotFoundError):
+            SingleFlight().do("key", fail)
+
+    def test_follower_gives_up_at_its_deadline(self):
+        """A caller waiting on another's call stops when its own deadline passes."""
+        flight = SingleFlight()
+        release = threading.Event()
+        with ThreadPoolExecutor(1) as executor:
+            leader = executor.submit(flight.do, "key", lambda: release.wait(2) and "ok")
+            while "key" not in flight._calls:
+                time.sleep(0.001)
+            started = time.monotonic()
+            with deadline(0.05):
+                with pytest.raises(DeadlineExceededError):
+                    flight.do("key", lambda: "unused")
+            assert time.monotonic() - started < 1
+            release.set()
+            assert leader.result() == "ok"
+
+    def test_leader_deadline_not_shared(self):
+        """A follower with more time left makes the call itself when the leader runs out."""
+        flight = SingleFlight()
+
+        def out_of_time():
+            while flight._calls["key"].shared < 1:
+                time.sleep(0.001)
+            raise DeadlineExceededError()
+
+        with ThreadPoolExecutor(1) as executor:
+            leader = executor.submit(flight.do, "key", out_of_time)
+            while "key" not in flight._calls:
+                time.sleep(0.001)
+            assert flight.do("key", lambda: "fresh") == "fresh"
+            with pytest.raises(DeadlineExceededError):
+                leader.result()
+
+    def test_follower_woken_by_its_own_token(self):
+        """Cancelling a waiting caller's token stops its wait, not the leader."""
+        flight = SingleFlight()
+        release = threading.Event()
+        token = CancellationToken()
+        with ThreadPoolExecutor(1) as executor:
+            leader = executor.submit(flight.do, "key", lambda: release.wait(2) and "ok")
+            while "key" not in flight._calls:
+                time.sleep(0.001)
+            threading.Timer(0.05, token.cancel).start()
+            with cancellable(token):
+                with pytest.raises(OperationCancelledError):
+                    flight.do("key", lambda: "unused")
+            assert not leader.done()
+            release.set()
+            assert leader.result() == "ok"
+
+    def test_leader_cancellation_not_shared(self):
+        """A follower whose leader was cancelled makes the call itself."""
+        flight = SingleFlight()
+
+        def cancelled():
+            while flight._calls["key"].shared < 1:
+                time.sleep(0.001)
+            raise OperationCancelledError()
+
+        with ThreadPoolExecutor(1) as executor:
+            leader = executor.submit(flight.do, "key", cancelled)
+            while "key" not in flight._calls:
+                time.sleep(0.001)
+            assert flight.do("key", lambda: "fresh") == "fresh"
+            with pytest.raises(OperationCancelledError):
+                leader.result()
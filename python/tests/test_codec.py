@@ -0,0 +1,103 @@
+"""Tests for pluggable JSON codecs."""
+
+import json
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.codec import JsonCodec, get_codec
+from structurify.exceptions import ServerError
+
+
+class RecordingCodec(JsonCodec):
+    """Stdlib codec that records what it handles."""
+
+    name = "recording"
+
+    def __init__(self):
+        self.encoded = []
+        self.decoded = []
+
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+class TestCodecs:
+    """Test codec selection and round trips."""
+
+    def test_stdlib_round_trip(self):
+        """The stdlib codec encodes compact UTF-8 bytes."""
+        codec = get_codec("json")
+        body = codec.dumps({"name": "Straße", "n": 1})
+        assert body == '{"name":"Straße","n":1}'.encode("utf-8")
+        assert codec.loads(body) == {"name": "Straße", "n": 1}
+
+    def test_auto_round_trip(self):
+        """Whichever codec auto picks round-trips to the same value as stdlib."""
+        codec = get_codec("auto")
+        payload = {"content": "QUJD" * 1000, "items": [1, 2.5, None, True]}
+        assert json.loads(codec.dumps(payload)) == payload
+        assert codec.loads(json.dumps(payload).encode("utf-8")) == payload
+
+    def test_invalid_json_raises_value_error(self):
+        """Decode errors surface as ValueError for every codec."""
+        with pytest.raises(ValueError):
+            get_codec("auto").loads(b"not json")
+
+    def test_unknown_codec(self):
+        """Unknown codec names are rejected."""
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_instance_passthrough(self):
+        """A codec instance is used as given."""
+        codec = RecordingCodec()
+        assert get_codec(codec) is codec
+
+
+class TestClientCodec:
+    """Test the codec on the client's request and response paths."""
+
+    @responses.activate
+    def test_bodies_use_codec(self):
+        """Request bodies are encoded and responses decoded by the client's codec."""
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/projects",
+            json={"project": {"id": "proj_1"}},
+            status=201,
+        )
+        codec = RecordingCodec()
+        client = Structurify(api_key="sk_test", json_codec=codec)
+        project = client.projects.create(name="Q1", template_id="tpl_invoice")
+
+        assert project["id"] == "proj_1"
+        assert codec.encoded == [{"name": "Q1", "templateId": "tpl_invoice"}]
+        assert isinstance(codec.decoded[0], bytes)
+        request = responses.calls[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.body) == {"name": "Q1", "templateId": "tpl_invoice"}
+
+    @responses.activate
+    def test_invalid_response_body(self):
+        """A non-JSON error body still produces a StructurifyError."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/projects",
+            body="<html>Bad gateway</html>",
+            status=502,
+        )
+        client = Structurify(api_key="sk_test", max_retries=0)
+        with pytest.raises(ServerError) as exc_info:
+            client.projects.list()
+        assert "Bad gateway" in str(exc_info.value)
+
+    def test_config_keeps_codec(self):
+        """The codec name survives the client config."""
+        client = Structurify(api_key="sk_test", json_codec="json")
+        assert client.config.json_codec == "json"
@@ -0,0 +1,157 @@
+"""Tests for credit-aware extraction scheduling."""
+
+import json
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.credits import ExtractionScheduler
+from structurify.exceptions import InsufficientCreditsError
+
+JOBS_URL = "https://app.structurify.ai/api/extraction-jobs"
+
+
+def _job_callback(started, fail_after=None):
+    """Return a callback that starts jobs, answering 402 once fail_after jobs have run."""
+
+    def callback(request):
+        project_id = json.loads(request.body)["projectId"]
+        if fail_after is not None and len(started) >= fail_after:
+            return (402, {}, json.dumps({"error": "Insufficient credits"}))
+        started.append(project_id)
+        return (201, {}, json.dumps({"job": {"id": f"job_{project_id}"}}))
+
+    return callback
+
+
+class TestExtractionScheduler:
+    """Test wave sizing and waiting for credits."""
+
+    @responses.activate
+    def test_runs_within_balance(self):
+        """Everything runs when the balance covers it."""
+        started = []
+        responses.add_callback(responses.POST, JOBS_URL, callback=_job_callback(started))
+
+        client = Structurify(api_key="sk_test")
+        scheduler = ExtractionScheduler(client, balance=10)
+        scheduler.submit("proj_a", cost=4)
+        scheduler.submit("proj_b", cost=4)
+        done = scheduler.run()
+
+        assert started == ["proj_a", "proj_b"]
+        assert [item.job["id"] for item in done] == ["job_proj_a", "job_proj_b"]
+        assert scheduler.balance == 2
+
+    @responses.activate
+    def test_large_extraction_does_not_block_smaller_ones(self):
+        """Extractions that fit run past one that doesn't; over the credit limit fails at once."""
+        started = []
+        responses.add_callback(responses.POST, JOBS_URL, callback=_job_callback(started))
+
+        client = Structurify(api_key="sk_test")
+        scheduler = ExtractionScheduler(client, balance=10, credit_limit=50, max_wait=0)
+        scheduler.submit("proj_a", cost=4)
+        scheduler.submit("proj_huge", cost=80)
+        scheduler.submit("proj_b", cost=20)
+        scheduler.submit("proj_c", cost=6)
+        with pytest.raises(InsufficientCreditsError, match="1 extractions still queued"):
+            scheduler.run()
+
+        assert started == ["proj_a", "proj_c"]
+        assert [item.project_id for item in scheduler.pending] == ["proj_b"]
+
+    @responses.activate
+    def test_rejects_cost_over_credit_limit(self):
+        """An extraction that can never fit is returned with an error rather than waited on."""
+        client = Structurify(api_key="sk_test")
+        scheduler = ExtractionScheduler(client, balance=10, credit_limit=50)
+        item = scheduler.submit("proj_huge", cost=80)
+
+        assert scheduler.run() == [item]
+        assert isinstance(item.error, InsufficientCreditsError)
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_waits_for_provider_refresh(self):
+        """Work beyond the balance waits until the provider reports more credits."""
+        started = []
+        responses.add_callback(responses.POST, JOBS_URL, callback=_job_callback(started))
+        balances = iter([5, 0, 10])
+        waits = []
+
+        client = Structurify(api_key="sk_test")
+        scheduler = ExtractionScheduler(
+            client,
+            balance_provider=lambda: next(balances),
+            refresh_interval=0.01,
+            on_wait=lambda pending, delay: waits.append(pending),
+        )
+        scheduler.submit("proj_a", cost=5)
+        scheduler.submit("proj_b", cost=5)
+        done = scheduler.run()
+
+        assert started == ["proj_a", "proj_b"]
+        assert len(done) == 2
+        assert waits == [1, 1]
+
+    @responses.activate
+    def test_402_requeues_rest_of_wave(self):
+        """A 402 mid-wave puts the unstarted work back at the front of the queue."""
+        started = []
+        responses.add_callback(
+            responses.POST, JOBS_URL, callback=_job_callback(started, fail_after=1)
+        )
+
+        client = Structurify(api_key="sk_test", max_retries=0)
+        scheduler = ExtractionScheduler(client, balance=100, refresh_interval=0.01, max_wait=0.03)
+        scheduler.submit("proj_a", cost=1)
+        scheduler.submit("proj_b", cost=1)
+        scheduler.submit("proj_c", cost=1)
+
+        with pytest.raises(InsufficientCreditsError):
+            scheduler.run()
+
+        assert started == ["proj_a"]
+        assert [item.project_id for item in scheduler.pending] == ["proj_b", "proj_c"]
+        assert client.credits_remaining == 0
+
+    @responses.activate
+    def test_cost_from_project(self):
+        """Cost defaults to the project's document count."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/projects/proj_a",
+            json={"project": {"id": "proj_a"}, "columns": [], "documents": [{}, {}, {}]},
+            status=200,
+        )
+
+        client = Structurify(api_key="sk_test")
+        item = ExtractionScheduler(client).submit("proj_a")
+
+        assert item.cost == 3
+
+    @responses.activate
+    def test_balance_from_header(self):
+        """The client tracks X-Credits-Remaining and the scheduler starts from it."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/project-templates",
+            json={"templates": []},
+            headers={"X-Credits-Remaining": "7"},
+            status=200,
+        )
+
+        client = Structurify(api_key="sk_test")
+        client.templates.list()
+        assert client.credits_remaining == 7
+
+        started = []
+        responses.add_callback(responses.POST, JOBS_URL, callback=_job_callback(started))
+        scheduler = ExtractionScheduler(client, max_wait=0)
+        scheduler.submit("proj_a", cost=5)
+        scheduler.submit("proj_b", cost=5)
+
+        with pytest.raises(InsufficientCreditsError):
+            scheduler.run()
+        assert started == ["proj_a"]
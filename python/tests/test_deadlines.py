@@ -0,0 +1,132 @@
+"""Tests for end-to-end deadlines."""
+
+import time
+
+import pytest
+import requests
+import responses
+from structurify import DeadlineExceededError, Structurify, StructurifyError
+from structurify import deadlines
+from structurify.ratelimit import RateLimiter
+
+PROJECTS_URL = "https://app.structurify.ai/api/projects"
+JOB_URL = "https://app.structurify.ai/api/extraction-jobs/job_xxx"
+
+
+class TestDeadlineContext:
+    """Test the deadline context helpers."""
+
+    def test_nested_deadlines_only_shrink(self):
+        """An inner deadline cannot extend an outer one."""
+        assert deadlines.remaining() is None
+        with deadlines.deadline(1.0) as outer:
+            with deadlines.deadline(10.0) as inner:
+                assert inner == outer
+            with deadlines.deadline(0.5) as inner:
+                assert inner < outer
+        assert deadlines.current_deadline() is None
+
+    def test_sleep_raises_without_sleeping(self):
+        """A sleep that would overrun the deadline fails immediately."""
+        with deadlines.deadline(0.05):
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError):
+                deadlines.sleep(5)
+            assert time.monotonic() - started < 0.05
+
+    def test_rate_limiter_timeout(self):
+        """The limiter refuses to wait longer than the timeout."""
+        limiter = RateLimiter(rate=1, burst=1)
+        assert limiter.acquire(timeout=0.01)
+        assert not limiter.acquire(timeout=0.01)
+
+
+class TestClientDeadlines:
+    """Test deadlines applied to client calls."""
+
+    @responses.activate
+    def test_retry_after_beyond_deadline_skips_retry(self):
+        """A Retry-After that does not fit ends the call instead of sleeping."""
+        responses.add(
+            responses.GET,
+            PROJECTS_URL,
+            json={"error": "RateLimited", "message": "Slow down"},
+            headers={"Retry-After": "30"},
+            status=429,
+        )
+        client = Structurify(api_key="sk_test")
+
+        started = time.monotonic()
+        with client.deadline(1.0):
+            with pytest.raises(DeadlineExceededError):
+                client.projects.list()
+        assert time.monotonic() - started < 0.5
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_backoff_truncated(self, monkeypatch):
+        """Connection-error backoff is shortened to fit the deadline."""
+        monkeypatch.setattr(Structurify, "RETRY_DELAY", 1.0)
+        responses.add(responses.GET, PROJECTS_URL, body=requests.ConnectionError("refused"))
+        client = Structurify(api_key="sk_test", max_retries=3)
+
+        started = time.monotonic()
+        with client.deadline(0.3):
+            with pytest.raises(StructurifyError):
+                client.projects.list()
+        assert time.monotonic() - started < 0.35
+        assert len(responses.calls) == 4
+
+    def test_attempt_timeout_capped(self, monkeypatch):
+        """Each attempt's socket timeout is capped at the time left."""
+        client = Structurify(api_key="sk_test", timeout=30, max_retries=0)
+        seen = []
+
+        def fake_request(**kwargs):
+            seen.append(kwargs["timeout"])
+            time.sleep(0.06)
+            raise requests.Timeout("read timed out")
+
+        monkeypatch.setattr(client._session, "request", fake_request)
+
+        with client.deadline(0.05):
+            with pytest.raises(DeadlineExceededError):
+                client.projects.list()
+        assert seen[0] <= 0.05
+
+    @responses.activate
+    def test_client_default_deadline(self):
+        """The client's deadline bounds each call without a context."""
+        responses.add(
+            responses.GET,
+            PROJECTS_URL,
+            json={"error": "RateLimited", "message": "Slow down"},
+            headers={"Retry-After": "30"},
+            status=429,
+        )
+        client = Structurify(api_key="sk_test", deadline=0.5)
+        with pytest.raises(DeadlineExceededError):
+            client.projects.list()
+        assert client.config.deadline == 0.5
+
+    def test_rate_limit_wait_beyond_deadline(self):
+        """A rate-limit wait longer than the deadline fails without sending."""
+        client = Structurify(api_key="sk_test", rate_limit=RateLimiter(rate=0.1, burst=1))
+        client._rate_limiter.try_acquire()
+        with client.deadline(0.5):
+            with pytest.raises(DeadlineExceededError):
+                client.projects.list()
+
+    @responses.activate
+    def test_wait_for_completion_honors_deadline(self):
+        """Polling stops when the next poll would miss the deadline."""
+        responses.add(
+            responses.GET, JOB_URL, json={"job": {"id": "job_xxx", "status": "processing"}}
+        )
+        client = Structurify(api_key="sk_test")
+
+        started = time.monotonic()
+        with client.deadline(0.2):
+            with pytest.raises(DeadlineExceededError):
+                client.extraction.wait_for_completion("job_xxx", poll_interval=1.0)
+        assert time.monotonic() - started < 0.2
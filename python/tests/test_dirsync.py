@@ -0,0 +1,177 @@
+"""Tests for folder-to-project sync."""
+
+import itertools
+import json
+import os
+import re
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify import dirsync
+from structurify.dirsync import MANIFEST_NAME
+
+BASE = "https://app.structurify.ai/api"
+DOCUMENTS_URL = f"{BASE}/documents"
+DELETE_URL = re.compile(rf"{BASE}/documents/doc_\d+")
+
+
+@pytest.fixture
+def api():
+    """Mock documents API that hands out sequential IDs and records calls."""
+    ids = itertools.count(1)
+    uploaded = []
+
+    def upload(request):
+        body = json.loads(request.body)
+        uploaded.append(body["fileName"])
+        return 200, {}, json.dumps({"document": {"id": f"doc_{next(ids)}"}})
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add_callback(responses.POST, DOCUMENTS_URL, callback=upload)
+        mock.add(responses.DELETE, DELETE_URL, json={"success": True})
+        mock.uploaded = uploaded
+        yield mock
+
+
+def deleted(mock):
+    return sorted(
+        call.request.url.rsplit("/", 1)[1]
+        for call in mock.calls if call.request.method == "DELETE"
+    )
+
+
+def write(folder, name, content):
+    path = folder / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+@pytest.fixture
+def client():
+    return Structurify(api_key="sk_test")
+
+
+class TestSyncDir:
+    """Test syncing a folder to a project."""
+
+    def test_first_sync_uploads_everything(self, api, client, tmp_path):
+        """Every supported file is uploaded and recorded in the manifest."""
+        write(tmp_path, "a.pdf", b"%PDF-a")
+        write(tmp_path, "sub/b.png", b"\x89PNG-b")
+        write(tmp_path, "notes.txt", b"ignored")
+
+        report = client.documents.sync_dir("proj_1", str(tmp_path))
+
+        assert sorted(report.uploaded) == ["a.pdf", "sub/b.png"]
+        assert report.ok
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert set(manifest["files"]) == {"a.pdf", "sub/b.png"}
+        assert manifest["projectId"] == "proj_1"
+
+    def test_unchanged_files_are_not_read(self, api, client, tmp_path, monkeypatch):
+        """Matching size and mtime skips hashing and uploading."""
+        write(tmp_path, "a.pdf", b"%PDF-a")
+        client.documents.sync_dir("proj_1", str(tmp_path))
+        monkeypatch.setattr(dirsync, "file_sha256", lambda path: pytest.fail("hashed"))
+        report = client.documents.sync_dir("proj_1", str(tmp_path))
+
+        assert (report.unchanged, report.hashed, report.uploaded) == (1, 0, [])
+        assert len(api.uploaded) == 1
+
+    def test_touched_file_is_hashed_not_uploaded(self, api, client, tmp_path):
+        """A new mtime with the same content only updates the manifest."""
+        path = write(tmp_path, "a.pdf", b"%PDF-a")
+        client.documents.sync_dir("proj_1", str(tmp_path))
+        os.utime(path, ns=(0, 1_000_000_000))
+
+        report = client.documents.sync_dir("proj_1", str(tmp_path))
+
+        assert (report.unchanged, report.hashed, report.uploaded) == (1, 1, [])
+        assert len(api.uploaded) == 1
+
+    def test_changed_file_replaces_document(self, api, client, tmp_path):
+        """New content is uploaded and the old document deleted."""
+        write(tmp_path, "a.pdf", b"%PDF-a")
+        client.documents.sync_dir("proj_1", str(tmp_path))
+        write(tmp_path, "a.pdf", b"%PDF-a, revised")
+
+        report = client.documents.sync_dir("proj_1", str(tmp_path))
+
+        assert report.updated == ["a.pdf"]
+        assert deleted(api) == ["doc_1"]
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert manifest["files"]["a.pdf"]["document_id"] == "doc_2"
+
+    def test_removed_file_deletes_document(self, api, client, tmp_path):
+        """Documents of removed files are deleted; a dry run only reports them."""
+        write(tmp_path, "a.pdf", b"%PDF-a")
+        b = write(tmp_path, "b.pdf", b"%PDF-b")
+        client.documents.sync_dir("proj_1", str(tmp_path))
+        b.unlink()
+
+        assert client.documents.sync_dir("proj_1", str(tmp_path), dry_run=True).deleted == [
+            "b.pdf"
+        ]
+        assert deleted(api) == []
+
+        report = client.documents.sync_dir("proj_1", str(tmp_path))
+        assert report.deleted == ["b.pdf"]
+        assert deleted(api) == ["doc_2"]
+
+    def test_renamed_file_keeps_document(self, api, client, tmp_path):
+        """A moved file with the same content is neither uploaded nor deleted."""
+        path = write(tmp_path, "a.pdf", b"%PDF-a")
+        client.documents.sync_dir("proj_1", str(tmp_path))
+        path.rename(tmp_path / "renamed.pdf")
+
+        report = client.documents.sync_dir("proj_1", str(tmp_path))
+
+        assert report.renamed == ["renamed.pdf"]
+        assert (report.uploaded, report.deleted, deleted(api)) == ([], [], [])
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert manifest["files"] == {"renamed.pdf": manifest["files"]["renamed.pdf"]}
+        assert manifest["files"]["renamed.pdf"]["document_id"] == "doc_1"
+
+    def test_manifest_for_other_project_is_ignored(self, api, client, tmp_path):
+        """Syncing to a new project starts fresh and deletes nothing."""
+        write(tmp_path, "a.pdf", b"%PDF-a")
+        client.documents.sync_dir("proj_1", str(tmp_path))
+
+        report = client.documents.sync_dir("proj_2", str(tmp_path))
+
+        assert report.uploaded == ["a.pdf"]
+        assert deleted(api) == []
+
+    def test_manifest_saved_during_uploads(self, api, client, tmp_path, monkeypatch):
+        """Uploads already made are in the manifest before the sync finishes."""
+        monkeypatch.setattr(dirsync, "_SAVE_EVERY", 1)
+        write(tmp_path, "a.pdf", b"%PDF-a")
+        write(tmp_path, "b.pdf", b"%PDF-b")
+        saved = []
+        real_upload = client.documents.upload
+
+        def upload(project_id, file_path, name):
+            path = tmp_path / MANIFEST_NAME
+            saved.append(set(json.loads(path.read_text())["files"]) if path.exists() else set())
+            return real_upload(project_id, file_path=file_path, name=name)
+
+        monkeypatch.setattr(client.documents, "upload", upload)
+        client.documents.sync_dir("proj_1", str(tmp_path), concurrency=1)
+
+        assert saved == [set(), {"a.pdf"}]
+
+    def test_response_without_id_fails_item(self, api, client, tmp_path):
+        """An upload answered without a document ID fails that file only."""
+        write(tmp_path, "a.pdf", b"%PDF-a")
+        write(tmp_path, "b.pdf", b"%PDF-b")
+        api.replace(responses.POST, DOCUMENTS_URL, json={"document": {}})
+        api.add(responses.POST, DOCUMENTS_URL, json={"document": {"id": "doc_9"}})
+
+        report = client.documents.sync_dir("proj_1", str(tmp_path), concurrency=1)
+
+        assert report.uploaded == ["b.pdf"]
+        assert [r.key for r in report.failed] == ["a.pdf"]
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert set(manifest["files"]) == {"b.pdf"}
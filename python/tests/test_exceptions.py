@@ -9,6 +9,7 @@ from structurify.exceptions import (
     ValidationError,
     InsufficientCreditsError,
     ServerError,
+    PreflightError,
 )
 
 
@@ -114,3 +115,14 @@ class TestServerError:
         assert error.message == "Server error"
         assert error.code == "SERVER_ERROR"
         assert error.status_code == 500
+
+
+class TestPreflightError:
+    """Test PreflightError."""
+
+    def test_reason(self):
+        """PreflightError carries the rejection reason."""
+        error = PreflightError("a.pdf is encrypted", reason="encrypted_pdf")
+        assert error.code == "PREFLIGHT_REJECTED"
+        assert error.reason == "encrypted_pdf"
+        assert error.status_code is None
@@ -0,0 +1,174 @@
+"""Tests for hedged GET requests."""
+
+import json
+import threading
+import time
+
+import pytest
+import responses
+from structurify import Structurify, cancellation
+from structurify.cancellation import CancellationToken
+from structurify.deadlines import deadline
+from structurify.exceptions import (
+    DeadlineExceededError,
+    NotFoundError,
+    OperationCancelledError,
+)
+from structurify.hedging import HedgePolicy
+
+JOB_URL = "https://app.structurify.ai/api/extraction-jobs/job_xxx"
+
+
+class TestHedgePolicy:
+    """Test hedge delays, budget and winner selection."""
+
+    def test_fast_call_not_hedged(self):
+        """A call that beats the delay is never duplicated."""
+        policy = HedgePolicy(initial_delay=1.0)
+        calls = []
+        assert policy.run("/documents/doc_1", lambda: calls.append(1) or "ok") == "ok"
+        assert calls == [1]
+        assert policy.metrics()["hedged"] == 0
+
+    def test_slow_call_hedged(self):
+        """A slow call is hedged and the faster response wins."""
+        policy = HedgePolicy(initial_delay=0.02, min_delay=0.01)
+        lock = threading.Lock()
+        calls = []
+
+        def func():
+            with lock:
+                calls.append(1)
+                first = len(calls) == 1
+            if first:
+                time.sleep(0.5)
+                return "slow"
+            return "fast"
+
+        started = time.monotonic()
+        assert policy.run("/extraction-jobs/job_1", func) == "fast"
+        assert time.monotonic() - started < 0.4
+        metrics = policy.metrics()
+        assert metrics["hedged"] == 1
+        assert metrics["hedge_wins"] == 1
+
+    def test_loser_is_cancelled(self):
+        """The slower call's token is cancelled once the other call wins."""
+        policy = HedgePolicy(initial_delay=0.02, min_delay=0.01)
+        lock = threading.Lock()
+        calls = []
+        loser_stopped = threading.Event()
+
+        def func():
+            with lock:
+                calls.append(1)
+                first = len(calls) == 1
+            if first:
+                try:
+                    cancellation.sleep(5)
+                except OperationCancelledError:
+                    loser_stopped.set()
+                    raise
+            return "fast"
+
+        assert policy.run("/extraction-jobs/job_1", func) == "fast"
+        assert loser_stopped.wait(1)
+
+    def test_delay_starts_when_call_starts(self):
+        """Time spent queued for a worker thread does not count toward the hedge delay."""
+        policy = HedgePolicy(initial_delay=0.1, min_delay=0.01, max_workers=1)
+        policy._submit(lambda: time.sleep(0.2), CancellationToken())
+
+        def func():
+            time.sleep(0.02)
+            return "ok"
+
+        assert policy.run("/documents/doc_1", func) == "ok"
+        assert policy.metrics()["hedged"] == 0
+
+    def test_wait_for_thread_honours_deadline_and_token(self):
+        """A call stuck behind a saturated pool gives up at the deadline or on cancel."""
+        policy = HedgePolicy(initial_delay=0.1, max_workers=1)
+        release = threading.Event()
+        policy._submit(release.wait, CancellationToken())
+        calls = []
+
+        started = time.monotonic()
+        with deadline(0.05), pytest.raises(DeadlineExceededError):
+            policy.run("/documents/doc_1", lambda: calls.append(1))
+        assert time.monotonic() - started < 1.0
+
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel).start()
+        with cancellation.cancellable(token), pytest.raises(OperationCancelledError):
+            policy.run("/documents/doc_1", lambda: calls.append(1))
+
+        release.set()
+        policy._executor.shutdown(wait=True)
+        assert calls == []
+
+    def test_budget_limits_hedges(self):
+        """Once the budget is spent, slow calls are not hedged."""
+        policy = HedgePolicy(initial_delay=0.01, min_delay=0.01, budget=0.0, max_tokens=1)
+        calls = []
+
+        def func():
+            calls.append(1)
+            time.sleep(0.03)
+            return "ok"
+
+        policy.run("/documents/doc_1", func)
+        policy.run("/documents/doc_1", func)
+        time.sleep(0.05)
+
+        metrics = policy.metrics()
+        assert metrics["hedged"] == 1
+        assert metrics["over_budget"] == 1
+        assert len(calls) == 3
+
+    def test_delay_tracks_percentile(self):
+        """The hedge delay follows the recorded latency percentile per group."""
+        policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0.0)
+        for i in range(100):
+            policy._record_latency("documents", i / 1000)
+        assert policy.delay_for("documents") == pytest.approx(0.09)
+        assert policy.delay_for("projects") == policy.initial_delay
+
+    def test_errors_propagate(self):
+        """An error from an unhedged call is raised to the caller."""
+        policy = HedgePolicy()
+
+        def func():
+            raise NotFoundError("missing")
+
+        with pytest.raises(NotFoundError):
+            policy.run("/documents/doc_1", func)
+
+
+class TestClientHedging:
+    """Test hedging wired into client GETs."""
+
+    @responses.activate
+    def test_get_is_hedged(self):
+        """A slow GET is answered by the hedge."""
+        calls = []
+        released = threading.Event()
+
+        def callback(request):
+            calls.append(1)
+            if len(calls) == 1:
+                released.wait(5)
+            return (200, {}, json.dumps({"job": {"id": "job_xxx", "attempt": len(calls)}}))
+
+        responses.add_callback(responses.GET, JOB_URL, callback=callback)
+
+        client = Structurify(
+            api_key="sk_test", hedging=HedgePolicy(initial_delay=0.05, min_delay=0.01)
+        )
+        job = client.extraction.get("job_xxx")
+
+        assert job["attempt"] == 2
+        assert client.hedging.metrics()["hedge_wins"] == 1
+        # Let the abandoned request finish while responses is still active
+        released.set()
+        client.hedging._executor.shutdown(wait=True)
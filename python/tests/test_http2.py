@@ -0,0 +1,111 @@
+"""Tests for the HTTP/2 transport."""
+
+import asyncio
+import gzip
+import threading
+import time
+
+import pytest
+import requests
+import responses
+from structurify import Structurify
+from structurify.cancellation import CancellableAdapter, CancellationToken
+from structurify.exceptions import OperationCancelledError, StructurifyError
+from structurify.http2 import Http2Adapter
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+BASE = "https://app.structurify.ai/api"
+
+
+def mock_client(handler, **kwargs):
+    """Client whose HTTP/2 adapter sends through an httpx mock transport."""
+    client = Structurify(api_key="sk_test", http2=True, **kwargs)
+    mock = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._session.get_adapter(BASE)._client_for = lambda verify, cert: mock
+    return client
+
+
+class TestHttp2Adapter:
+    """Test routing, conversion and errors of the HTTP/2 adapter."""
+
+    def test_mounted_for_https_only(self):
+        """http2=True mounts the adapter for https:// and survives config round trips."""
+        client = Structurify(api_key="sk_test", http2=True)
+
+        assert isinstance(client._session.get_adapter(BASE), Http2Adapter)
+        assert type(client._session.get_adapter("http://localhost")) is CancellableAdapter
+        assert Structurify.from_config(client.config)._http2
+        default = Structurify(api_key="sk_test")
+        assert type(default._session.get_adapter(BASE)) is CancellableAdapter
+
+    def test_small_request_goes_over_httpx(self):
+        """Headers are passed through and the compressed JSON body decoded."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            body = gzip.compress(b'{"job": {"id": "job_1", "status": "completed"}}')
+            return httpx.Response(
+                200, content=body, headers={"Content-Encoding": "gzip", "X-Request-Id": "r1"}
+            )
+
+        client = mock_client(handler)
+
+        assert client.extraction.get("job_1")["status"] == "completed"
+        assert seen[0].url == f"{BASE}/extraction-jobs/job_1"
+        assert seen[0].headers["authorization"] == "Bearer sk_test"
+
+    def test_streamed_download(self, tmp_path):
+        """Streamed responses are read chunk by chunk into the destination."""
+        data = bytes(range(256)) * 1000
+        client = mock_client(lambda request: httpx.Response(200, content=data))
+
+        written = client.exports.download_to("exp_1", str(tmp_path / "out.csv"), chunk_size=1000)
+
+        assert written == len(data)
+        assert (tmp_path / "out.csv").read_bytes() == data
+
+    @responses.activate
+    def test_large_upload_uses_http1(self):
+        """Bodies over large_body are sent by the HTTP/1.1 fallback adapter."""
+        responses.add(responses.POST, f"{BASE}/documents", json={"document": {"id": "doc_1"}})
+        client = mock_client(lambda request: pytest.fail("upload sent over HTTP/2"))
+
+        doc = client.documents.upload("proj_1", file_bytes=b"x" * 300_000, name="a.pdf")
+
+        assert doc["id"] == "doc_1"
+        assert len(responses.calls) == 1
+
+    def test_transport_errors_map_to_requests(self):
+        """httpx errors surface as the requests exceptions the client retries on."""
+        def handler(request):
+            if request.url.path.endswith("timeout"):
+                raise httpx.ReadTimeout("slow", request=request)
+            raise httpx.ConnectError("refused", request=request)
+
+        client = mock_client(handler, max_retries=0)
+        adapter = client._session.get_adapter(BASE)
+
+        with pytest.raises(requests.ReadTimeout):
+            adapter.send(requests.Request("GET", f"{BASE}/timeout").prepare())
+        with pytest.raises(StructurifyError, match="Connection error") as exc_info:
+            client.projects.list()
+        assert isinstance(exc_info.value.__context__, requests.ConnectionError)
+
+    def test_cancellation_resets_in_flight_request(self):
+        """Cancelling aborts a request waiting on its response."""
+        async def handler(request):
+            await asyncio.sleep(30)
+            return httpx.Response(200, json={})
+
+        client = mock_client(handler, timeout=60)
+        token = CancellationToken()
+        threading.Timer(0.2, token.cancel).start()
+
+        started = time.monotonic()
+        with client.cancellable(token):
+            with pytest.raises(OperationCancelledError):
+                client.projects.list()
+        assert time.monotonic() - started < 3
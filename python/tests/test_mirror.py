@@ -0,0 +1,167 @@
+"""Tests for the local results mirror."""
+
+import json
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.mirror import ResultsMirror
+
+BASE = "https://app.structurify.ai/api"
+JOBS_URL = f"{BASE}/extraction-jobs"
+PROJECT_URL = f"{BASE}/projects/proj_1"
+EXPORTS_URL = f"{BASE}/exports"
+
+
+def record(doc_id, vendor, total):
+    return {"documentId": doc_id, "name": f"{doc_id}.pdf", "Vendor": vendor, "Total": total}
+
+
+def add_jobs(completed_at, status="done", document_ids=None):
+    job = {"id": "job_1", "status": status, "completedAt": completed_at}
+    if document_ids is not None:
+        job["documentIds"] = document_ids
+    responses.add(responses.GET, JOBS_URL, json={"jobs": [job]})
+
+
+def add_documents(statuses):
+    responses.add(
+        responses.GET,
+        PROJECT_URL,
+        json={
+            "project": {"id": "proj_1"},
+            "documents": [
+                {"id": doc_id, "name": f"{doc_id}.pdf", "status": status}
+                for doc_id, status in statuses.items()
+            ],
+        },
+    )
+
+
+def add_export(records):
+    responses.add(responses.POST, EXPORTS_URL, json={"data": json.dumps(records)})
+
+
+def exported_ids(call):
+    return json.loads(call.request.body)["documentIds"]
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    client = Structurify(api_key="sk_test")
+    with ResultsMirror(client, str(tmp_path / "results.db")) as mirror:
+        yield mirror
+
+
+class TestResultsMirror:
+    """Test incremental syncing and local queries."""
+
+    @responses.activate
+    def test_first_sync_exports_finished_documents(self, mirror):
+        """Only documents that are done are exported."""
+        add_jobs("2026-01-01T10:00:00Z", status="processing")
+        add_documents({"doc_1": "done", "doc_2": "done", "doc_3": "processing"})
+        add_export([record("doc_1", "ACME", 10), record("doc_2", "Globex", 20)])
+
+        result = mirror.sync("proj_1")
+
+        assert (result.checked, result.fetched, result.pending) == (True, 2, 1)
+        assert sorted(exported_ids(responses.calls[2])) == ["doc_1", "doc_2"]
+        assert mirror.get("proj_1", "doc_1")["Vendor"] == "ACME"
+        assert mirror.count("proj_1") == 2
+
+    @responses.activate
+    def test_later_sync_exports_only_new_documents(self, mirror):
+        """Refresh cost follows what changed, not the project size."""
+        add_jobs("2026-01-01T10:00:00Z", status="processing")
+        add_documents({"doc_1": "done", "doc_2": "processing"})
+        add_export([record("doc_1", "ACME", 10)])
+        mirror.sync("proj_1")
+
+        responses.reset()
+        add_jobs("2026-01-01T11:00:00Z")
+        add_documents({"doc_1": "done", "doc_2": "done"})
+        add_export([record("doc_2", "Globex", 20)])
+        result = mirror.sync("proj_1")
+
+        assert result.fetched == 1
+        assert exported_ids(responses.calls[2]) == ["doc_2"]
+        assert mirror.count("proj_1") == 2
+
+    @responses.activate
+    def test_reextracted_documents_are_refreshed(self, mirror):
+        """A job finished since the last sync refreshes the documents it covered."""
+        add_jobs("2026-01-01T10:00:00Z")
+        add_documents({"doc_1": "done", "doc_2": "done"})
+        add_export([record("doc_1", "ACME", 10), record("doc_2", "Globex", 20)])
+        mirror.sync("proj_1")
+
+        responses.reset()
+        add_jobs("2099-01-01T00:00:00Z")
+        add_documents({"doc_1": "done", "doc_2": "done"})
+        add_export([record("doc_1", "ACME", 11), record("doc_2", "Globex", 21)])
+        result = mirror.sync("proj_1")
+
+        assert result.fetched == 2
+        assert mirror.get("proj_1", "doc_1")["Total"] == 11
+
+        responses.reset()
+        add_jobs("2099-01-02T00:00:00Z", document_ids=["doc_2"])
+        add_documents({"doc_1": "done", "doc_2": "done"})
+        add_export([record("doc_2", "Globex", 22)])
+        mirror.sync("proj_1")
+
+        assert exported_ids(responses.calls[2]) == ["doc_2"]
+        assert mirror.get("proj_1", "doc_2")["Total"] == 22
+
+    @responses.activate
+    def test_unchanged_watermark_skips_document_check(self, mirror):
+        """With no job finished since the last sync, only the job list is read."""
+        add_jobs("2026-01-01T10:00:00Z")
+        add_documents({"doc_1": "done"})
+        add_export([record("doc_1", "ACME", 10)])
+        mirror.sync("proj_1")
+
+        responses.reset()
+        add_jobs("2026-01-01T10:00:00Z")
+        result = mirror.sync("proj_1")
+
+        assert not result.checked
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_deleted_documents_are_removed(self, mirror):
+        """Documents deleted from the project leave the mirror."""
+        add_jobs("2026-01-01T10:00:00Z")
+        add_documents({"doc_1": "done", "doc_2": "done"})
+        add_export([record("doc_1", "ACME", 10), record("doc_2", "Globex", 20)])
+        mirror.sync("proj_1")
+
+        responses.reset()
+        add_jobs("2026-01-01T11:00:00Z")
+        add_documents({"doc_1": "done"})
+        result = mirror.sync("proj_1")
+
+        assert (result.fetched, result.removed) == (0, 1)
+        assert mirror.get("proj_1", "doc_2") is None
+        assert mirror.query("proj_1", where={"Vendor": "Globex"}) == []
+
+    @responses.activate
+    def test_query_by_column_values(self, mirror):
+        """Records are found by column values through the cells index."""
+        add_jobs("2026-01-01T10:00:00Z")
+        add_documents({"doc_1": "done", "doc_2": "done", "doc_3": "done"})
+        add_export([
+            record("doc_1", "ACME", 10),
+            record("doc_2", "ACME", 20),
+            record("doc_3", "Globex", 20),
+        ])
+        mirror.sync("proj_1")
+
+        assert [r["documentId"] for r in mirror.query("proj_1", where={"Vendor": "ACME"})] == [
+            "doc_1", "doc_2",
+        ]
+        assert [
+            r["documentId"] for r in mirror.query("proj_1", where={"Vendor": "ACME", "Total": 20})
+        ] == ["doc_2"]
+        assert len(mirror.query("proj_1", limit=1)) == 1
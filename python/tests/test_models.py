@@ -0,0 +1,127 @@
+"""Tests for typed response models."""
+
+import pickle
+
+import pytest
+import responses
+from structurify import Structurify, StructurifyPool
+from structurify.models import ColumnTemplate, Document, Job, Project, Template
+
+
+class TestModel:
+    """Test the dict-compatible model behaviour."""
+
+    def test_attribute_and_item_access(self):
+        """Fields are available as snake_case attributes and camelCase keys."""
+        doc = Document.from_dict({"id": "doc_1", "mimeType": "application/pdf", "size": 10})
+
+        assert doc.mime_type == "application/pdf"
+        assert doc["mimeType"] == "application/pdf"
+        assert doc.get("size") == 10
+        assert doc.status is None
+        assert doc.get("status", "pending") == "pending"
+        assert "status" not in doc
+        with pytest.raises(KeyError):
+            doc["status"]
+
+    def test_equal_to_dict(self):
+        """A model compares equal to the dict it was built from, extra keys included."""
+        data = {"id": "job_1", "status": "done", "completedAt": None, "cost": 3}
+        job = Job.from_dict(data)
+
+        assert job == data
+        assert dict(job) == data
+        assert job.to_dict() == data
+        assert job["cost"] == 3
+        assert len(job) == 4
+
+    def test_read_only(self):
+        """Models cannot be modified."""
+        job = Job.from_dict({"id": "job_1"})
+        with pytest.raises(AttributeError):
+            job.status = "done"
+        with pytest.raises(TypeError):
+            job["status"] = "done"
+
+    def test_nested_decoded_lazily(self):
+        """Template columns become ColumnTemplate models on first access."""
+        template = Template.from_dict({"id": "tpl_1", "columns": [{"id": "c1", "label": "Total"}]})
+
+        assert isinstance(object.__getattribute__(template, "_columns")[0], dict)
+        column = template.columns[0]
+        assert isinstance(column, ColumnTemplate)
+        assert column.label == "Total"
+        assert template["columns"][0] is column
+        assert template.to_dict() == {"id": "tpl_1", "columns": [{"id": "c1", "label": "Total"}]}
+
+    def test_slots(self):
+        """Models carry no per-instance __dict__."""
+        doc = Document.from_dict({"id": "doc_1"})
+        assert not hasattr(doc, "__dict__")
+
+    def test_pickle(self):
+        """Models survive pickling."""
+        project = Project.from_dict({"id": "proj_1", "documentCount": 2, "owner": "x"})
+        assert pickle.loads(pickle.dumps(project)) == project
+
+
+class TestTypedClient:
+    """Test resources returning models."""
+
+    @responses.activate
+    def test_resources_return_models(self):
+        """typed_models=True wraps single objects and lists."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/documents/doc_1",
+            json={"document": {"id": "doc_1", "status": "done"}},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/projects/proj_1",
+            json={
+                "project": {"id": "proj_1", "documentCount": 1},
+                "columns": [{"id": "col_1"}],
+                "documents": [{"id": "doc_1"}],
+            },
+            status=200,
+        )
+
+        client = Structurify(api_key="sk_test", typed_models=True)
+        doc = client.documents.get("doc_1")
+        assert isinstance(doc, Document)
+        assert doc.status == "done"
+
+        project = client.projects.get("proj_1")
+        assert isinstance(project["project"], Project)
+        assert project["project"].document_count == 1
+        assert isinstance(project["documents"][0], Document)
+        assert project["columns"] == [{"id": "col_1"}]
+
+    @responses.activate
+    def test_dicts_by_default(self):
+        """Without typed_models, plain dicts are returned."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/extraction-jobs/job_1",
+            json={"job": {"id": "job_1"}},
+            status=200,
+        )
+        client = Structurify(api_key="sk_test")
+        assert type(client.extraction.get("job_1")) is dict
+
+    @responses.activate
+    def test_pool_pins_models(self):
+        """The pool pins objects created as models."""
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/projects",
+            json={"project": {"id": "proj_new"}},
+            status=201,
+        )
+        pool = StructurifyPool([Structurify(api_key="sk_test", typed_models=True)])
+        project = pool.projects.create(name="Q1", template_id="tpl_invoice")
+
+        assert isinstance(project, Project)
+        assert "proj_new" in pool._pinned
@@ -0,0 +1,127 @@
+"""Tests for the multi-key client pool."""
+
+import pytest
+import responses
+from structurify import Structurify, InsufficientCreditsError
+from structurify.pool import StructurifyPool
+
+URL_A = "https://a.example.com/api"
+URL_B = "https://b.example.com/api"
+
+
+def make_pool(strategy="least_loaded"):
+    return StructurifyPool.from_keys(
+        ["sk_test_a", "sk_test_b"], base_urls=[URL_A, URL_B], strategy=strategy, max_retries=0
+    )
+
+
+class TestStructurifyPool:
+    """Test routing and failover."""
+
+    def test_requires_clients(self):
+        """An empty pool is rejected."""
+        with pytest.raises(ValueError):
+            StructurifyPool([])
+
+    def test_unknown_strategy(self):
+        """Unknown strategies are rejected."""
+        with pytest.raises(ValueError, match="Unknown strategy"):
+            StructurifyPool([Structurify(api_key="sk_test_a")], strategy="random")
+
+    @responses.activate
+    def test_failover_on_402(self):
+        """A member out of credits is skipped and the call retried elsewhere."""
+        responses.add(responses.POST, f"{URL_A}/extraction-jobs",
+                      json={"error": "INSUFFICIENT_CREDITS", "message": "No credits"}, status=402)
+        responses.add(responses.POST, f"{URL_B}/extraction-jobs",
+                      json={"job": {"id": "job_1"}}, status=201)
+
+        pool = make_pool()
+        job = pool.extraction.run(project_id="proj_shared")
+
+        assert job["id"] == "job_1"
+        stats = pool.stats()
+        assert stats[0]["available"] is False
+        assert stats[0]["unavailable_reason"] == "credits"
+
+    @responses.activate
+    def test_failover_on_429_uses_retry_after(self):
+        """A rate-limited member is skipped for Retry-After seconds."""
+        responses.add(responses.GET, f"{URL_A}/project-templates",
+                      json={"error": "RATE_LIMIT"}, status=429, headers={"Retry-After": "5"})
+        responses.add(responses.GET, f"{URL_B}/project-templates",
+                      json={"templates": [{"id": "tpl_invoice"}]}, status=200)
+
+        pool = make_pool()
+        assert pool.templates.list()[0]["id"] == "tpl_invoice"
+        assert pool.stats()[0]["unavailable_reason"] == "rate_limit"
+
+    @responses.activate
+    def test_all_members_exhausted_raises(self):
+        """The last error is raised when every member fails."""
+        for url in (URL_A, URL_B):
+            responses.add(responses.POST, f"{url}/extraction-jobs",
+                          json={"error": "INSUFFICIENT_CREDITS"}, status=402)
+
+        with pytest.raises(InsufficientCreditsError):
+            make_pool().extraction.run(project_id="proj_1")
+
+    @responses.activate
+    def test_created_objects_stay_with_their_member(self):
+        """Calls about an object go to the member that created it."""
+        responses.add(responses.POST, f"{URL_A}/projects",
+                      json={"project": {"id": "proj_a"}}, status=201)
+        responses.add(responses.GET, f"{URL_A}/projects/proj_a",
+                      json={"project": {"id": "proj_a"}}, status=200)
+
+        pool = make_pool(strategy="sticky")
+        project = pool.projects.create(name="Q1", template_id="tpl_invoice")
+        pool.projects.get(project["id"])
+        pool.projects.get(project["id"])
+
+        assert all(c.request.url.startswith(URL_A) for c in responses.calls)
+
+    @responses.activate
+    def test_quota_aware_prefers_remaining_quota(self):
+        """quota_aware routes to the member with the most quota left."""
+        responses.add(responses.GET, f"{URL_A}/projects", json={"projects": []},
+                      headers={"X-RateLimit-Remaining": "1"}, status=200)
+        responses.add(responses.GET, f"{URL_B}/projects", json={"projects": []},
+                      headers={"X-RateLimit-Remaining": "50"}, status=200)
+
+        pool = make_pool(strategy="quota_aware")
+        pool.clients[0].projects.list()
+        pool.clients[1].projects.list()
+        pool.projects.list()
+
+        assert responses.calls[-1].request.url.startswith(URL_B)
+        assert pool.stats()[1]["rate_limit_remaining"] == 50
+
+    @responses.activate
+    def test_429_fails_over_without_member_retries(self):
+        """Members built by from_keys don't retry a 429 before the pool moves the call."""
+        responses.add(responses.GET, f"{URL_A}/project-templates",
+                      json={"error": "RATE_LIMIT"}, status=429, headers={"Retry-After": "30"})
+        responses.add(responses.GET, f"{URL_B}/project-templates",
+                      json={"templates": []}, status=200)
+
+        pool = StructurifyPool.from_keys(["sk_test_a", "sk_test_b"], base_urls=[URL_A, URL_B])
+        pool.templates.list()
+
+        assert [c.request.url.startswith(URL_A) for c in responses.calls] == [True, False]
+
+    @responses.activate
+    def test_members_out_of_credits_are_skipped(self):
+        """A member that reports no credits left gets no new work; quota_aware prefers credits."""
+        for url, credits in ((URL_A, "0"), (URL_B, "40")):
+            responses.add(responses.GET, f"{url}/projects", json={"projects": []},
+                          headers={"X-Credits-Remaining": credits}, status=200)
+
+        pool = make_pool(strategy="quota_aware")
+        pool.projects.list()
+        pool.projects.list()
+        pool.projects.list()
+
+        assert [c.request.url.startswith(URL_B) for c in responses.calls] == [False, True, True]
+        assert pool.stats()[0]["unavailable_reason"] == "credits"
+        assert pool.stats()[1]["credits_remaining"] == 40
@@ -0,0 +1,118 @@
+"""Tests for upload preflight validation."""
+
+import pytest
+import responses
+from structurify import Structurify, PreflightError
+from structurify.preflight import Preflight, sniff_mime_type
+
+PDF = b"%PDF-1.7\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF\n"
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+class TestSniffMimeType:
+    """Test magic-byte detection."""
+
+    def test_known_signatures(self):
+        """Common formats are recognized from their leading bytes."""
+        assert sniff_mime_type(PDF) == "application/pdf"
+        assert sniff_mime_type(PNG) == "image/png"
+        assert sniff_mime_type(b"\xff\xd8\xff\xe0") == "image/jpeg"
+        assert sniff_mime_type(b"II*\x00") == "image/tiff"
+        assert sniff_mime_type(b"RIFF\x00\x00\x00\x00WEBP") == "image/webp"
+
+    def test_unknown_signature(self):
+        """Unrecognized content returns None."""
+        assert sniff_mime_type(b"hello world") is None
+
+
+class TestPreflight:
+    """Test preflight checks."""
+
+    def test_valid_pdf_passes(self):
+        """A well-formed PDF passes."""
+        result = Preflight().check_bytes(PDF, "a.pdf")
+        assert result.ok
+        assert result.mime_type == "application/pdf"
+
+    def test_empty_file_rejected(self):
+        """Empty files are rejected."""
+        assert Preflight().check_bytes(b"", "a.pdf").reason == "empty"
+
+    def test_size_limit(self):
+        """Files over max_size are rejected."""
+        assert Preflight(max_size=10).check_bytes(PDF, "a.pdf").reason == "too_large"
+
+    def test_mislabeled_file_corrected(self):
+        """A PNG named .pdf is uploaded as image/png."""
+        result = Preflight().check_bytes(PNG, "scan.pdf")
+        assert result.ok
+        assert result.mime_type == "image/png"
+        assert result.declared_mime_type == "application/pdf"
+
+    def test_mislabeled_file_rejected_when_strict(self):
+        """Strict mode rejects type mismatches."""
+        assert Preflight(strict=True).check_bytes(PNG, "scan.pdf").reason == "mime_mismatch"
+
+    def test_garbage_rejected(self):
+        """Content matching no supported format is rejected."""
+        assert Preflight().check_bytes(b"<html>", "a.pdf").reason == "mime_mismatch"
+
+    def test_unsupported_type(self):
+        """Types outside allowed_types are rejected."""
+        result = Preflight(allowed_types=["application/pdf"]).check_bytes(PNG, "a.png")
+        assert result.reason == "unsupported_type"
+
+    def test_truncated_pdf(self):
+        """A PDF without %%EOF is reported as corrupt."""
+        assert Preflight().check_bytes(PDF[:30], "a.pdf").reason == "corrupt_pdf"
+
+    def test_encrypted_pdf(self):
+        """A PDF with an /Encrypt trailer entry is rejected."""
+        encrypted = PDF.replace(b"trailer\n<<>>", b"trailer\n<</Encrypt 5 0 R>>")
+        assert Preflight().check_bytes(encrypted, "a.pdf").reason == "encrypted_pdf"
+
+    def test_check_path(self, tmp_path):
+        """Files on disk are checked without reading them in full."""
+        path = tmp_path / "a.pdf"
+        path.write_bytes(PDF)
+        assert Preflight().check_path(str(path)).ok
+        assert Preflight().check_path(str(tmp_path / "missing.pdf")).reason == "unreadable"
+
+
+class TestUploadPreflight:
+    """Test preflight integration with uploads."""
+
+    @responses.activate
+    def test_rejected_upload_sends_nothing(self):
+        """A rejected file raises PreflightError without a request."""
+        client = Structurify(api_key="sk_test_123")
+
+        with pytest.raises(PreflightError) as exc_info:
+            client.documents.upload("proj_123", file_bytes=b"<html>", name="a.pdf",
+                                    preflight=Preflight())
+
+        assert exc_info.value.reason == "mime_mismatch"
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_upload_many_reports_rejections(self, tmp_path):
+        """Bulk uploads skip rejected files and upload the rest."""
+        good = tmp_path / "good.pdf"
+        good.write_bytes(PDF)
+        bad = tmp_path / "bad.pdf"
+        bad.write_bytes(PDF[:30])
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/documents",
+            json={"document": {"id": "doc_1"}},
+            status=201
+        )
+
+        client = Structurify(api_key="sk_test_123")
+        results = client.documents.upload_many(
+            "proj_123", [str(good), str(bad)], preflight=Preflight()
+        )
+
+        assert [r.ok for r in results] == [True, False]
+        assert isinstance(results[1].error, PreflightError)
+        assert len(responses.calls) == 1
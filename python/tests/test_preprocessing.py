@@ -0,0 +1,157 @@
+"""Tests for client-side document preprocessing."""
+
+import base64
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.preprocessing import (
+    CompressPdf,
+    DownsampleImage,
+    PreparedFile,
+    Preprocessor,
+    apply_transforms,
+)
+
+
+def truncate(file):
+    """Test transform that halves the content."""
+    return PreparedFile(file.name, file.content[: len(file.content) // 2], file.mime_type,
+                        original_size=file.original_size, applied=file.applied + ["truncate"])
+
+
+def grow(file):
+    """Test transform that makes the content larger."""
+    return PreparedFile(file.name, file.content * 2, file.mime_type,
+                        original_size=file.original_size)
+
+
+def explode(file):
+    """Test transform that always fails."""
+    raise RuntimeError("bad input")
+
+
+class TestApplyTransforms:
+    """Test the transform pipeline."""
+
+    def test_smaller_output_kept(self):
+        """A transform that shrinks the file is applied."""
+        result = apply_transforms(PreparedFile("a.pdf", b"x" * 100, "application/pdf"), [truncate])
+        assert result.size == 50
+        assert result.bytes_saved == 50
+        assert result.applied == ["truncate"]
+
+    def test_larger_output_discarded(self):
+        """A transform that grows the file is ignored."""
+        result = apply_transforms(PreparedFile("a.pdf", b"x" * 100, "application/pdf"), [grow])
+        assert result.size == 100
+
+    def test_failing_transform_skipped(self):
+        """A transform error leaves the file unchanged."""
+        result = apply_transforms(
+            PreparedFile("a.pdf", b"x" * 100, "application/pdf"), [explode, truncate]
+        )
+        assert result.size == 50
+
+
+class TestPreprocessor:
+    """Test the pluggable preprocessing stage."""
+
+    def test_submit_records_report(self, tmp_path):
+        """Files submitted to the pool are reported with bytes saved."""
+        path = tmp_path / "scan.pdf"
+        path.write_bytes(b"x" * 64)
+
+        with Preprocessor([truncate], executor=ThreadPoolExecutor(2)) as preprocessor:
+            prepared = preprocessor.submit(str(path)).result()
+
+        assert prepared.size == 32
+        assert [r.bytes_saved for r in preprocessor.reports] == [32]
+
+    def test_process_pool(self, tmp_path):
+        """Transforms run in the default process pool."""
+        path = tmp_path / "scan.pdf"
+        path.write_bytes(b"x" * 64)
+
+        with Preprocessor([truncate], max_workers=1) as preprocessor:
+            assert preprocessor.submit(str(path)).result().size == 32
+
+    @responses.activate
+    def test_upload_with_preprocessor(self):
+        """upload sends the preprocessed content."""
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/documents",
+            json={"document": {"id": "doc_1"}},
+            status=201
+        )
+
+        client = Structurify(api_key="sk_test_123")
+        client.documents.upload(
+            "proj_123", file_bytes=b"x" * 10, name="a.pdf",
+            preprocessor=Preprocessor([truncate]),
+        )
+
+        body = json.loads(responses.calls[0].request.body)
+        assert base64.b64decode(body["content"]) == b"x" * 5
+
+    @responses.activate
+    def test_upload_many_with_preprocessor(self, tmp_path):
+        """upload_many uploads preprocessed content, keyed by path."""
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/documents",
+            json={"document": {"id": "doc_1"}},
+            status=201
+        )
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"scan{i}.pdf"
+            path.write_bytes(b"x" * 64)
+            paths.append(str(path))
+
+        client = Structurify(api_key="sk_test_123")
+        with Preprocessor([truncate], executor=ThreadPoolExecutor(2)) as preprocessor:
+            results = client.documents.upload_many(
+                "proj_123", paths, concurrency=2, preprocessor=preprocessor
+            )
+
+        assert [r.key for r in results] == paths
+        assert all(r.ok for r in results)
+        sizes = {len(base64.b64decode(json.loads(c.request.body)["content"]))
+                 for c in responses.calls}
+        assert sizes == {32}
+
+
+class TestBuiltinTransforms:
+    """Test the built-in image and PDF transforms."""
+
+    def test_downsample_high_dpi_scan(self):
+        """A 600 dpi bilevel TIFF is reduced and re-encoded as PNG."""
+        pil_image = pytest.importorskip("PIL.Image")
+        buf = io.BytesIO()
+        pil_image.new("1", (1200, 1200), 1).save(buf, format="TIFF", dpi=(600, 600))
+        file = PreparedFile("scan.tiff", buf.getvalue(), "image/tiff")
+
+        result = DownsampleImage(max_dpi=200)(file)
+
+        assert result.name == "scan.png"
+        assert result.mime_type == "image/png"
+        assert pil_image.open(io.BytesIO(result.content)).size == (400, 400)
+
+    def test_compress_pdf_keeps_valid_pdf(self):
+        """Compressed PDFs still parse."""
+        pypdf = pytest.importorskip("pypdf")
+        writer = pypdf.PdfWriter()
+        writer.add_blank_page(200, 200)
+        writer.add_metadata({"/Title": "Scan"})
+        buf = io.BytesIO()
+        writer.write(buf)
+
+        result = CompressPdf()(PreparedFile("a.pdf", buf.getvalue(), "application/pdf"))
+
+        assert len(pypdf.PdfReader(io.BytesIO(result.content)).pages) == 1
+        assert result.applied == ["compress_pdf"]
@@ -0,0 +1,125 @@
+"""Tests for fork safety, client config and process pool helpers."""
+
+import os
+import pickle
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.cache import DocumentCache
+from structurify.circuit import CircuitBreakers
+from structurify.config import ClientConfig
+from structurify.hedging import HedgePolicy
+from structurify.processes import process_map, worker_client
+from structurify.ratelimit import RateLimiter
+from structurify.scheduler import RequestScheduler
+
+
+def _describe(client, item):
+    """Worker function: report what the worker's client looks like."""
+    if item == "boom":
+        raise ValueError("bad item")
+    return (os.getpid(), client._base_url, client._rate_limiter.rate, item)
+
+
+class TestClientConfig:
+    """Test picklable client settings."""
+
+    def test_round_trip(self):
+        """A client rebuilt from its config has the same settings."""
+        client = Structurify(
+            api_key="sk_test", base_url="https://eu.example.com/api", rate_limit=4, max_retries=1
+        )
+        config = pickle.loads(pickle.dumps(client.config))
+
+        clone = Structurify.from_config(config)
+        assert clone._api_key == "sk_test"
+        assert clone._base_url == "https://eu.example.com/api"
+        assert clone._rate_limiter.rate == 4
+        assert clone._max_retries == 1
+
+    def test_repr_hides_key(self):
+        """The API key is masked in the repr."""
+        assert "sk_test" not in repr(ClientConfig(api_key="sk_test"))
+
+
+class TestForkSafety:
+    """Test transport rebuild after fork."""
+
+    @responses.activate
+    def test_session_rebuilt_in_child(self, monkeypatch):
+        """A pid change replaces the session before the next request."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/projects",
+            json={"projects": []},
+            status=200,
+        )
+        client = Structurify(api_key="sk_test", coalesce_reads=True)
+        parent_session = client._session
+        parent_flight = client._singleflight
+
+        monkeypatch.setattr(os, "getpid", lambda: client._pid + 1)
+        client.projects.list()
+
+        assert client._session is not parent_session
+        assert client._singleflight is not parent_flight
+        assert client._session.headers["Authorization"] == "Bearer sk_test"
+
+    def test_shared_locks_replaced_once_in_child(self, monkeypatch, tmp_path):
+        """Shared objects replace their locks after a fork, once however many clients use them."""
+        breakers = CircuitBreakers()
+        breaker = breakers.for_path("/projects")
+        shared = {
+            "rate_limit": RateLimiter(5),
+            "scheduler": RequestScheduler(),
+            "circuit_breakers": breakers,
+            "document_cache": DocumentCache(str(tmp_path)),
+            "hedging": HedgePolicy(),
+        }
+        first = Structurify(api_key="sk_test", **shared)
+        second = Structurify(api_key="sk_test", **shared)
+
+        def locks():
+            return [first._rate_limiter._lock, first.scheduler._cond, breakers._lock,
+                    breaker._lock, first.document_cache._thread_lock, first.hedging._lock]
+
+        before = locks()
+        parent_pid = os.getpid()
+        monkeypatch.setattr(os, "getpid", lambda: parent_pid + 1)
+        first._check_fork()
+        after = locks()
+        second._check_fork()
+
+        assert all(a is not b for a, b in zip(after, before))
+        assert all(a is b for a, b in zip(locks(), after))
+
+    def test_same_process_keeps_session(self):
+        """No rebuild without a fork."""
+        client = Structurify(api_key="sk_test")
+        session = client._session
+        client._check_fork()
+        assert client._session is session
+
+
+class TestProcessMap:
+    """Test running work on a process pool."""
+
+    def test_one_client_per_process(self):
+        """Each item runs in a worker with a client built from the config."""
+        client = Structurify(api_key="sk_test", rate_limit=10)
+        results = process_map(_describe, ["a", "b", "boom"], client.config, processes=2)
+
+        assert [r.key for r in results] == ["a", "b", "boom"]
+        assert results[0].ok and results[1].ok
+        assert isinstance(results[2].error, ValueError)
+        pid, base_url, rate, item = results[0].value
+        assert pid != os.getpid()
+        assert base_url == "https://app.structurify.ai/api"
+        assert rate == 5
+        assert item == "a"
+
+    def test_worker_client_outside_pool(self):
+        """worker_client() is only available in workers."""
+        with pytest.raises(RuntimeError):
+            worker_client()
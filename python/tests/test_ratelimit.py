@@ -0,0 +1,133 @@
+"""Tests for client-side rate limiting."""
+
+import multiprocessing
+import pickle
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.exceptions import RateLimitError
+from structurify.processes import process_map
+from structurify.ratelimit import HostRateLimiter, RateLimiter
+
+BASE = "https://app.structurify.ai/api"
+
+
+def drain(limiter):
+    """Take every available token; returns how many were taken."""
+    taken = 0
+    while limiter.try_acquire() == 0:
+        taken += 1
+    return taken
+
+
+def _drain_in_child(limiter):
+    drain(limiter)
+
+
+def _limiter_path(client, item):
+    return client._rate_limiter.path, client._rate_limiter.rate
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable wall clock for the limiter."""
+    now = [1_000_000.0]
+    monkeypatch.setattr("structurify.ratelimit.time.time", lambda: now[0])
+    return now
+
+
+class TestRateLimiter:
+    """Test the client-side token bucket."""
+
+    def test_burst_then_wait(self):
+        """Tokens run out after the burst."""
+        limiter = RateLimiter(rate=1.0, burst=2)
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() > 0
+
+    def test_invalid_rate(self):
+        """Rate must be positive."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+    def test_client_accepts_rate(self):
+        """A numeric rate_limit builds a limiter."""
+        client = Structurify(api_key="sk_test_123", rate_limit=5)
+        assert client._rate_limiter.rate == 5.0
+
+
+class TestHostRateLimiter:
+    """Test the shared bucket and what it learns from 429s."""
+
+    def test_limiters_with_same_key_share_a_bucket(self, tmp_path, clock):
+        """Tokens taken through one limiter are gone for the other; other keys are separate."""
+        a = HostRateLimiter(rate=10, burst=5, key="acct", directory=str(tmp_path))
+        b = HostRateLimiter(rate=10, burst=5, key="acct", directory=str(tmp_path))
+        other = HostRateLimiter(rate=10, burst=5, key="other", directory=str(tmp_path))
+
+        assert drain(a) == 5
+        assert b.try_acquire() == pytest.approx(0.1)
+        assert drain(other) == 5
+
+        clock[0] += 0.25
+        assert drain(b) == 2
+
+    @pytest.mark.parametrize("start_method", ["spawn", "fork"])
+    def test_shared_across_processes(self, tmp_path, start_method):
+        """A token taken in a child process is not available to the parent."""
+        if start_method not in multiprocessing.get_all_start_methods():
+            pytest.skip(f"{start_method} is not available")
+        limiter = HostRateLimiter(rate=0.01, burst=3, directory=str(tmp_path))
+        child = multiprocessing.get_context(start_method).Process(
+            target=_drain_in_child, args=(limiter,)
+        )
+        child.start()
+        child.join(30)
+
+        assert child.exitcode == 0
+        assert limiter.try_acquire() > 0
+
+    def test_429_pauses_and_cuts_rate(self, tmp_path, clock):
+        """Retry-After pauses everyone; a burst of 429s cuts the rate once; it recovers."""
+        limiter = HostRateLimiter(rate=10, burst=10, directory=str(tmp_path), recovery=0.1)
+
+        limiter.record_rate_limited(retry_after=2)
+        limiter.record_rate_limited(retry_after=2)
+
+        metrics = limiter.metrics()
+        assert metrics["paused_for"] == pytest.approx(2)
+        assert metrics["current_rate"] == pytest.approx(7)
+        assert limiter.try_acquire() == pytest.approx(2)
+
+        clock[0] += 2.5
+        assert drain(limiter) == 3  # 0.5s at the recovering, cut rate
+        clock[0] += 10
+        assert limiter.metrics()["current_rate"] == pytest.approx(10)
+
+    @responses.activate
+    def test_client_reports_429s(self, tmp_path):
+        """The client tells its limiter about 429s, even when it doesn't retry."""
+        responses.add(
+            responses.GET, f"{BASE}/projects", status=429, headers={"Retry-After": "30"},
+            json={"error": "slow down"},
+        )
+        limiter = HostRateLimiter(rate=100, directory=str(tmp_path))
+        client = Structurify(api_key="sk_test", rate_limit=limiter, max_retries=0)
+
+        with pytest.raises(RateLimitError):
+            client.projects.list()
+
+        assert limiter.metrics()["paused_for"] > 29
+
+    def test_config_keeps_the_shared_limiter(self, tmp_path):
+        """Configs and worker processes attach to the same bucket at the full rate."""
+        limiter = HostRateLimiter(rate=20, key="acct", directory=str(tmp_path))
+        client = Structurify(api_key="sk_test", rate_limit=limiter)
+
+        restored = pickle.loads(pickle.dumps(client.config)).rate_limit
+        assert (restored.path, restored.rate) == (limiter.path, 20)
+
+        results = process_map(_limiter_path, [1, 2], client.config, processes=2)
+        assert [r.value for r in results] == [(limiter.path, 20)] * 2
@@ -1,8 +1,11 @@
 """Tests for resource handlers."""
 
+import json
+
 import pytest
 import responses
 from structurify import Structurify
+from structurify.resources.exports import iter_records_stream
 
 
 class TestTemplatesResource:
@@ -186,3 +189,30 @@ class TestExportsResource:
 
         assert result["export"]["id"] == "exp_123"
         assert result["export"]["format"] == "csv"
+
+    @pytest.mark.parametrize("payload", [
+        [{"id": 1}, {"id": 2.5}, {"id": "x,]"}],
+        {"format": "json", "data": [{"id": 1}, {"id": 2.5}, {"id": "x,]"}]},
+        {"data": {"count": 3, "rows": [{"id": 1}, {"id": 2.5}, {"id": "x,]"}]}},
+        {"data": json.dumps([{"id": 1}, {"id": 2.5}, {"id": "x,]"}])},
+    ])
+    def test_iter_records_stream(self, payload):
+        """Records are parsed incrementally, whatever the chunk boundaries."""
+        raw = json.dumps(payload).encode("utf-8")
+        chunks = [raw[i:i + 3] for i in range(0, len(raw), 3)]
+
+        assert list(iter_records_stream(chunks)) == [{"id": 1}, {"id": 2.5}, {"id": "x,]"}]
+
+    @responses.activate
+    def test_stream_records(self):
+        """stream_records downloads and yields the records of a JSON export."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/exports/exp_123/download",
+            json={"data": [{"documentId": "doc_1"}, {"documentId": "doc_2"}]},
+        )
+
+        client = Structurify(api_key="sk_test_123")
+        records = client.exports.stream_records("exp_123", chunk_size=7)
+
+        assert [r["documentId"] for r in records] == ["doc_1", "doc_2"]
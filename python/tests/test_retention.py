@@ -0,0 +1,140 @@
+"""Tests for bulk deletion and retention sweeps."""
+
+import re
+from datetime import timedelta
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.exceptions import NotFoundError
+from structurify.retention import sweep
+
+BASE = "https://app.structurify.ai/api"
+OLD = "2020-01-01T00:00:00Z"
+NEW = "2999-01-01T00:00:00Z"
+
+
+@pytest.fixture
+def client():
+    return Structurify(api_key="sk_test")
+
+
+def deleted(kind):
+    return sorted(
+        call.request.url.rsplit("/", 1)[1]
+        for call in responses.calls
+        if call.request.method == "DELETE" and f"/{kind}/" in call.request.url
+    )
+
+
+class TestDeleteMany:
+    """Test concurrent bulk deletion."""
+
+    @responses.activate
+    def test_continues_past_failures(self, client):
+        """A failed deletion is reported without stopping the rest."""
+        responses.add(responses.DELETE, f"{BASE}/documents/doc_2", json={"error": "x"}, status=404)
+        responses.add(
+            responses.DELETE, re.compile(rf"{BASE}/documents/doc_\d"), json={"success": True}
+        )
+
+        results = client.documents.delete_many(["doc_1", "doc_2", "doc_3"])
+
+        assert [r.key for r in results] == ["doc_1", "doc_2", "doc_3"]
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, NotFoundError)
+
+    @responses.activate
+    def test_exports_and_projects(self, client):
+        """Exports and projects have the same bulk variant."""
+        responses.add(responses.DELETE, re.compile(rf"{BASE}/(exports|projects)/\w+"), json={})
+
+        assert all(r.ok for r in client.exports.delete_many(["exp_1", "exp_2"]))
+        assert all(r.ok for r in client.projects.delete_many(["proj_1"]))
+        assert (deleted("exports"), deleted("projects")) == (["exp_1", "exp_2"], ["proj_1"])
+
+
+class TestSweep:
+    """Test retention sweeps."""
+
+    def add_project(self, project_id, exports, documents=()):
+        responses.add(
+            responses.GET,
+            f"{BASE}/exports?projectId={project_id}",
+            json={"exports": [{"id": i, "createdAt": c} for i, c in exports]},
+        )
+        responses.add(
+            responses.GET,
+            f"{BASE}/projects/{project_id}",
+            json={
+                "project": {"id": project_id},
+                "documents": [{"id": i, "createdAt": c} for i, c in documents],
+            },
+        )
+
+    @responses.activate
+    def test_sweeps_every_listed_project(self, client):
+        """Without project IDs, every project is swept; only old items are deleted."""
+        responses.add(
+            responses.GET,
+            f"{BASE}/projects",
+            json={"projects": [{"id": "proj_1", "createdAt": NEW}, {"id": "proj_2"}]},
+        )
+        self.add_project("proj_1", [("exp_1", OLD), ("exp_2", NEW)], [("doc_1", OLD)])
+        self.add_project("proj_2", [("exp_3", OLD), ("exp_4", None)])
+        responses.add(responses.DELETE, re.compile(rf"{BASE}/(exports|documents)/\w+"), json={})
+
+        report = sweep(client, timedelta(days=30), documents=True)
+
+        assert report.ok
+        assert report.deleted == 3
+        assert (deleted("exports"), deleted("documents")) == (["exp_1", "exp_3"], ["doc_1"])
+
+    @responses.activate
+    def test_old_projects_deleted_whole(self, client):
+        """A deleted project's contents are not listed or deleted separately."""
+        responses.add(
+            responses.GET,
+            f"{BASE}/projects",
+            json={"projects": [
+                {"id": "proj_old", "createdAt": OLD},
+                {"id": "proj_new", "createdAt": NEW},
+            ]},
+        )
+        self.add_project("proj_new", [("exp_1", OLD)])
+        responses.add(responses.DELETE, re.compile(rf"{BASE}/(exports|projects)/\w+"), json={})
+
+        report = sweep(client, timedelta(days=30), projects=True)
+
+        assert [r.key for r in report.projects] == ["proj_old"]
+        assert (deleted("projects"), deleted("exports")) == (["proj_old"], ["exp_1"])
+
+    @responses.activate
+    def test_dry_run_and_filter(self, client):
+        """A dry run selects without deleting; where narrows the selection."""
+        self.add_project("proj_1", [("exp_1", OLD), ("exp_2", OLD)])
+
+        report = sweep(
+            client,
+            timedelta(days=30),
+            project_ids=["proj_1"],
+            where=lambda item: item["id"] != "exp_2",
+            dry_run=True,
+        )
+
+        assert [r.key for r in report.exports] == ["exp_1"]
+        assert deleted("exports") == []
+
+    @responses.activate
+    def test_listing_failure_is_reported(self, client):
+        """A project that cannot be listed is reported while others are swept."""
+        responses.add(
+            responses.GET, f"{BASE}/exports?projectId=proj_x", json={"error": "x"}, status=404
+        )
+        self.add_project("proj_1", [("exp_1", OLD)])
+        responses.add(responses.DELETE, f"{BASE}/exports/exp_1", json={})
+
+        report = sweep(client, timedelta(days=30), project_ids=["proj_x", "proj_1"])
+
+        assert [r.key for r in report.failed] == ["proj_x"]
+        assert deleted("exports") == ["exp_1"]
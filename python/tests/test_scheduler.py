@@ -0,0 +1,148 @@
+"""Tests for priority request scheduling."""
+
+import threading
+import time
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.bulk import run_bulk
+from structurify.ratelimit import RateLimiter
+from structurify.scheduler import RequestScheduler, current_priority, priority
+
+
+def _queue_behind(scheduler, lanes, rate_limiter=None):
+    """Start one waiting thread per lane and return the order they are admitted in."""
+    order = []
+    threads = []
+    for lane in lanes:
+        def work(lane=lane):
+            with scheduler.slot(lane, rate_limiter=rate_limiter):
+                order.append(lane)
+        thread = threading.Thread(target=work)
+        thread.start()
+        threads.append(thread)
+        # Let each thread join the queue before the next one
+        while sum(scheduler.stats()["queued"].values()) < len(threads):
+            time.sleep(0.001)
+    return order, threads
+
+
+class TestRequestScheduler:
+    """Test lane ordering and fairness."""
+
+    def test_interactive_overtakes_queued_bulk(self):
+        """An interactive request is admitted ahead of bulk requests already waiting."""
+        scheduler = RequestScheduler(max_concurrency=1)
+        held = scheduler.acquire("bulk")
+
+        order, threads = _queue_behind(scheduler, ["bulk", "bulk", "bulk", "interactive"])
+        scheduler.release(held)
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert order[0] == "interactive"
+        assert order[1:] == ["bulk", "bulk", "bulk"]
+
+    def test_weighted_share(self):
+        """Contended slots are shared in proportion to lane weights."""
+        scheduler = RequestScheduler(
+            max_concurrency=1, weights={"fast": 3, "slow": 1}, default_lane="slow"
+        )
+        held = scheduler.acquire("slow")
+
+        order, threads = _queue_behind(scheduler, ["slow"] * 4 + ["fast"] * 6)
+        scheduler.release(held)
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # While both lanes are queued, "fast" gets three slots for each "slow" one
+        assert order[:8].count("fast") == 6
+        assert order[:8].count("slow") == 2
+
+    def test_idle_capacity_goes_to_bulk(self):
+        """Bulk work is not held back when no other lane is waiting."""
+        scheduler = RequestScheduler(max_concurrency=3)
+        lanes = [scheduler.acquire("bulk") for _ in range(3)]
+        assert scheduler.stats()["active"]["bulk"] == 3
+        for lane in lanes:
+            scheduler.release(lane)
+        assert scheduler.stats()["in_flight"] == 0
+
+    def test_rate_tokens_follow_queue_order(self):
+        """The head of the queue takes the next rate-limit token."""
+        scheduler = RequestScheduler(max_concurrency=1)
+        limiter = RateLimiter(rate=50, burst=1)
+        limiter.try_acquire()
+        held = scheduler.acquire("bulk")
+
+        order, threads = _queue_behind(scheduler, ["bulk", "interactive"], rate_limiter=limiter)
+        scheduler.release(held)
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert order == ["interactive", "bulk"]
+
+    def test_context_priority(self):
+        """The lane defaults to the context's priority."""
+        scheduler = RequestScheduler()
+        with priority("interactive"):
+            assert current_priority() == "interactive"
+            lane = scheduler.acquire()
+        scheduler.release(lane)
+        assert lane == "interactive"
+        assert current_priority() is None
+
+    def test_unknown_lane(self):
+        """Unknown lanes are rejected."""
+        with pytest.raises(ValueError):
+            RequestScheduler().acquire("urgent")
+
+    def test_run_bulk_carries_priority(self):
+        """Worker threads see the caller's priority."""
+        with priority("bulk"):
+            results = run_bulk(lambda _: current_priority(), range(3), concurrency=2)
+        assert [r.value for r in results] == ["bulk", "bulk", "bulk"]
+
+
+class TestClientScheduler:
+    """Test the scheduler wired into the client."""
+
+    @responses.activate
+    def test_requests_counted_by_lane(self):
+        """Client requests are admitted through the scheduler in the active lane."""
+        responses.add(
+            responses.GET,
+            "https://app.structurify.ai/api/projects/proj_xxx",
+            json={"project": {"id": "proj_xxx"}},
+            status=200,
+        )
+
+        scheduler = RequestScheduler()
+        client = Structurify(api_key="sk_test", scheduler=scheduler)
+        client.projects.get("proj_xxx")
+        with client.priority("interactive"):
+            client.projects.get("proj_xxx")
+
+        stats = scheduler.stats()
+        assert stats["granted"] == {"interactive": 1, "normal": 1, "bulk": 0}
+        assert stats["in_flight"] == 0
+
+    @responses.activate
+    def test_upload_many_uses_bulk_lane(self, tmp_path):
+        """upload_many defaults to the bulk lane."""
+        responses.add(
+            responses.POST,
+            "https://app.structurify.ai/api/documents",
+            json={"document": {"id": "doc_1"}},
+            status=201,
+        )
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF-1.4\n%%EOF\n")
+
+        scheduler = RequestScheduler()
+        client = Structurify(api_key="sk_test", scheduler=scheduler)
+        results = client.documents.upload_many("proj_xxx", [str(path)])
+
+        assert results[0].ok
+        assert scheduler.stats()["granted"]["bulk"] == 1
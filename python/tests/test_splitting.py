@@ -0,0 +1,220 @@
+"""Tests for splitting long PDFs into parallel chunks."""
+
+import base64
+import io
+import itertools
+import json
+import re
+
+import pytest
+import responses
+from structurify import Structurify
+from structurify.cancellation import CancellationToken, cancellable
+from structurify.exceptions import ValidationError
+from structurify.splitting import PdfSplitter
+
+pypdf = pytest.importorskip("pypdf")
+
+BASE = "https://app.structurify.ai/api"
+DOCUMENTS_URL = f"{BASE}/documents"
+DELETE_URL = re.compile(rf"{BASE}/documents/doc_\d+")
+
+
+def make_pdf(pages):
+    writer = pypdf.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(200, 200)
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
+def page_count(content):
+    return len(pypdf.PdfReader(io.BytesIO(content)).pages)
+
+
+@pytest.fixture
+def api():
+    """Mock documents API that hands out sequential IDs and records uploads."""
+    ids = itertools.count(1)
+    uploads = {}
+
+    def upload(request):
+        body = json.loads(request.body)
+        doc_id = f"doc_{next(ids)}"
+        uploads[doc_id] = (body["fileName"], base64.b64decode(body["content"]))
+        return 200, {}, json.dumps({"document": {"id": doc_id, "status": "uploaded"}})
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add_callback(responses.POST, DOCUMENTS_URL, callback=upload)
+        mock.add(responses.DELETE, DELETE_URL, json={"success": True})
+        mock.uploads = uploads
+        yield mock
+
+
+class TestPdfSplitter:
+    """Test splitting, chunked upload and reassembly."""
+
+    def test_split_into_page_ranges(self):
+        """Chunks cover every page once, in order, with range-suffixed names."""
+        chunks = PdfSplitter(pages_per_chunk=4).split("ledger.pdf", make_pdf(10))
+
+        assert [(c.first_page, c.last_page) for c in chunks] == [(1, 4), (5, 8), (9, 10)]
+        assert [page_count(c.content) for c in chunks] == [4, 4, 2]
+        assert chunks[0].name == "ledger.p01-04.pdf"
+
+    def test_short_and_unreadable_files_stay_whole(self):
+        """Files under the threshold, or not parseable, are returned unchanged."""
+        splitter = PdfSplitter(pages_per_chunk=4)
+        content = make_pdf(4)
+        assert [c.content for c in splitter.split("a.pdf", content)] == [content]
+        assert [c.content for c in splitter.split("b.pdf", b"not a pdf")] == [b"not a pdf"]
+
+    @pytest.mark.parametrize("error", [ValueError, KeyError, pypdf.errors.PdfStreamError])
+    def test_damaged_file_stays_whole(self, monkeypatch, error):
+        """Any of the errors pypdf raises on damaged files falls back to the whole file."""
+        def broken(*args, **kwargs):
+            raise error("damaged")
+
+        content = make_pdf(10)
+        monkeypatch.setattr(pypdf, "PdfWriter", broken)
+        chunks = PdfSplitter(pages_per_chunk=4).split("a.pdf", content)
+        assert [c.content for c in chunks] == [content]
+
+    def test_upload_splits_long_pdf(self, api):
+        """A long PDF becomes chunk documents behind one logical document."""
+        client = Structurify(api_key="sk_test")
+        splitter = PdfSplitter(pages_per_chunk=3)
+
+        doc = client.documents.upload(
+            "proj_1", file_bytes=make_pdf(7), name="ledger.pdf", splitter=splitter
+        )
+
+        assert doc["id"].startswith("split_")
+        assert [(c["firstPage"], c["lastPage"]) for c in doc["chunks"]] == [(1, 3), (4, 6), (7, 7)]
+        assert sorted(page_count(content) for _, content in api.uploads.values()) == [1, 3, 3]
+        assert splitter.documents[doc["id"]].pages == 7
+
+    def test_short_pdf_uploaded_as_is(self, api):
+        """Below the threshold, upload behaves as without a splitter."""
+        client = Structurify(api_key="sk_test")
+        doc = client.documents.upload(
+            "proj_1", file_bytes=make_pdf(2), name="a.pdf", splitter=PdfSplitter()
+        )
+        assert doc["id"] == "doc_1"
+
+    def test_failed_chunk_rolls_back(self):
+        """If a chunk fails, uploaded chunks are deleted and the error raised."""
+        calls = itertools.count()
+
+        def upload(request):
+            if next(calls) == 1:
+                return 400, {}, json.dumps({"error": "bad chunk"})
+            return 200, {}, json.dumps({"document": {"id": "doc_1"}})
+
+        client = Structurify(api_key="sk_test")
+        with responses.RequestsMock() as mock:
+            mock.add_callback(responses.POST, DOCUMENTS_URL, callback=upload)
+            mock.add(responses.DELETE, f"{DOCUMENTS_URL}/doc_1", json={"success": True})
+            splitter = PdfSplitter(pages_per_chunk=2, concurrency=1)
+            with pytest.raises(ValidationError):
+                client.documents.upload(
+                    "proj_1", file_bytes=make_pdf(4), name="a.pdf", splitter=splitter
+                )
+        assert splitter.documents == {}
+
+    def test_rollback_ignores_cancellation(self):
+        """A cancelled upload still deletes the chunks it uploaded."""
+        token = CancellationToken()
+        calls = itertools.count()
+
+        def upload(request):
+            if next(calls) == 1:
+                token.cancel("stop")
+                return 400, {}, json.dumps({"error": "bad chunk"})
+            return 200, {}, json.dumps({"document": {"id": "doc_1"}})
+
+        client = Structurify(api_key="sk_test")
+        with responses.RequestsMock() as mock:
+            mock.add_callback(responses.POST, DOCUMENTS_URL, callback=upload)
+            mock.add(responses.DELETE, f"{DOCUMENTS_URL}/doc_1", json={"success": True})
+            splitter = PdfSplitter(pages_per_chunk=2, concurrency=1)
+            with cancellable(token), pytest.raises(ValidationError):
+                client.documents.upload(
+                    "proj_1", file_bytes=make_pdf(4), name="a.pdf", splitter=splitter
+                )
+            assert [c.request.method for c in mock.calls] == ["POST", "POST", "DELETE"]
+
+    def test_delete_split_document(self, api):
+        """The splitter deletes a logical document's chunks; without it the ID is refused."""
+        client = Structurify(api_key="sk_test")
+        splitter = PdfSplitter(pages_per_chunk=2, concurrency=1)
+        doc = client.documents.upload(
+            "proj_1", file_bytes=make_pdf(4), name="a.pdf", splitter=splitter
+        )
+
+        for call in (client.documents.get, client.documents.download, client.documents.delete):
+            with pytest.raises(ValueError):
+                call(doc["id"])
+        results = client.documents.delete_many([doc["id"]], splitter=splitter)
+
+        assert results[0].ok
+        assert sorted(c.request.url.rsplit("/", 1)[1] for c in api.calls
+                      if c.request.method == "DELETE") == ["doc_1", "doc_2"]
+        assert splitter.documents == {}
+
+    def test_index_file_survives_restart(self, api, tmp_path):
+        """The parent → chunk mapping is reloaded from the index file."""
+        client = Structurify(api_key="sk_test")
+        index = str(tmp_path / "splits.json")
+        splitter = PdfSplitter(2, concurrency=1, index_path=index)
+        doc = client.documents.upload(
+            "proj_1", file_bytes=make_pdf(5), name="a.pdf", splitter=splitter
+        )
+
+        reloaded = PdfSplitter(2, index_path=index)
+
+        assert reloaded.expand([doc["id"], "doc_9"]) == ["doc_1", "doc_2", "doc_3", "doc_9"]
+
+    def test_export_reassembles_chunks(self, api):
+        """Chunk records merge into one record in page order; others pass through."""
+        client = Structurify(api_key="sk_test")
+        splitter = PdfSplitter(pages_per_chunk=2, concurrency=1)
+        doc = client.documents.upload(
+            "proj_1", file_bytes=make_pdf(4), name="ledger.pdf", splitter=splitter
+        )
+        exported = [
+            {"documentId": "doc_9", "name": "other.pdf", "Total": 5},
+            {"documentId": "doc_2", "name": "ledger.p3-4.pdf", "Vendor": "", "Lines": [3, 4],
+             "Total": 99},
+            {"documentId": "doc_1", "name": "ledger.p1-2.pdf", "Vendor": "ACME", "Lines": [1, 2],
+             "Total": None},
+        ]
+        api.add(responses.POST, f"{BASE}/exports", json={"data": json.dumps(exported)})
+
+        records = client.exports.records("proj_1", document_ids=[doc["id"]], splitter=splitter)
+
+        assert json.loads(api.calls[-1].request.body)["documentIds"] == ["doc_1", "doc_2"]
+        assert records == [
+            {"documentId": "doc_9", "name": "other.pdf", "Total": 5},
+            {"documentId": doc["id"], "name": "ledger.pdf", "Vendor": "ACME",
+             "Lines": [1, 2, 3, 4], "Total": 99, "_chunks": ["doc_1", "doc_2"]},
+        ]
+
+    def test_extracted_name_column_is_kept(self, api):
+        """A template's own "name" value survives the merge; chunk file names do not."""
+        client = Structurify(api_key="sk_test")
+        splitter = PdfSplitter(pages_per_chunk=2, concurrency=1)
+        doc = client.documents.upload(
+            "proj_1", file_bytes=make_pdf(4), name="ledger.pdf", splitter=splitter
+        )
+
+        records = splitter.reassemble([
+            {"documentId": "doc_1", "name": "", "chunks": 2},
+            {"documentId": "doc_2", "name": "Jane Doe"},
+        ])
+
+        assert records == [
+            {"documentId": doc["id"], "name": "Jane Doe", "chunks": 2,
+             "_chunks": ["doc_1", "doc_2"]},
+        ]